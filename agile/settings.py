@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -27,6 +29,8 @@ DEBUG = True
 
 ALLOWED_HOSTS = []
 
+TESTING = 'test' in sys.argv
+
 AUTH_USER_MODEL = 'users.User'
 
 # Application definition
@@ -41,11 +45,16 @@ INSTALLED_APPS = [
     'apps.tasks.apps.TasksConfig',
     'apps.projects.apps.ProjectsConfig',
     'apps.users.apps.UsersConfig',
+    'apps.core.apps.CoreConfig',
     'rest_framework',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'apps.core.middleware.server_timing.ServerTimingMiddleware',
+    'apps.core.middleware.metrics.MetricsMiddleware',
+    'apps.core.middleware.db_routing.PrimaryPinningMiddleware',
+    'apps.core.middleware.query_budget.QueryBudgetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -85,6 +94,53 @@ DATABASES = {
     }
 }
 
+# DJANGO_DB_PROFILE=production runs SQLite in WAL mode with persistent connections
+# and sends reads to a replica copied by ``manage.py refresh_replica --interval N``
+DB_PROFILE = os.environ.get('DJANGO_DB_PROFILE', 'development')
+
+# Applied to every new connection by the sqlite3 backend
+SQLITE_PRODUCTION_OPTIONS = {
+    'init_command': (
+        # Readers don't block the writer and the other way round
+        'PRAGMA journal_mode=WAL;'
+        # Durable on application crashes, only a power loss may drop the last commits
+        'PRAGMA synchronous=NORMAL;'
+        'PRAGMA busy_timeout=5000;'
+        'PRAGMA mmap_size=268435456;'
+        'PRAGMA temp_store=MEMORY;'
+    ),
+    # Writers take the lock at BEGIN and wait on busy_timeout instead of failing on upgrade
+    'transaction_mode': 'IMMEDIATE',
+}
+
+if DB_PROFILE == 'production':
+    DATABASES = {
+        'default': {
+            **DATABASES['default'],
+            'OPTIONS': SQLITE_PRODUCTION_OPTIONS,
+            'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': True,
+        },
+        'replica': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'var' / 'replica.sqlite3',
+            'OPTIONS': {
+                'init_command': SQLITE_PRODUCTION_OPTIONS['init_command'] + 'PRAGMA query_only=ON;',
+            },
+            'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': True,
+            'TEST': {'MIRROR': 'default'},
+        },
+    }
+
+DATABASE_ROUTERS = ['apps.core.db_router.PrimaryReplicaRouter']
+
+DATABASE_ROUTING = {
+    'PRIMARY': 'default',
+    # Reads go to the primary while this alias isn't in DATABASES
+    'REPLICA': 'replica',
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -126,3 +182,112 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Per-request SQL query budgets, see apps/core/middleware/query_budget.py
+
+QUERY_BUDGET = {
+    'ENABLED': True,
+    # Raise instead of logging a warning when a view goes over its budget
+    'RAISE': TESTING,
+    # Budget for views that don't declare ``query_budget``, None = unlimited
+    'DEFAULT': None,
+    # Samples kept per route for the rolling summary
+    'WINDOW': 500,
+    'REPORT_DIR': None if TESTING else BASE_DIR / 'var' / 'query_budget',
+    # Seconds between dumps of the per-process summary
+    'FLUSH_INTERVAL': 30,
+}
+
+# Server-Timing header and staff-only cProfile dumps of API requests,
+# see apps/core/middleware/server_timing.py
+
+SERVER_TIMING = {
+    'ENABLED': True,
+    'PATH_PREFIXES': ['/api/'],
+    # Staff sending ``X-Profile: 1`` or ``?_profile`` get a cProfile dump of the request
+    'PROFILE_HEADER': 'X-Profile',
+    'PROFILE_PARAM': '_profile',
+    # None turns the captures off; read the dumps with ``python -m pstats``
+    'PROFILE_DIR': None if TESTING else BASE_DIR / 'var' / 'profiles',
+    # At most PROFILE_LIMIT captures per process and PROFILE_WINDOW seconds, one at a time
+    'PROFILE_LIMIT': 5,
+    'PROFILE_WINDOW': 60,
+    # Only the newest dumps are kept
+    'PROFILE_KEEP': 50,
+}
+
+# Per-route request metrics, served in the Prometheus text format on /metrics,
+# see apps/core/middleware/metrics.py
+
+METRICS = {
+    'ENABLED': True,
+    # Every worker dumps its counters here and /metrics adds them up;
+    # None = /metrics only knows the process answering it
+    'DIR': None if TESTING else BASE_DIR / 'var' / 'metrics',
+    # Seconds between dumps of the per-process counters
+    'FLUSH_INTERVAL': 10,
+    # Scrapers send ``Authorization: Bearer <TOKEN>``, everyone else gets a 404;
+    # without a token /metrics is off. Behind the proxy every client connects
+    # from a local address, so that can't decide it.
+    'TOKEN': os.environ.get('DJANGO_METRICS_TOKEN'),
+}
+
+# Any Django cache backend works for the response cache, e.g.
+#   'django.core.cache.backends.filebased.FileBasedCache' with 'LOCATION': BASE_DIR / 'var' / 'cache'
+#   'django.core.cache.backends.db.DatabaseCache' with 'LOCATION': 'response_cache'
+#     (run ``manage.py createcachetable`` first)
+# The local-memory cache is per process: with several workers use one of the shared ones.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'responses': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'responses',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
+if DB_PROFILE == 'production':
+    # The workers must share the model versions the response cache is
+    # invalidated with: a bump in a LocMem cache only reaches its own process
+    CACHES['responses'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'var' / 'cache' / 'responses',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    }
+
+UPLOAD_SESSIONS = {
+    # Temporary files of the chunked uploads in progress
+    'DIR': BASE_DIR / 'var' / 'uploads',
+    # Used when the client doesn't ask for a chunk size
+    'CHUNK_SIZE': 5 * 1024 * 1024,
+    'MAX_CHUNK_SIZE': 32 * 1024 * 1024,
+    'MAX_FILE_SIZE': 2 * 1024 * 1024 * 1024,
+    # Open sessions untouched for longer are removed by ``manage.py purge_upload_sessions``
+    'EXPIRE_HOURS': 24,
+}
+
+FILE_PROCESSING = {
+    # Threads extracting the metadata of new project files after the upload
+    'WORKERS': 2,
+    'EAGER': TESTING,
+}
+
+FILE_DOWNLOADS = {
+    # 'x-accel-redirect' (nginx) or 'x-sendfile' (Apache, lighttpd) lets the proxy send
+    # the bytes; nginx needs an ``internal`` location serving MEDIA_ROOT under ACCEL_PREFIX
+    'SENDFILE': None,
+    'ACCEL_PREFIX': '/protected/',
+}
+
+RESPONSE_CACHE = {
+    'ENABLED': not TESTING,
+    'ALIAS': 'responses',
+    # Seconds a cached response lives; invalidation doesn't depend on it
+    'TIMEOUT': 300,
+    'KEY_PREFIX': 'rc',
+    # Writes to these models bump their version and invalidate the cached responses built from them
+    'MODELS': ['tasks.Tag', 'tasks.Task', 'projects.Project', 'projects.ProjectFile', 'users.User'],
+}
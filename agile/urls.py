@@ -17,10 +17,12 @@ Including another URLconf
 from django.contrib import admin
 from django.http import HttpResponse
 from django.urls import path, include
+from apps.core.views import metrics
 
 
 urlpatterns = [
     path('', lambda req: HttpResponse("Welcome to my site!")),
     path('admin/', admin.site.urls),
     path('api/v1/', include('apps.routers')),
+    path('metrics', metrics, name='metrics'),
 ]
@@ -0,0 +1,13 @@
+from django.urls import path
+from apps.projects.views.async_views import AsyncProjectDetailView, AsyncProjectsListView
+from apps.tasks.views.async_views import AsyncTagListView, AsyncTaskDetailView, AsyncTasksListView
+
+# Async versions of the read-heavy endpoints, for ASGI deployments.
+# Same paths and responses as their sync counterparts under /api/v1/.
+urlpatterns = [
+    path('tasks/', AsyncTasksListView.as_view(), name='async-task-list'),
+    path('tasks/<int:pk>/', AsyncTaskDetailView.as_view(), name='async-task-detail'),
+    path('tasks/tags/', AsyncTagListView.as_view(), name='async-tag-list'),
+    path('projects/', AsyncProjectsListView.as_view(), name='async-project-list'),
+    path('projects/<int:pk>/', AsyncProjectDetailView.as_view(), name='async-project-detail'),
+]
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.core'
+
+    def ready(self):
+        from apps.core.middleware.server_timing import install_phase_timing
+        from apps.core.receivers import connect_query_tracking, connect_response_cache
+        connect_response_cache()
+        connect_query_tracking()
+        install_phase_timing()
@@ -0,0 +1,60 @@
+from django.db.models import QuerySet
+from django.http import Http404, HttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+async def aget_object_or_404(queryset: QuerySet, **lookup):
+    try:
+        return await queryset.aget(**lookup)
+    except queryset.model.DoesNotExist:
+        raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+
+
+class AsyncAPIView(View):
+    """
+    Read-only async counterpart of ``APIView`` for ASGI deployments.
+
+    DRF views are sync, so under ASGI every request hops to a thread. These
+    run on the event loop and only leave it for the queries themselves
+    (``aget``, ``acount``, ``async for``). The request is wrapped in a DRF
+    ``Request`` so the filter serializers and paginators work unchanged,
+    and the returned ``Response`` is rendered by DRF's ``JSONRenderer``:
+    the body is byte for byte what the sync view sends.
+    """
+    http_method_names = ['get', 'head', 'options']
+    renderer = JSONRenderer()
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.request = request = Request(request)
+        method = request.method.lower()
+
+        if method not in self.http_method_names or not hasattr(self, method):
+            response = Response(
+                {'detail': f'Method "{request.method}" not allowed.'},
+                status=status.HTTP_405_METHOD_NOT_ALLOWED,
+            )
+            return self.finalize_response(response)
+
+        try:
+            response = await getattr(self, method)(request, *args, **kwargs)
+        except APIException as exc:
+            detail = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+            response = Response(detail, status=exc.status_code)
+        except Http404 as exc:
+            response = Response({'detail': str(exc) or 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        return self.finalize_response(response)
+
+    def finalize_response(self, response: HttpResponse) -> HttpResponse:
+        if isinstance(response, Response):
+            response.accepted_renderer = self.renderer
+            response.accepted_media_type = self.renderer.media_type
+            response.renderer_context = {'view': self, 'request': self.request}
+            response.render()
+
+        return response
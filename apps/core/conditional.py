@@ -0,0 +1,84 @@
+from datetime import datetime
+from django.db.models import QuerySet
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils import timezone
+from django.utils.http import http_date
+
+
+def make_etag(*versions: datetime) -> str:
+    """Strong ETag from the ``updated_at`` values the representation depends on."""
+    return '"{}"'.format('.'.join(str(int(version.timestamp() * 1_000_000)) for version in versions))
+
+
+class ConditionalRequestMixin:
+    """
+    ETag / Last-Modified support for detail views.
+
+    ``get_validators()`` returns ``(etag, last_modified)`` from a single
+    indexed lookup and raises ``Http404`` when the object doesn't exist, so
+    a matching ``If-None-Match``/``If-Modified-Since`` is answered with a
+    304 before the object is loaded and serialized. On writes a stale
+    ``If-Match`` gets a 412. ``get_validators()`` also stores the object's
+    own ``updated_at`` in ``self.updated_at`` for ``claim_version()``.
+
+    Views override the method of the path they serve; the defaults return
+    ``None`` (no validators), and such requests are served unconditionally.
+    """
+    updated_at = None
+    validators = None
+
+    def get_validators(self) -> tuple[str, datetime] | None:
+        return None
+
+    async def aget_validators(self) -> tuple[str, datetime] | None:
+        return None
+
+    def evaluate_preconditions(self, request) -> HttpResponse | None:
+        return self.conditional_response(request, self.get_validators())
+
+    async def aevaluate_preconditions(self, request) -> HttpResponse | None:
+        """``evaluate_preconditions()`` for async views, see ``aget_validators()``."""
+        return self.conditional_response(request, await self.aget_validators())
+
+    def conditional_response(self, request, validators) -> HttpResponse | None:
+        if validators is None:
+            return None
+
+        self.validators = validators
+        etag, last_modified = validators
+
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()),
+        )
+
+        if response is not None:
+            self.set_validators(response, validators)
+
+        return response
+
+    @staticmethod
+    def set_validators(response, validators: tuple[str, datetime] | None):
+        if validators is None:
+            return response
+
+        etag, last_modified = validators
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
+
+    def claim_version(self, request, queryset: QuerySet) -> bool:
+        """
+        Compare-and-set on ``updated_at`` for writes sent with ``If-Match``.
+
+        Checking the header alone leaves a window for a concurrent write
+        between the check and the save; this UPDATE takes the write lock and
+        matches no row if someone else got there first. Must run in the
+        same transaction as the save.
+        """
+        if 'HTTP_IF_MATCH' not in request.META:
+            return True
+
+        return bool(queryset.filter(updated_at=self.updated_at).update(updated_at=timezone.now()))
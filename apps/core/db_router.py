@@ -0,0 +1,97 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import connections
+
+DEFAULT_DATABASE_ROUTING = {
+    'PRIMARY': 'default',
+    'REPLICA': 'replica',
+}
+
+# Set by the first write of a request; reads then stay on the primary
+pinned_to_primary = ContextVar('pinned_to_primary', default=False)
+
+
+def get_database_routing_settings() -> dict:
+    return {**DEFAULT_DATABASE_ROUTING, **getattr(settings, 'DATABASE_ROUTING', {})}
+
+
+def pin_to_primary() -> None:
+    pinned_to_primary.set(True)
+
+
+def is_pinned() -> bool:
+    return pinned_to_primary.get()
+
+
+@contextmanager
+def primary_pinning():
+    """Scope of one request: starts unpinned, forgets the pin on the way out."""
+    token = pinned_to_primary.set(False)
+    try:
+        yield
+    finally:
+        pinned_to_primary.reset(token)
+
+
+@contextmanager
+def reading_from_primary():
+    """
+    Sends the reads of the block to the primary, for results that outlive
+    the request: a replica copy lagging behind a committed write must not end
+    up in a cache entry keyed by the versions that write bumped.
+    """
+    token = pinned_to_primary.set(True)
+    try:
+        yield
+    finally:
+        pinned_to_primary.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends reads to the ``REPLICA`` alias (a copy of the primary refreshed by
+    ``manage.py refresh_replica``) and writes to ``PRIMARY``.
+
+    The first write pins the rest of the request to the primary, so a request
+    always reads its own writes. Reads inside a transaction on the primary stay
+    there as well. Without a replica in ``DATABASES`` the router has no opinion
+    and Django routes everything as usual.
+    """
+
+    def __init__(self):
+        config = get_database_routing_settings()
+        self.primary = config['PRIMARY']
+        self.replica = config['REPLICA']
+
+    def replica_available(self) -> bool:
+        return bool(self.replica) and self.replica in settings.DATABASES
+
+    def db_for_read(self, model, **hints):
+        if not self.replica_available():
+            return None
+
+        if is_pinned() or connections[self.primary].in_atomic_block:
+            return self.primary
+
+        return self.replica
+
+    def db_for_write(self, model, **hints):
+        if not self.replica_available():
+            return None
+
+        pin_to_primary()
+        return self.primary
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same rows
+        databases = {self.primary, self.replica}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica gets the schema together with the data when it's copied
+        if db == self.replica:
+            return False
+        return None
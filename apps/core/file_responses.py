@@ -0,0 +1,151 @@
+import os
+import re
+from datetime import datetime
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.http import content_disposition_header, parse_http_date_safe
+
+DEFAULT_FILE_DOWNLOADS = {
+    # None streams from Python; 'x-sendfile' (Apache, lighttpd) or
+    # 'x-accel-redirect' (nginx) hand the transfer over to the proxy
+    'SENDFILE': None,
+    # nginx ``internal`` location MEDIA_ROOT is served under
+    'ACCEL_PREFIX': '/protected/',
+    'BLOCK_SIZE': 64 * 1024,
+}
+
+SENDFILE_MODES = (None, 'x-sendfile', 'x-accel-redirect')
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def get_file_download_settings() -> dict:
+    return {**DEFAULT_FILE_DOWNLOADS, **getattr(settings, 'FILE_DOWNLOADS', {})}
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Returns the (start, end) byte positions, end included, asked for by a
+    single-range ``Range`` header, or ``None`` to send the whole file.
+
+    Multiple ranges and malformed headers are ignored, which RFC 9110
+    allows; a well-formed range outside the file raises ``RangeNotSatisfiable``.
+    """
+    match = RANGE_RE.match(header.replace(' ', ''))
+
+    if match is None or match.groups() == ('', ''):
+        return None
+
+    first, last = match.groups()
+
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if not length or not size:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+
+    if last and int(last) < start:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiable
+
+    return start, end
+
+
+def if_range_matches(header: str, etag: str, last_modified: datetime) -> bool:
+    """``If-Range`` keeps the ``Range`` only while the file is still the one it names."""
+    if header.startswith('"') or header.startswith('W/'):
+        # Strong comparison: a weak tag never matches
+        return header == etag
+
+    since = parse_http_date_safe(header)
+    return since is not None and since >= int(last_modified.timestamp())
+
+
+def iter_file_range(path, start: int, length: int, block_size: int):
+    with open(path, 'rb') as stream:
+        stream.seek(start)
+
+        while length > 0:
+            block = stream.read(min(block_size, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+
+
+def sendfile_response(path, storage_name: str, mode: str) -> HttpResponse:
+    """
+    Empty response telling the proxy which file to send. The proxy deals
+    with ``Range`` itself, so the headers are passed through untouched.
+    """
+    response = HttpResponse(content_type='application/octet-stream')
+
+    if mode == 'x-accel-redirect':
+        prefix = get_file_download_settings()['ACCEL_PREFIX'].rstrip('/')
+        response['X-Accel-Redirect'] = f'{prefix}/{storage_name}'
+    else:
+        response['X-Sendfile'] = os.fspath(path)
+
+    return response
+
+
+def file_download_response(
+    request,
+    path,
+    storage_name: str,
+    file_name: str,
+    etag: str,
+    last_modified: datetime,
+) -> HttpResponse:
+    """
+    Whole-file, partial (206) or proxy-offloaded download of ``path``.
+
+    Preconditions (``If-None-Match`` etc.) must already be evaluated; this
+    only deals with ``Range``/``If-Range``.
+    """
+    config = get_file_download_settings()
+
+    if config['SENDFILE']:
+        response = sendfile_response(path, storage_name, config['SENDFILE'])
+    else:
+        size = os.path.getsize(path)
+        byte_range = None
+
+        if 'HTTP_RANGE' in request.META and if_range_matches(
+            request.META.get('HTTP_IF_RANGE', etag), etag, last_modified
+        ):
+            try:
+                byte_range = parse_range(request.META['HTTP_RANGE'], size)
+            except RangeNotSatisfiable:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = f'bytes */{size}'
+                return response
+
+        if byte_range is None:
+            # Lets the WSGI server use its file wrapper (sendfile) for the body
+            response = FileResponse(open(path, 'rb'), content_type='application/octet-stream')
+        else:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                iter_file_range(path, start, end - start + 1, config['BLOCK_SIZE']),
+                status=206,
+                content_type='application/octet-stream',
+            )
+            response['Content-Length'] = end - start + 1
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+        response['Accept-Ranges'] = 'bytes'
+
+    response['Content-Disposition'] = content_disposition_header(as_attachment=True, filename=file_name)
+
+    return response
@@ -0,0 +1,147 @@
+import json
+import tempfile
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from apps.core.utils.bench import (
+    DEFAULT_DATASET, calibrate, compare_results, compare_timings, environment, run_benchmarks, seed_dataset,
+    timing_regressions,
+)
+
+DEFAULT_BASELINE = settings.BASE_DIR / 'benchmarks' / 'baseline.json'
+DEFAULT_OUTPUT = settings.BASE_DIR / 'var' / 'bench' / 'latest.json'
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every route of apps/routers.py in-process against a seeded throwaway database, "
+        "write the results as JSON and fail when a route runs more queries, answers other status codes "
+        "or got slower than in the committed baseline. Slow routes are measured again before they fail."
+    )
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_DATASET.items():
+            parser.add_argument(f'--{name}', type=int, default=default, help=f"Seeded {name} (default {default}).")
+        parser.add_argument('--seed', type=int, default=0, help="Random seed of the dataset.")
+        parser.add_argument('--requests', type=int, default=30, help="Timed requests per route and round.")
+        parser.add_argument('--warmup', type=int, default=5, help="Untimed requests per route first.")
+        parser.add_argument('--rounds', type=int, default=3, help="Rounds over all routes, the fastest one counts.")
+        parser.add_argument('--alloc-samples', type=int, default=3, help="Requests per route run under tracemalloc.")
+        parser.add_argument('--routes', nargs='*', help="Only these route names.")
+        parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT, help="Where to write the results.")
+        parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help="Results to compare against.")
+        parser.add_argument('--threshold', type=float, default=0.5,
+                            help="Allowed relative growth of latency and allocations, 0.5 = 50%%.")
+        parser.add_argument('--no-gate-timing', action='store_true',
+                            help="Only report latency and allocation growth, for noisy shared machines.")
+        parser.add_argument('--update-baseline', action='store_true', help="Store the results as the new baseline.")
+        parser.add_argument('--no-compare', action='store_true', help="Only measure.")
+
+    def handle(self, *args, **options):
+        dataset = {name: options[name] for name in DEFAULT_DATASET}
+        baseline = None if options['update_baseline'] or options['no_compare'] else self.load_baseline(options)
+        gate_timing = baseline is not None and not options['no_gate_timing']
+
+        with tempfile.TemporaryDirectory() as media, override_settings(
+            DEBUG=False,
+            ALLOWED_HOSTS=['testserver'],
+            MEDIA_ROOT=media,
+            UPLOAD_SESSIONS={**settings.UPLOAD_SESSIONS, 'DIR': Path(media) / 'uploads'},
+            FILE_PROCESSING={**settings.FILE_PROCESSING, 'EAGER': True},
+            # A cached response would hide what the view costs
+            RESPONSE_CACHE={**settings.RESPONSE_CACHE, 'ENABLED': False},
+            QUERY_BUDGET={**settings.QUERY_BUDGET, 'RAISE': False, 'REPORT_DIR': None},
+            # Benchmark requests stay out of the metrics of the running workers
+            METRICS={**settings.METRICS, 'DIR': None},
+        ):
+            # Test databases: seeded from scratch, gone afterwards
+            old_config = setup_databases(verbosity=0, interactive=False)
+            try:
+                self.stdout.write(f"Seeding {', '.join(f'{amount} {name}' for name, amount in dataset.items())}...")
+                data = seed_dataset(**dataset, seed=options['seed'])
+                calibration_ms = calibrate()
+
+                def recheck(measured: dict) -> set:
+                    measured = {**measured, 'calibration_ms': calibration_ms}
+                    return {name for name, _ in timing_regressions(measured, baseline, options['threshold'])}
+
+                results = run_benchmarks(
+                    data,
+                    routes=options['routes'],
+                    requests=options['requests'],
+                    warmup=options['warmup'],
+                    alloc_samples=options['alloc_samples'],
+                    rounds=options['rounds'],
+                    recheck=recheck if gate_timing else None,
+                )
+            finally:
+                teardown_databases(old_config, verbosity=0)
+
+        results = {
+            'dataset': {**dataset, 'seed': options['seed']},
+            'environment': environment(),
+            'calibration_ms': calibration_ms,
+            **results,
+        }
+        self.print_results(results)
+        self.write(options['output'], results)
+
+        if options['update_baseline']:
+            self.write(options['baseline'], results)
+            return
+
+        if baseline is None:
+            return
+
+        regressions = compare_results(results, baseline, options['threshold'], timing=gate_timing)
+
+        if not gate_timing:
+            for message in compare_timings(results, baseline, options['threshold']):
+                self.stdout.write(self.style.WARNING(f"Slower than the baseline (not gated): {message}"))
+
+        if regressions:
+            raise CommandError("Regressions against the baseline:\n  " + "\n  ".join(regressions))
+
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {options['baseline']}."))
+
+    def load_baseline(self, options) -> dict | None:
+        """The baseline to compare with, checked before the run."""
+        if not options['baseline'].exists():
+            self.stdout.write(self.style.WARNING(
+                f"No baseline at {options['baseline']}, run with --update-baseline to create one."
+            ))
+            return None
+
+        baseline = json.loads(options['baseline'].read_text())
+        dataset = {**{name: options[name] for name in DEFAULT_DATASET}, 'seed': options['seed']}
+        if baseline.get('dataset') != dataset:
+            raise CommandError(
+                f"The baseline was measured on {baseline.get('dataset')}, not on {dataset}; "
+                f"use the same dataset options or --update-baseline."
+            )
+
+        return baseline
+
+    def write(self, path: Path, results: dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(results, indent=2) + '\n')
+        self.stdout.write(f"Results written to {path}")
+
+    def print_results(self, results: dict) -> None:
+        header = (
+            f"{'route':<24} {'method':<6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'queries':>7} {'peak KiB':>9} {'status':<12}"
+        )
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+
+        for name, row in results['routes'].items():
+            statuses = ','.join(row['status'])
+            self.stdout.write(
+                f"{name:<24} {row['method']:<6} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+                f"{row['queries']:>7} {row['alloc_peak_kib']:>9.0f} {statuses:<12}"
+            )
+
+        for name, reason in results['skipped'].items():
+            self.stdout.write(self.style.WARNING(f"{name:<24} skipped: {reason}"))
@@ -0,0 +1,166 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from apps.core.utils.stats import percentile
+
+# (sync route, async route, needs a pk of)
+ROUTES = [
+    ('task-list', 'async-task-list', None),
+    ('task-detail', 'async-task-detail', 'tasks.Task'),
+    ('project-list', 'async-project-list', None),
+    ('project-detail', 'async-project-detail', 'projects.Project'),
+    ('tag-list', 'async-tag-list', None),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the concurrent throughput of the sync and async read endpoints under ASGI "
+        "with many slow clients. Drives agile.asgi in-process, or a running server with --url, e.g. "
+        "`uvicorn agile.asgi:application` + `manage.py bench_async --url http://127.0.0.1:8000`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', help="Base URL of a running ASGI server instead of the in-process app.")
+        parser.add_argument('--clients', type=int, default=100, help="Concurrent clients.")
+        parser.add_argument('--requests', type=int, default=10, help="Requests per client and endpoint.")
+        parser.add_argument('--client-delay', type=float, default=0.02,
+                            help="Seconds a slow client waits before reading each part of the response.")
+        parser.add_argument('--routes', nargs='*', help="Only these sync route names.")
+
+    def handle(self, *args, **options):
+        from django.apps import apps
+
+        routes = [route for route in ROUTES if not options['routes'] or route[0] in options['routes']]
+        paths = []
+
+        for sync_name, async_name, model in routes:
+            kwargs = {}
+            if model:
+                pk = apps.get_model(model).objects.order_by('pk').values_list('pk', flat=True).first()
+                if pk is None:
+                    self.stdout.write(self.style.WARNING(f"Skipping {sync_name}: no {model} rows."))
+                    continue
+                kwargs = {'pk': pk}
+            paths.append((sync_name, reverse(sync_name, kwargs=kwargs), reverse(async_name, kwargs=kwargs)))
+
+        if not paths:
+            raise CommandError("Nothing to benchmark.")
+
+        client = RemoteClient(options['url']) if options['url'] else InProcessClient()
+
+        header = f"{'route':<16} {'mode':<6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+
+        for name, sync_path, async_path in paths:
+            for mode, path in (('sync', sync_path), ('async', async_path)):
+                result = asyncio.run(run_load(client, path, options['clients'], options['requests'], options['client_delay']))
+                self.stdout.write(
+                    f"{name:<16} {mode:<6} {result['rps']:>9.1f} {result['p50']:>9.1f} "
+                    f"{result['p95']:>9.1f} {result['p99']:>9.1f} {result['errors']:>7}"
+                )
+
+
+async def run_load(client, path: str, clients: int, requests: int, delay: float) -> dict:
+    latencies = []
+    errors = 0
+
+    async def one_client():
+        nonlocal errors
+        for _ in range(requests):
+            started = time.perf_counter()
+            status_code = await client.get(path, delay)
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += status_code >= 500
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_client() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        'rps': len(latencies) / elapsed if elapsed else 0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'errors': errors,
+    }
+
+
+class InProcessClient:
+    """Calls the ASGI application directly; a slow client takes its time with every ``send``."""
+
+    def __init__(self):
+        self.application = get_asgi_application()
+
+    async def get(self, path: str, delay: float) -> int:
+        path, _, query = path.partition('?')
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': query.encode(),
+            'root_path': '',
+            'headers': [(b'host', b'localhost')],
+            'client': ('127.0.0.1', 0),
+            'server': ('localhost', 80),
+        }
+        status_code = 0
+        body_sent = False
+        finished = asyncio.Event()
+
+        async def receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            # Django listens for the client going away until the response is done
+            await finished.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await asyncio.sleep(delay)
+            if message['type'] == 'http.response.body' and not message.get('more_body'):
+                finished.set()
+
+        await self.application(scope, receive, send)
+        return status_code
+
+
+class RemoteClient:
+    """Minimal HTTP/1.1 client reading the response slowly, in small pieces."""
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip('/')
+
+    async def get(self, path: str, delay: float) -> int:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(
+                f"GET {self.prefix}{path} HTTP/1.1\r\nHost: {self.host}\r\nConnection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+
+            status_line = await reader.readline()
+            while await reader.read(4096):
+                await asyncio.sleep(delay)
+        finally:
+            writer.close()
+
+        try:
+            return int(status_line.split()[1])
+        except (IndexError, ValueError):
+            return 599
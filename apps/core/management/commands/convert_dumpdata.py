@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.core.utils.ndjson_dump import DumpError, convert_dumpdata
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert `dumpdata` JSON such as db_backup.json (UTF-8 or UTF-16) into a dump for `manage.py load`, "
+        "e.g. `manage.py convert_dumpdata db_backup.json var/dump && manage.py load var/dump`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('source', help="The dumpdata JSON file.")
+        parser.add_argument('directory', help="Directory to write the dump to.")
+        parser.add_argument('--compress', action='store_true', help="Gzip the model files.")
+
+    def handle(self, *args, **options):
+        try:
+            entries = convert_dumpdata(
+                options['source'],
+                options['directory'],
+                compress=options['compress'],
+                progress=lambda label, rows: self.stdout.write(f"{label}: {rows} rows"),
+            )
+        except (DumpError, ValueError) as error:
+            raise CommandError(f"Couldn't convert {options['source']}: {error}")
+
+        total = sum(entry['rows'] for entry in entries)
+        self.stdout.write(self.style.SUCCESS(f"Converted {total} rows into {options['directory']}."))
@@ -0,0 +1,43 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+from apps.core.utils.ndjson_dump import LOAD_BATCH_SIZE, DumpError, load
+
+
+class Command(BaseCommand):
+    help = (
+        "Restore a dump written by `manage.py dump` (or `convert_dumpdata`) with batched inserts "
+        "in one transaction, then rebuild the task summaries and project counters."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory', help="Directory of the dump.")
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+        parser.add_argument('--batch-size', type=int, default=LOAD_BATCH_SIZE, help="Rows per insert batch.")
+        parser.add_argument('--replace', action='store_true', help="Delete the current rows of the dumped apps first.")
+        parser.add_argument('--no-rebuild', action='store_true', help="Skip rebuilding the aggregates.")
+
+    def handle(self, *args, **options):
+        from apps.projects.utils.project_counters import reconcile_counters
+        from apps.tasks.utils.task_summary import rebuild_summaries
+
+        started = time.monotonic()
+        try:
+            loaded = load(
+                options['directory'],
+                using=options['database'],
+                batch_size=options['batch_size'],
+                replace=options['replace'],
+                progress=lambda label, rows: self.stdout.write(f"{label}: {rows} rows"),
+            )
+        except DumpError as error:
+            raise CommandError(error)
+
+        # The rows went in without signals, so nothing kept the aggregates up
+        if not options['no_rebuild']:
+            rebuild_summaries(using=options['database'])
+            reconcile_counters(using=options['database'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Loaded {sum(loaded.values())} rows of {len(loaded)} models in {time.monotonic() - started:.1f}s."
+        ))
@@ -0,0 +1,58 @@
+import json
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from apps.core.middleware.query_budget import (
+    REPORT_FILE_PATTERN, get_query_budget_settings, load_reports,
+)
+from apps.core.utils.stats import percentile
+
+
+class Command(BaseCommand):
+    help = "Show the rolling per-route query counts and SQL time collected by QueryBudgetMiddleware."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', help="Report directory, QUERY_BUDGET['REPORT_DIR'] by default.")
+        parser.add_argument('--json', action='store_true', help="Print the summary as JSON.")
+        parser.add_argument('--reset', action='store_true', help="Delete the collected reports afterwards.")
+
+    def handle(self, *args, **options):
+        report_dir = options['dir'] or get_query_budget_settings()['REPORT_DIR']
+
+        if not report_dir:
+            raise CommandError("QUERY_BUDGET['REPORT_DIR'] is not configured.")
+
+        summary = {}
+        for route, data in sorted(load_reports(report_dir).items()):
+            queries = [sample[0] for sample in data['samples']]
+            durations = [sample[1] for sample in data['samples']]
+            summary[route] = {
+                'requests': data['requests'],
+                'over_budget': data['over_budget'],
+                'budget': data['budget'],
+                'queries_avg': round(sum(queries) / len(queries), 2) if queries else 0,
+                'queries_p95': percentile(queries, 95),
+                'queries_max': max(queries, default=0),
+                'sql_ms_avg': round(sum(durations) / len(durations), 3) if durations else 0,
+                'sql_ms_p95': percentile(durations, 95),
+            }
+
+        if options['json']:
+            self.stdout.write(json.dumps(summary, indent=2))
+        elif not summary:
+            self.stdout.write("No requests recorded yet.")
+        else:
+            header = f"{'route':<40} {'reqs':>7} {'over':>5} {'budget':>6} {'q avg':>6} {'q p95':>6} {'q max':>6} {'ms avg':>8} {'ms p95':>8}"
+            self.stdout.write(header)
+            self.stdout.write('-' * len(header))
+            for route, row in summary.items():
+                budget = '-' if row['budget'] is None else row['budget']
+                line = (
+                    f"{route:<40} {row['requests']:>7} {row['over_budget']:>5} {budget:>6} "
+                    f"{row['queries_avg']:>6} {row['queries_p95']:>6} {row['queries_max']:>6} "
+                    f"{row['sql_ms_avg']:>8} {row['sql_ms_p95']:>8}"
+                )
+                self.stdout.write(self.style.WARNING(line) if row['over_budget'] else line)
+
+        if options['reset']:
+            for path in Path(report_dir).glob(REPORT_FILE_PATTERN):
+                path.unlink(missing_ok=True)
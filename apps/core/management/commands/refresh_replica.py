@@ -0,0 +1,53 @@
+import sqlite3
+import time
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from apps.core.db_router import get_database_routing_settings
+
+
+def refresh_replica(primary_path, replica_path) -> None:
+    """
+    Copies the primary into the replica with SQLite's online backup API.
+
+    The replica file is overwritten in place rather than swapped: persistent
+    connections keep the old inode open and would never see a new file.
+    Readers of the replica see either the old or the new snapshot. The copy
+    is made in one step: in WAL mode it doesn't block writers of the primary,
+    while a stepwise copy would restart on every write.
+    """
+    Path(replica_path).parent.mkdir(parents=True, exist_ok=True)
+
+    source = sqlite3.connect(primary_path)
+    target = sqlite3.connect(replica_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+
+class Command(BaseCommand):
+    help = "Copy the primary SQLite database into the read replica, once or every --interval seconds."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, help="Keep running and refresh every N seconds.")
+
+    def handle(self, *args, **options):
+        config = get_database_routing_settings()
+        if config['REPLICA'] not in settings.DATABASES:
+            raise CommandError(f"There is no {config['REPLICA']!r} database, set DJANGO_DB_PROFILE=production.")
+
+        primary_path = settings.DATABASES[config['PRIMARY']]['NAME']
+        replica_path = settings.DATABASES[config['REPLICA']]['NAME']
+
+        while True:
+            started = time.monotonic()
+            refresh_replica(primary_path, replica_path)
+            self.stdout.write(self.style.SUCCESS(
+                f"Replica refreshed in {(time.monotonic() - started) * 1000:.0f} ms."
+            ))
+
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
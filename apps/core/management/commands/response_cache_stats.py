@@ -0,0 +1,33 @@
+import json
+from django.core.management.base import BaseCommand
+from django.urls import get_resolver
+from apps.core.response_cache import get_response_cache_settings, get_stats, reset_stats
+
+
+class Command(BaseCommand):
+    help = "Show the hit/miss counters of the cached list endpoints."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', action='store_true', help="Print the counters as JSON.")
+        parser.add_argument('--reset', action='store_true', help="Reset the counters afterwards.")
+
+    def handle(self, *args, **options):
+        # Importing the URLconf registers every cached view
+        get_resolver().url_patterns
+
+        stats = get_stats()
+
+        if options['json']:
+            self.stdout.write(json.dumps(stats, indent=2))
+        else:
+            self.stdout.write(f"Cache alias: {get_response_cache_settings()['ALIAS']}")
+            header = f"{'view':<50} {'hits':>8} {'misses':>8} {'ratio':>6}"
+            self.stdout.write(header)
+            self.stdout.write('-' * len(header))
+            for view, row in sorted(stats.items()):
+                total = row['hit'] + row['miss']
+                ratio = f"{row['hit'] / total:.0%}" if total else '-'
+                self.stdout.write(f"{view:<50} {row['hit']:>8} {row['miss']:>8} {ratio:>6}")
+
+        if options['reset']:
+            reset_stats()
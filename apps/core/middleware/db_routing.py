@@ -0,0 +1,32 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from apps.core.db_router import primary_pinning
+
+
+class PrimaryPinningMiddleware:
+    """
+    Gives every request a fresh read-your-writes pin for ``PrimaryReplicaRouter``.
+
+    The pin lives in a context variable; worker threads are reused between
+    requests, so without resetting it one write would keep a thread on the
+    primary for good.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with primary_pinning():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with primary_pinning():
+            return await self.get_response(request)
@@ -0,0 +1,277 @@
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from apps.core.utils.file_store import file_lock, read_json, read_json_files, write_json_atomic
+from apps.core.utils.query_tracker import QueryTracker
+
+DEFAULT_METRICS = {
+    'ENABLED': True,
+    'DIR': None,
+    'FLUSH_INTERVAL': 10,
+    'TOKEN': None,
+}
+
+METRICS_FILE_PATTERN = 'metrics-*.json'
+WORKER_FILE_RE = re.compile(r'metrics-(?P<pid>\d+)-(?P<started>\d+)\.json')
+AGGREGATE_FILE = 'metrics-aggregate.json'
+LOCK_FILE = '.metrics.lock'
+
+# Upper bounds of the histogram buckets, the last bucket is +Inf
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+HISTOGRAMS = {
+    'latency': LATENCY_BUCKETS,
+    'queries': QUERY_BUCKETS,
+    'size': SIZE_BUCKETS,
+}
+
+
+def get_metrics_settings() -> dict:
+    return {**DEFAULT_METRICS, **getattr(settings, 'METRICS', {})}
+
+
+def empty_route() -> dict:
+    return {
+        'status': {},
+        **{name: {'buckets': [0] * (len(bounds) + 1), 'sum': 0} for name, bounds in HISTOGRAMS.items()},
+        'sql_seconds': 0.0,
+    }
+
+
+def to_snapshot(routes: dict) -> list:
+    return [
+        {
+            'route': route,
+            'method': method,
+            'status': dict(data['status']),
+            'sql_seconds': data['sql_seconds'],
+            **{name: {'buckets': list(data[name]['buckets']), 'sum': data[name]['sum']} for name in HISTOGRAMS},
+        }
+        for (route, method), data in routes.items()
+    ]
+
+
+class RouteMetrics:
+    """
+    Cumulative per-process counters and histograms by (route, method).
+
+    Bucket indexes are found before taking the lock, which then only guards
+    a handful of increments. Every process dumps its counters to
+    ``DIR/metrics-<pid>-<start>.json``, so a worker getting a recycled pid
+    doesn't overwrite the counters of the one that exited; ``load_metrics``
+    adds up the files of all workers.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.routes = {}
+        self.last_flush = time.monotonic()
+        self.pid = None
+        self.started = None
+
+    @property
+    def file_name(self) -> str:
+        # Taken on the first flush of every process, forked workers included
+        if self.pid != os.getpid():
+            self.pid, self.started = os.getpid(), time.time_ns() // 1000
+        return f'metrics-{self.pid}-{self.started}.json'
+
+    def record(self, route: str, method: str, status: int, duration: float,
+               queries: int, sql_seconds: float, size: int | None) -> None:
+        observations = [('latency', duration), ('queries', queries)]
+        if size is not None:
+            observations.append(('size', size))
+        indexes = [(name, bisect_left(HISTOGRAMS[name], value), value) for name, value in observations]
+        status = str(status)
+
+        with self.lock:
+            data = self.routes.get((route, method))
+            if data is None:
+                data = self.routes[(route, method)] = empty_route()
+
+            data['status'][status] = data['status'].get(status, 0) + 1
+            data['sql_seconds'] += sql_seconds
+            for name, index, value in indexes:
+                data[name]['buckets'][index] += 1
+                data[name]['sum'] += value
+
+    def snapshot(self) -> list:
+        with self.lock:
+            return to_snapshot(self.routes)
+
+    def flush(self, metrics_dir, force: bool = False, interval: float = 0) -> None:
+        if not metrics_dir:
+            return
+
+        # Requests skip the flush while another thread writes the file,
+        # ``force`` (a scrape) waits for it
+        if not self.flush_lock.acquire(blocking=force):
+            return
+
+        try:
+            now = time.monotonic()
+            if not force and now - self.last_flush < interval:
+                return
+
+            self.last_flush = now
+            write_json_atomic(Path(metrics_dir) / self.file_name, self.snapshot())
+        finally:
+            self.flush_lock.release()
+
+
+def merge_snapshots(snapshots) -> dict:
+    merged = {}
+
+    for snapshot in snapshots:
+        for row in snapshot:
+            data = merged.setdefault((row['route'], row['method']), empty_route())
+
+            for status, count in row['status'].items():
+                data['status'][status] = data['status'].get(status, 0) + count
+            data['sql_seconds'] += row['sql_seconds']
+
+            for name in HISTOGRAMS:
+                # Written with other buckets by an older release
+                if len(row[name]['buckets']) != len(data[name]['buckets']):
+                    continue
+                data[name]['buckets'] = [a + b for a, b in zip(data[name]['buckets'], row[name]['buckets'])]
+                data[name]['sum'] += row[name]['sum']
+
+    return merged
+
+
+def pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def fold_dead_workers(metrics_dir, own_file: str) -> None:
+    """
+    Adds the files of workers that exited to ``AGGREGATE_FILE`` and removes
+    them, so the directory doesn't grow with every restart. A file of this
+    pid but another start time is from an earlier process that had it.
+    """
+    metrics_dir = Path(metrics_dir)
+    dead = []
+
+    for path in metrics_dir.glob(METRICS_FILE_PATTERN):
+        match = WORKER_FILE_RE.fullmatch(path.name)
+        if match is None or path.name == own_file:
+            continue
+
+        pid = int(match['pid'])
+        if pid == os.getpid() or not pid_alive(pid):
+            dead.append(path)
+
+    if not dead:
+        return
+
+    aggregate_path = metrics_dir / AGGREGATE_FILE
+    snapshots = [read_json(path, []) for path in (aggregate_path, *dead)]
+    write_json_atomic(aggregate_path, to_snapshot(merge_snapshots(snapshots)))
+
+    for path in dead:
+        path.unlink(missing_ok=True)
+
+
+def load_metrics(metrics_dir=None) -> dict:
+    """
+    The counters of every worker by (route, method), the ones that exited
+    included. Without a directory only this process is known.
+    """
+    if not metrics_dir:
+        return merge_snapshots([route_metrics.snapshot()])
+
+    route_metrics.flush(metrics_dir, force=True)
+
+    # Scrapes in other workers would count a dead worker twice between
+    # the aggregate being written and its file being removed
+    with file_lock(Path(metrics_dir) / LOCK_FILE):
+        fold_dead_workers(metrics_dir, route_metrics.file_name)
+        return merge_snapshots(read_json_files(metrics_dir, METRICS_FILE_PATTERN))
+
+
+route_metrics = RouteMetrics()
+
+
+def response_size(response) -> int | None:
+    if not response.streaming:
+        return len(response.content)
+
+    # Streamed bodies are only known when the view announced their length
+    length = response.get('Content-Length')
+    return int(length) if length and length.isdigit() else None
+
+
+class MetricsMiddleware:
+    """
+    Records the status, latency, queries, SQL time and response size of
+    every request resolved to a URL name, see ``RouteMetrics``; the
+    ``metrics`` view exposes them in the Prometheus text format.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_metrics_settings()
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not self.config['ENABLED']:
+            return self.get_response(request)
+
+        tracker = QueryTracker()
+        start = time.perf_counter()
+        with tracker.track():
+            response = self.get_response(request)
+
+        self.record(request, response, tracker, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        if not self.config['ENABLED']:
+            return await self.get_response(request)
+
+        tracker = QueryTracker()
+        start = time.perf_counter()
+        with tracker.track_context():
+            response = await self.get_response(request)
+
+        self.record(request, response, tracker, time.perf_counter() - start)
+        return response
+
+    def record(self, request, response, tracker: QueryTracker, duration: float) -> None:
+        match = getattr(request, 'resolver_match', None)
+        if match is None or not match.view_name:
+            return
+
+        route_metrics.record(
+            match.view_name,
+            request.method,
+            response.status_code,
+            duration,
+            tracker.count,
+            tracker.duration,
+            response_size(response),
+        )
+        route_metrics.flush(self.config['DIR'], interval=self.config['FLUSH_INTERVAL'])
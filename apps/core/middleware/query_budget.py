@@ -0,0 +1,197 @@
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from apps.core.utils.file_store import read_json_files, write_json_atomic
+from apps.core.utils.query_tracker import QueryTracker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUERY_BUDGET = {
+    'ENABLED': True,
+    'RAISE': False,
+    'DEFAULT': None,
+    'WINDOW': 500,
+    'REPORT_DIR': None,
+    'FLUSH_INTERVAL': 30,
+}
+
+REPORT_FILE_PATTERN = 'query-budget-*.json'
+
+
+def get_query_budget_settings() -> dict:
+    return {**DEFAULT_QUERY_BUDGET, **getattr(settings, 'QUERY_BUDGET', {})}
+
+
+def get_view_budget(view_class, method: str):
+    """
+    ``query_budget`` on a view is either a number for every method or a
+    ``{'GET': 3, ...}`` mapping. Views without one fall back to
+    ``QUERY_BUDGET['DEFAULT']``.
+    """
+    budget = getattr(view_class, 'query_budget', None)
+
+    if isinstance(budget, dict):
+        budget = budget.get(method)
+
+    if budget is None:
+        budget = get_query_budget_settings()['DEFAULT']
+
+    return budget
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class RouteQueryStats:
+    """
+    Rolling per-route window of (queries, SQL ms) samples.
+
+    Every process keeps its own window and periodically dumps it to
+    ``REPORT_DIR/query-budget-<pid>.json``; ``manage.py query_budget_report``
+    merges the files of all workers.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.samples = defaultdict(lambda: deque(maxlen=self.window))
+        self.requests = defaultdict(int)
+        self.over_budget = defaultdict(int)
+        self.budgets = {}
+        self.last_flush = time.monotonic()
+
+    def record(self, route: str, queries: int, duration_ms: float, budget, exceeded: bool) -> None:
+        with self.lock:
+            self.samples[route].append((queries, round(duration_ms, 3)))
+            self.requests[route] += 1
+            self.over_budget[route] += int(exceeded)
+            self.budgets[route] = budget
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                route: {
+                    'requests': self.requests[route],
+                    'over_budget': self.over_budget[route],
+                    'budget': self.budgets.get(route),
+                    'samples': list(samples),
+                }
+                for route, samples in self.samples.items()
+            }
+
+    def flush(self, report_dir, force: bool = False, interval: float = 0) -> None:
+        if not report_dir:
+            return
+
+        # Requests skip the flush while another thread writes the file
+        if not self.flush_lock.acquire(blocking=force):
+            return
+
+        try:
+            now = time.monotonic()
+            if not force and now - self.last_flush < interval:
+                return
+
+            self.last_flush = now
+            write_json_atomic(
+                os.path.join(report_dir, f'query-budget-{os.getpid()}.json'),
+                self.snapshot(),
+            )
+        finally:
+            self.flush_lock.release()
+
+
+def load_reports(report_dir) -> dict:
+    merged = {}
+
+    for document in read_json_files(report_dir, REPORT_FILE_PATTERN):
+        for route, data in document.items():
+            route_stats = merged.setdefault(route, {
+                'requests': 0,
+                'over_budget': 0,
+                'budget': data.get('budget'),
+                'samples': [],
+            })
+            route_stats['requests'] += data['requests']
+            route_stats['over_budget'] += data['over_budget']
+            route_stats['samples'].extend(data['samples'])
+
+    return merged
+
+
+route_stats = RouteQueryStats(window=DEFAULT_QUERY_BUDGET['WINDOW'])
+
+
+class QueryBudgetMiddleware:
+    """
+    Counts queries and SQL time of every request and checks them against
+    the ``query_budget`` declared on the view class.
+
+    Going over the budget logs a warning, or raises ``QueryBudgetExceeded``
+    when ``QUERY_BUDGET['RAISE']`` is on (the default under ``manage.py test``).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_query_budget_settings()
+        route_stats.window = self.config['WINDOW']
+
+        # Under ASGI the chain stays async, so async views don't hop to a thread
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not self.config['ENABLED']:
+            return self.get_response(request)
+
+        tracker = QueryTracker()
+        with tracker.track():
+            response = self.get_response(request)
+
+        return self.check_budget(request, response, tracker)
+
+    async def __acall__(self, request):
+        if not self.config['ENABLED']:
+            return await self.get_response(request)
+
+        tracker = QueryTracker()
+        with tracker.track_context():
+            response = await self.get_response(request)
+
+        return self.check_budget(request, response, tracker)
+
+    def check_budget(self, request, response, tracker: QueryTracker):
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return response
+
+        view_class = getattr(match.func, 'view_class', None) or getattr(match.func, 'cls', None)
+        budget = get_view_budget(view_class, request.method)
+        exceeded = budget is not None and tracker.count > budget
+        route = match.view_name or match.route
+
+        route_stats.record(route, tracker.count, tracker.duration * 1000, budget, exceeded)
+        route_stats.flush(self.config['REPORT_DIR'], interval=self.config['FLUSH_INTERVAL'])
+
+        if exceeded:
+            message = (
+                f"{request.method} {route} ran {tracker.count} queries "
+                f"({tracker.duration * 1000:.1f} ms), budget is {budget}"
+            )
+            if self.config['RAISE']:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+        return response
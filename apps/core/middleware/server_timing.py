@@ -0,0 +1,268 @@
+import cProfile
+import logging
+import os
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from apps.core.utils.query_tracker import QueryTracker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVER_TIMING = {
+    'ENABLED': True,
+    'PATH_PREFIXES': ['/api/'],
+    'PROFILE_HEADER': 'X-Profile',
+    'PROFILE_PARAM': '_profile',
+    'PROFILE_DIR': None,
+    'PROFILE_LIMIT': 5,
+    'PROFILE_WINDOW': 60,
+    'PROFILE_KEEP': 50,
+}
+
+PROFILE_FILE_PATTERN = '*.prof'
+
+_current_timings = ContextVar('server_timings', default=None)
+
+
+def get_server_timing_settings() -> dict:
+    return {**DEFAULT_SERVER_TIMING, **getattr(settings, 'SERVER_TIMING', {})}
+
+
+class RequestTimings:
+    """
+    Wall time of the phases of one request, without the SQL run inside them:
+    a serializer walking a lazy queryset counts its queries under ``db``.
+
+    Phases don't nest, a serializer rendered from another phase stays in
+    the outer one.
+    """
+
+    def __init__(self, tracker: QueryTracker):
+        self.tracker = tracker
+        self.phases = defaultdict(float)
+        self.active = None
+
+    @contextmanager
+    def phase(self, name: str):
+        if self.active is not None:
+            yield
+            return
+
+        self.active = name
+        start, sql_start = time.perf_counter(), self.tracker.duration
+        try:
+            yield
+        finally:
+            self.active = None
+            self.phases[name] += time.perf_counter() - start - (self.tracker.duration - sql_start)
+
+    def header(self, total: float) -> str:
+        serialize, render = self.phases['serialize'], self.phases['render']
+        entries = [
+            ('db', self.tracker.duration, f'{self.tracker.count} queries'),
+            ('serialize', serialize, None),
+            ('render', render, None),
+            ('app', max(total - self.tracker.duration - serialize - render, 0.0), None),
+            ('total', total, None),
+        ]
+
+        return ', '.join(
+            f'{name};dur={duration * 1000:.2f}' + (f';desc="{description}"' if description else '')
+            for name, duration, description in entries
+        )
+
+
+def timed_property(prop: property, phase: str) -> property:
+    getter = prop.fget
+
+    @wraps(getter)
+    def timed(self):
+        timings = _current_timings.get()
+        if timings is None:
+            return getter(self)
+
+        with timings.phase(phase):
+            return getter(self)
+
+    timed.timing_phase = phase
+    return property(timed)
+
+
+def install_phase_timing() -> None:
+    """
+    Times ``serializer.data`` and ``Response.rendered_content``, where DRF
+    serializes and renders, for the requests ``ServerTimingMiddleware`` times.
+    Outside of them the wrappers only read a context variable.
+    """
+    from rest_framework.response import Response
+    from rest_framework.serializers import BaseSerializer
+
+    for cls, name, phase in ((BaseSerializer, 'data', 'serialize'), (Response, 'rendered_content', 'render')):
+        prop = cls.__dict__[name]
+        if not hasattr(prop.fget, 'timing_phase'):
+            setattr(cls, name, timed_property(prop, phase))
+
+
+class ProfileSampler:
+    """
+    At most ``limit`` captures per ``window`` seconds in this process, and
+    one at a time: a second profiler can't run next to the first one.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = threading.Lock()
+        self.captures = deque()
+
+    def acquire(self, limit: int, window: float) -> bool:
+        if not self.running.acquire(blocking=False):
+            return False
+
+        with self.lock:
+            now = time.monotonic()
+            while self.captures and now - self.captures[0] >= window:
+                self.captures.popleft()
+
+            if len(self.captures) >= limit:
+                self.running.release()
+                return False
+
+            self.captures.append(now)
+            return True
+
+    def release(self) -> None:
+        self.running.release()
+
+
+sampler = ProfileSampler()
+
+
+def prune_profiles(profile_dir: Path, keep: int) -> None:
+    dumps = sorted(profile_dir.glob(PROFILE_FILE_PATTERN), key=lambda path: path.stat().st_mtime, reverse=True)
+
+    for path in dumps[keep:]:
+        path.unlink(missing_ok=True)
+
+
+class ServerTimingMiddleware:
+    """
+    Adds a ``Server-Timing`` header with the SQL, serialization, rendering
+    and remaining view ("app") time to the requests under ``PATH_PREFIXES``.
+
+    Staff sending the ``PROFILE_HEADER`` header or the ``PROFILE_PARAM``
+    query parameter also get a cProfile dump of the request written to
+    ``PROFILE_DIR`` (named in the ``X-Profile-Dump`` response header), as
+    far as ``ProfileSampler`` allows. Captures need the sync handler, under
+    ASGI the requests are only timed.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_server_timing_settings()
+        self.path_prefixes = tuple(self.config['PATH_PREFIXES'])
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+        elif self.config['PROFILE_DIR']:
+            # Runs after the authentication middleware, so ``request.user`` is known
+            self.process_view = self.start_profile
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not self.is_timed(request):
+            return self.get_response(request)
+
+        timings = RequestTimings(QueryTracker())
+        token = _current_timings.set(timings)
+        start = time.perf_counter()
+        try:
+            with timings.tracker.track():
+                response = self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+            profile_path = self.stop_profile(request)
+
+        response['Server-Timing'] = timings.header(time.perf_counter() - start)
+        if profile_path is not None:
+            response['X-Profile-Dump'] = profile_path.name
+
+        return response
+
+    async def __acall__(self, request):
+        if not self.is_timed(request):
+            return await self.get_response(request)
+
+        timings = RequestTimings(QueryTracker())
+        token = _current_timings.set(timings)
+        start = time.perf_counter()
+        try:
+            with timings.tracker.track_context():
+                response = await self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+
+        response['Server-Timing'] = timings.header(time.perf_counter() - start)
+        return response
+
+    def is_timed(self, request) -> bool:
+        return self.config['ENABLED'] and request.path.startswith(self.path_prefixes)
+
+    def wants_profile(self, request) -> bool:
+        if not self.is_timed(request):
+            return False
+
+        if not (request.headers.get(self.config['PROFILE_HEADER']) or self.config['PROFILE_PARAM'] in request.GET):
+            return False
+
+        user = getattr(request, 'user', None)
+        return bool(user and user.is_active and user.is_staff)
+
+    def start_profile(self, request, view_func, view_args, view_kwargs):
+        if not self.wants_profile(request):
+            return None
+
+        if not sampler.acquire(self.config['PROFILE_LIMIT'], self.config['PROFILE_WINDOW']):
+            logger.info("Profile of %s %s skipped, sampling limit reached", request.method, request.path)
+            return None
+
+        request._profiler = cProfile.Profile()
+        request._profiler.enable()
+        return None
+
+    def stop_profile(self, request):
+        profiler = getattr(request, '_profiler', None)
+        if profiler is None:
+            return None
+
+        profiler.disable()
+        del request._profiler
+        try:
+            return self.save_profile(request, profiler)
+        finally:
+            sampler.release()
+
+    def save_profile(self, request, profiler: cProfile.Profile) -> Path:
+        profile_dir = Path(self.config['PROFILE_DIR'])
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
+        match = getattr(request, 'resolver_match', None)
+        route = re.sub(r'[^\w.-]+', '_', (match and match.view_name) or request.path).strip('_')
+        path = profile_dir / f"{datetime.now():%Y%m%dT%H%M%S%f}-{request.method}-{route}-{os.getpid()}.prof"
+
+        profiler.dump_stats(path)
+        prune_profiles(profile_dir, self.config['PROFILE_KEEP'])
+        logger.info("Profile of %s %s written to %s", request.method, request.path, path)
+        return path
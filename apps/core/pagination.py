@@ -0,0 +1,254 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
+from functools import reduce
+from operator import and_, or_
+
+from django.core.paginator import InvalidPage
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+PAGINATION_QUERY_PARAM = 'pagination'
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    page_size = 5
+    page_size_query_param = 'page_size'
+    max_page_size = 15
+
+    async def apaginate_queryset(self, queryset: QuerySet, request, view=None):
+        """``paginate_queryset()`` on the async ORM, for the async views."""
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator.count is a cached_property running a sync COUNT(*)
+        paginator.__dict__['count'] = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+
+        self.page.object_list = [obj async for obj in self.page.object_list]
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+
+        self.request = request
+        return list(self.page)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Seek pagination over a stable, unique ordering.
+
+    Instead of ``COUNT(*)`` + ``OFFSET`` every page is fetched with a
+    ``WHERE (f1, f2) < (v1, v2)`` condition built from the last row of the
+    previous page, so deep pages cost the same as the first one. The last
+    field of ``ordering`` must be unique (normally the primary key).
+    Cursors are opaque and no total count is returned.
+    """
+    page_size = 5
+    page_size_query_param = 'page_size'
+    max_page_size = 15
+    cursor_query_param = 'cursor'
+    ordering = ('-pk',)
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None):
+        return self.set_page(list(self.get_page_queryset(queryset, request, view)))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request, view=None):
+        """``paginate_queryset()`` on the async ORM, for the async views."""
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        return self.set_page([obj async for obj in page_queryset])
+
+    def get_page_queryset(self, queryset: QuerySet, request, view=None) -> QuerySet:
+        """The seek query of the requested page, with one extra row to detect the next one."""
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(view)
+        self.model = queryset.model
+        self.annotations = queryset.query.annotations
+
+        self.position, self.reverse = self.decode_cursor(request)
+
+        order_by = [self._invert(field) for field in self.ordering] if self.reverse else self.ordering
+        queryset = queryset.order_by(*order_by)
+
+        if self.position is not None:
+            queryset = queryset.filter(self.get_seek_filter(self.position, self.reverse))
+
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, results: list) -> list:
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+
+        if self.reverse:
+            results.reverse()
+            self.has_next, self.has_previous = self.position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.position is not None
+
+        self.page = results
+
+        return results
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, view) -> tuple:
+        return tuple(getattr(view, 'cursor_ordering', None) or self.ordering)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(self._position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+
+        return self.encode_cursor(self._position(self.page[0]), reverse=True)
+
+    def get_seek_filter(self, position: list, reverse: bool) -> Q:
+        conditions = []
+
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            lookup = 'lt' if descending else 'gt'
+
+            equal_prefix = [
+                Q(**{prev.lstrip('-'): value})
+                for prev, value in zip(self.ordering[:index], position)
+            ]
+            conditions.append(
+                reduce(and_, equal_prefix + [Q(**{f'{name}__{lookup}': position[index]})])
+            )
+
+        return reduce(or_, conditions)
+
+    def encode_cursor(self, position: list, reverse: bool) -> str:
+        payload = json.dumps(
+            {'p': position, 'r': int(reverse)},
+            separators=(',', ':'),
+        )
+        encoded = urlsafe_b64encode(payload.encode('ascii')).decode('ascii')
+
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request) -> tuple:
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if encoded is None:
+            return None, False
+
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            raw_position = payload['p']
+            reverse = bool(payload['r'])
+
+            if len(raw_position) != len(self.ordering):
+                raise ValueError
+
+            position = [
+                self._field(name).to_python(value)
+                for name, value in zip(self.ordering, raw_position)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    def _position(self, obj) -> list:
+        position = []
+
+        for field in self.ordering:
+            value = getattr(obj, field.lstrip('-'))
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            position.append(value)
+
+        return position
+
+    def _field(self, name: str):
+        name = name.lstrip('-')
+        if name == 'pk':
+            return self.model._meta.pk
+        if name in self.annotations:
+            return self.annotations[name].output_field
+        return self.model._meta.get_field(name)
+
+    @staticmethod
+    def _invert(field: str) -> str:
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+
+class PaginationModeMixin:
+    """
+    Lets a client pick the pagination style with ``?pagination=page|cursor``.
+
+    Views list the supported modes in ``pagination_modes`` and the keyset
+    ordering in ``cursor_ordering``. ``default_pagination_mode = None``
+    keeps a view unpaginated unless a mode is asked for explicitly.
+    """
+    pagination_modes = {
+        'page': StandardResultsSetPagination,
+        'cursor': KeysetPagination,
+    }
+    default_pagination_mode = 'page'
+    cursor_ordering = ('-pk',)
+
+    def get_pagination_mode(self):
+        mode = self.request.query_params.get(PAGINATION_QUERY_PARAM, self.default_pagination_mode)
+
+        if mode is not None and mode not in self.pagination_modes:
+            raise ValidationError({
+                PAGINATION_QUERY_PARAM: f"Valid pagination modes: {sorted(self.pagination_modes)}"
+            })
+
+        return mode
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            mode = self.get_pagination_mode()
+            self._paginator = self.pagination_modes[mode]() if mode else None
+
+        return self._paginator
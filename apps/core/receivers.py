@@ -0,0 +1,29 @@
+from django.db.backends.signals import connection_created
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from apps.core.response_cache import get_tracked_models, invalidate, is_tracked
+from apps.core.utils.query_tracker import install_context_tracking
+
+
+def invalidate_model(sender, **kwargs):
+    invalidate(sender._meta.label)
+
+
+def invalidate_relation(sender, instance, action, model, **kwargs):
+    if not action.startswith('post_'):
+        return
+
+    for changed in (type(instance), model):
+        if is_tracked(changed):
+            invalidate(changed._meta.label)
+
+
+def connect_response_cache() -> None:
+    for model in get_tracked_models():
+        post_save.connect(invalidate_model, sender=model, dispatch_uid=f'response_cache_save_{model._meta.label}')
+        post_delete.connect(invalidate_model, sender=model, dispatch_uid=f'response_cache_delete_{model._meta.label}')
+
+    m2m_changed.connect(invalidate_relation, dispatch_uid='response_cache_m2m')
+
+
+def connect_query_tracking() -> None:
+    connection_created.connect(install_context_tracking, dispatch_uid='query_tracker_context')
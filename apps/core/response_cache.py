@@ -0,0 +1,183 @@
+import hashlib
+import time
+from functools import wraps
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+from apps.core.db_router import reading_from_primary
+
+DEFAULT_RESPONSE_CACHE = {
+    'ENABLED': True,
+    'ALIAS': 'default',
+    'TIMEOUT': 300,
+    'KEY_PREFIX': 'rc',
+    'MODELS': [],
+}
+
+CACHEABLE_STATUSES = (200, 204)
+
+# Qualified names of the cached view methods, for the hit/miss report
+registered_views = []
+
+
+def get_response_cache_settings() -> dict:
+    return {**DEFAULT_RESPONSE_CACHE, **getattr(settings, 'RESPONSE_CACHE', {})}
+
+
+def get_cache():
+    return caches[get_response_cache_settings()['ALIAS']]
+
+
+def version_key(label: str) -> str:
+    return f"{get_response_cache_settings()['KEY_PREFIX']}:version:{label.lower()}"
+
+
+def stats_key(view: str, outcome: str) -> str:
+    return f"{get_response_cache_settings()['KEY_PREFIX']}:stats:{view}:{outcome}"
+
+
+def get_versions(labels) -> list:
+    """
+    Current version of every model in ``labels``. A missing (never bumped
+    or evicted) counter starts at the current time instead of 1, so it can
+    never take a value some already cached response was stored with.
+    """
+    cache = get_cache()
+    keys = [version_key(label) for label in labels]
+    versions = cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+
+    return [versions[key] for key in keys]
+
+
+def bump_version(label: str) -> None:
+    key = version_key(label)
+    cache = get_cache()
+
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, time.time_ns(), timeout=None):
+            cache.incr(key)
+
+
+def invalidate(*labels: str) -> None:
+    """
+    Makes every cached response built from ``labels`` unreachable. The bump
+    waits for the commit, so no concurrent request can re-cache data the
+    transaction is about to change under the new version.
+    """
+    for label in labels:
+        transaction.on_commit(lambda label=label: bump_version(label), robust=True)
+
+
+def is_tracked(model) -> bool:
+    return model._meta.label_lower in {label.lower() for label in get_response_cache_settings()['MODELS']}
+
+
+def count(view: str, outcome: str) -> None:
+    cache = get_cache()
+    key = stats_key(view, outcome)
+
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            pass
+
+
+def get_stats() -> dict:
+    cache = get_cache()
+    keys = [stats_key(view, outcome) for view in registered_views for outcome in ('hit', 'miss')]
+    values = cache.get_many(keys)
+
+    return {
+        view: {
+            'hit': values.get(stats_key(view, 'hit'), 0),
+            'miss': values.get(stats_key(view, 'miss'), 0),
+        }
+        for view in registered_views
+    }
+
+
+def reset_stats() -> None:
+    get_cache().delete_many([
+        stats_key(view, outcome) for view in registered_views for outcome in ('hit', 'miss')
+    ])
+
+
+def detach(data):
+    """Drops the serializer references of ``ReturnList``/``ReturnDict`` before pickling."""
+    if isinstance(data, ReturnList):
+        return list(data)
+    if isinstance(data, (ReturnDict, dict)):
+        return {key: detach(value) for key, value in data.items()}
+    return data
+
+
+def build_key(view: str, request, versions: list) -> str:
+    url = request.build_absolute_uri(request.path)
+    params = sorted(request.query_params.lists())
+    raw = f"{url}|{params}|{versions}"
+
+    return f"{get_response_cache_settings()['KEY_PREFIX']}:response:{view}:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+def cache_response(*models: str):
+    """
+    Caches the data of a GET handler (``get``/``list``) under a key made of
+    the URL, the query params and the versions of ``models``
+    (``'app_label.Model'``), e.g.::
+
+        @cache_response('tasks.Tag')
+        def get(self, request): ...
+
+    Every write to one of the models bumps its version (see
+    ``apps.core.receivers``), so stale entries are never read again and just
+    expire. Only the serialized data is stored: rendering stays per request.
+    A miss reads from the primary, never from a replica that may not have
+    caught up with the write behind the current versions yet.
+    """
+    def decorator(handler):
+        view = handler.__qualname__
+        registered_views.append(view)
+
+        @wraps(handler)
+        def wrapper(self, request, *args, **kwargs):
+            config = get_response_cache_settings()
+
+            if not config['ENABLED']:
+                return handler(self, request, *args, **kwargs)
+
+            cache = get_cache()
+            key = build_key(view, request, get_versions(models))
+            cached = cache.get(key)
+
+            if cached is not None:
+                count(view, 'hit')
+                data, status = cached
+                return Response(data, status=status)
+
+            count(view, 'miss')
+            with reading_from_primary():
+                response = handler(self, request, *args, **kwargs)
+
+            if response.status_code in CACHEABLE_STATUSES:
+                cache.set(key, (detach(response.data), response.status_code), timeout=config['TIMEOUT'])
+
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def get_tracked_models() -> list:
+    return [apps.get_model(label) for label in get_response_cache_settings()['MODELS']]
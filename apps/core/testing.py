@@ -0,0 +1,26 @@
+from contextlib import contextmanager
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from apps.core.middleware.query_budget import QueryBudgetExceeded, get_view_budget
+
+
+@contextmanager
+def assert_query_budget(view_class, method: str = 'GET'):
+    """
+    Fails when the wrapped block runs more queries than ``view_class``
+    declares in ``query_budget`` for ``method``::
+
+        with assert_query_budget(TasksListAPIView):
+            self.client.get(reverse('task-list'))
+    """
+    budget = get_view_budget(view_class, method)
+
+    with CaptureQueriesContext(connection) as context:
+        yield context
+
+    if budget is not None and len(context) > budget:
+        queries = '\n'.join(query['sql'] for query in context.captured_queries)
+        raise QueryBudgetExceeded(
+            f"{view_class.__name__}.{method.lower()} ran {len(context)} queries, "
+            f"budget is {budget}:\n{queries}"
+        )
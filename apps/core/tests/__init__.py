@@ -0,0 +1,8 @@
+from .async_views import *
+from .bench import *
+from .db_router import *
+from .metrics import *
+from .ndjson_dump import *
+from .query_budget import *
+from .response_cache import *
+from .server_timing import *
@@ -0,0 +1,85 @@
+from datetime import timedelta
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from apps.core.middleware.query_budget import QueryBudgetExceeded, route_stats
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task
+from apps.tasks.views.async_views import AsyncTagListView
+
+
+class AsyncViewsTestCase(TestCase):
+    """The async endpoints must answer exactly like their sync counterparts."""
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Async Project', description='Project served by the async views.')
+        self.tag = Tag.objects.create(name='Async')
+        deadline = timezone.now() + timedelta(days=10)
+
+        for i in range(7):
+            task = Task.objects.create(
+                name=f'Async task {i:02d}',
+                description='Task listed by both the sync and the async endpoints.',
+                project=self.project,
+                deadline=deadline + timedelta(days=i % 3),
+            )
+            task.tags.add(self.tag)
+        self.task = task
+
+    def pairs(self):
+        return [
+            ('task-list', 'async-task-list', {}, {}),
+            ('task-list', 'async-task-list', {}, {'pagination': 'cursor', 'page_size': 3, 'status': 'NEW'}),
+            ('task-list', 'async-task-list', {}, {'page': 2}),
+            ('task-list', 'async-task-list', {}, {'status': 'DONE'}),
+            ('task-list', 'async-task-list', {}, {'project': 'Missing'}),
+            ('task-detail', 'async-task-detail', {'pk': self.task.pk}, {}),
+            ('task-detail', 'async-task-detail', {'pk': 0}, {}),
+            ('tag-list', 'async-tag-list', {}, {}),
+            ('project-list', 'async-project-list', {}, {}),
+            ('project-list', 'async-project-list', {}, {'date_from': 'yesterday'}),
+            ('project-detail', 'async-project-detail', {'pk': self.project.pk}, {}),
+        ]
+
+    async def test_same_responses(self):
+        for sync_name, async_name, kwargs, params in self.pairs():
+            with self.subTest(route=sync_name, params=params):
+                expected = await self.async_client.get(reverse(sync_name, kwargs=kwargs), params)
+                response = await self.async_client.get(reverse(async_name, kwargs=kwargs), params)
+
+                self.assertEqual(response.status_code, expected.status_code)
+                self.assertEqual(
+                    response.content.replace(b'/async', b''),
+                    expected.content,
+                )
+                self.assertEqual(response.get('ETag'), expected.get('ETag'))
+
+    async def test_cursor_links_stay_async(self):
+        response = await self.async_client.get(reverse('async-task-list'), {'pagination': 'cursor', 'page_size': 5})
+        next_page = await self.async_client.get(response.json()['next'])
+
+        ids = [task['id'] for task in response.json()['results'] + next_page.json()['results']]
+        self.assertEqual(len(set(ids)), 7)
+
+    async def test_not_modified(self):
+        url = reverse('async-task-detail', kwargs={'pk': self.task.pk})
+        etag = (await self.async_client.get(url))['ETag']
+
+        response = await self.async_client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        # Counted by the query budget middleware through the context tracker
+        queries, _ = route_stats.snapshot()['async-task-detail']['samples'][-1]
+        self.assertEqual(queries, 1)
+
+    async def test_read_only(self):
+        response = await self.async_client.post(reverse('async-tag-list'), {'name': 'New'})
+        self.assertEqual(response.status_code, 405)
+
+    @override_settings(QUERY_BUDGET={'RAISE': True})
+    async def test_query_budget_counts_async_queries(self):
+        AsyncTagListView.query_budget = {'GET': 1}
+        try:
+            with self.assertRaises(QueryBudgetExceeded):
+                await self.async_client.get(reverse('async-tag-list'))
+        finally:
+            AsyncTagListView.query_budget = {'GET': 2}
@@ -0,0 +1,106 @@
+import tempfile
+from unittest.mock import patch
+from django.test import TestCase, override_settings
+from apps.core.utils.bench import (
+    SCENARIOS, SKIPPED_ROUTES, compare_results, compare_timings, iter_route_names, measure_route, run_benchmarks,
+    seed_dataset,
+)
+from apps.projects.models import Project
+from apps.tasks.models import Task
+
+
+def route_result(**overrides) -> dict:
+    return {
+        'method': 'GET',
+        'requests': 10,
+        'status': {'200': 10},
+        'p50_ms': 10.0,
+        'p95_ms': 20.0,
+        'p99_ms': 30.0,
+        'mean_ms': 12.0,
+        'queries': 2,
+        'alloc_peak_kib': 100.0,
+        **overrides,
+    }
+
+
+class CompareResultsTestCase(TestCase):
+    def compare(self, current: dict, **options) -> list[str]:
+        baseline = {'calibration_ms': 10, 'routes': {'tag-list': route_result()}}
+        results = {'calibration_ms': options.pop('calibration_ms', 10), 'routes': {'tag-list': current}}
+        return compare_results(results, baseline, threshold=0.25, **options)
+
+    def test_extra_query_is_a_regression(self):
+        self.assertEqual(self.compare(route_result(queries=3)), ['tag-list: 3 queries per request, baseline 2'])
+
+    def test_latency_threshold(self):
+        self.assertEqual(self.compare(route_result(p50_ms=12.4)), [])
+        self.assertEqual(len(self.compare(route_result(p50_ms=12.6))), 1)
+
+    def test_small_routes_get_an_absolute_slack(self):
+        baseline = {'routes': {'tag-list': route_result(p50_ms=1.0)}}
+        results = {'routes': {'tag-list': route_result(p50_ms=2.5)}}
+        self.assertEqual(compare_timings(results, baseline, threshold=0.25), [])
+
+    def test_timing_gate_can_be_turned_off(self):
+        baseline = {'routes': {'tag-list': route_result()}}
+        results = {'routes': {'tag-list': route_result(p50_ms=100.0, alloc_peak_kib=1000.0)}}
+
+        self.assertEqual(len(compare_results(results, baseline, threshold=0.25)), 2)
+        self.assertEqual(compare_results(results, baseline, threshold=0.25, timing=False), [])
+        self.assertEqual(len(compare_timings(results, baseline, threshold=0.25)), 2)
+
+    def test_slower_machine_scales_the_baseline(self):
+        self.assertEqual(self.compare(route_result(p50_ms=19.0), calibration_ms=20), [])
+
+    def test_status_change_and_allocations(self):
+        regressions = self.compare(route_result(status={'500': 10}, alloc_peak_kib=200.0))
+        self.assertEqual(len(regressions), 2)
+
+    def test_routes_missing_from_the_baseline_are_ignored(self):
+        results = {'routes': {'new-route': route_result(queries=50)}}
+        self.assertEqual(compare_results(results, {'routes': {}}, threshold=0.25), [])
+
+
+class BenchRunTestCase(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings_override = override_settings(
+            MEDIA_ROOT=media.name,
+            UPLOAD_SESSIONS={'DIR': f'{media.name}/uploads'},
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.data = seed_dataset(projects=3, tasks=30, tags=4, users=5, files=4)
+
+    def test_every_route_has_a_scenario(self):
+        covered = set(SCENARIOS) | set(SKIPPED_ROUTES)
+        self.assertEqual(set(iter_route_names()) - covered, set())
+
+    def test_seeded_aggregates(self):
+        project = Project.objects.select_related('task_summary').get(pk=self.data['project'])
+        self.assertEqual(project.tasks_count, Task.objects.filter(project=project).count())
+        self.assertEqual(project.files_count, project.files.count())
+
+    def test_writes_are_rolled_back(self):
+        results = run_benchmarks(
+            self.data, routes=['tag-list', 'task-bulk-create'], requests=2, warmup=0, alloc_samples=1, rounds=1,
+        )
+
+        self.assertEqual(set(results['routes']), {'tag-list', 'task-bulk-create'})
+        self.assertEqual(results['routes']['task-bulk-create']['status'], {'201': 2})
+        self.assertEqual(results['routes']['tag-list']['queries'], 2)
+        self.assertEqual(Task.objects.count(), 30)
+
+    def test_slow_routes_are_measured_again(self):
+        with patch('apps.core.utils.bench.measure_route', wraps=measure_route) as measured:
+            run_benchmarks(
+                self.data, routes=['tag-list', 'tag-detail'], requests=2, warmup=0, alloc_samples=1, rounds=2,
+                recheck=lambda results: {'tag-list'},
+            )
+
+        names = [call.args[1]['path'] for call in measured.call_args_list]
+        self.assertEqual(len(names), 6)
+        self.assertEqual(names[4:], [names[0], names[0]])
@@ -0,0 +1,123 @@
+import sqlite3
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from django.conf import settings
+from django.db.utils import ConnectionHandler
+from django.core.cache import caches
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework.request import Request
+from rest_framework.response import Response
+from apps.core.db_router import PrimaryReplicaRouter, is_pinned, pin_to_primary, primary_pinning
+from apps.core.management.commands.refresh_replica import refresh_replica
+from apps.core.middleware.db_routing import PrimaryPinningMiddleware
+from apps.core.response_cache import cache_response
+from apps.tasks.models import Task
+
+
+class RoutedTagsView:
+    @cache_response('tasks.Tag')
+    def get(self, request):
+        return Response({'database': PrimaryReplicaRouter().db_for_read(Task)})
+
+
+@patch.object(PrimaryReplicaRouter, 'replica_available', return_value=True)
+class PrimaryReplicaRouterTestCase(SimpleTestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+
+    def test_reads_go_to_the_replica(self, available):
+        with primary_pinning():
+            self.assertEqual(self.router.db_for_read(Task), 'replica')
+
+    def test_write_pins_the_rest_of_the_request(self, available):
+        with primary_pinning():
+            self.assertEqual(self.router.db_for_write(Task), 'default')
+            self.assertEqual(self.router.db_for_read(Task), 'default')
+
+        with primary_pinning():
+            self.assertEqual(self.router.db_for_read(Task), 'replica')
+
+    def test_middleware_resets_the_pin(self, available):
+        def view(request):
+            self.assertFalse(is_pinned())
+            pin_to_primary()
+            return 'response'
+
+        pin_to_primary()
+        middleware = PrimaryPinningMiddleware(view)
+
+        self.assertEqual(middleware(RequestFactory().get('/')), 'response')
+        self.assertTrue(is_pinned())
+
+    @override_settings(RESPONSE_CACHE={'ENABLED': True, 'ALIAS': 'responses', 'KEY_PREFIX': 'test-router'})
+    def test_cached_responses_are_built_from_the_primary(self, available):
+        caches['responses'].clear()
+        request = Request(RequestFactory().get('/routed/'))
+
+        with primary_pinning():
+            self.assertEqual(RoutedTagsView().get(request).data, {'database': 'default'})
+            # The pin only covers the cache miss
+            self.assertEqual(self.router.db_for_read(Task), 'replica')
+
+    def test_replica_is_never_migrated(self, available):
+        self.assertFalse(self.router.allow_migrate('replica', 'tasks'))
+        self.assertIsNone(self.router.allow_migrate('default', 'tasks'))
+
+
+@override_settings(DATABASE_ROUTING={'REPLICA': None})
+class NoReplicaTestCase(SimpleTestCase):
+    def test_router_has_no_opinion(self):
+        router = PrimaryReplicaRouter()
+        self.assertIsNone(router.db_for_read(Task))
+        self.assertIsNone(router.db_for_write(Task))
+
+
+class ProductionProfileTestCase(SimpleTestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = Path(tmp_dir.name)
+
+    def connect(self, name: str):
+        # A handler of its own, the test databases stay untouched
+        handler = ConnectionHandler({
+            'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+            'profile': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': self.tmp_dir / name,
+                'OPTIONS': settings.SQLITE_PRODUCTION_OPTIONS,
+            },
+        })
+        connection = handler['profile']
+        self.addCleanup(connection.close)
+        return connection
+
+    def test_pragmas_are_applied_on_connect(self):
+        with self.connect('primary.sqlite3').cursor() as cursor:
+            pragmas = {}
+            for pragma in ('journal_mode', 'synchronous', 'busy_timeout', 'temp_store'):
+                cursor.execute(f'PRAGMA {pragma}')
+                pragmas[pragma] = cursor.fetchone()[0]
+
+        self.assertEqual(pragmas, {'journal_mode': 'wal', 'synchronous': 1, 'busy_timeout': 5000, 'temp_store': 2})
+
+    def test_refresh_replica_copies_in_place(self):
+        primary = self.tmp_dir / 'primary.sqlite3'
+        replica = self.tmp_dir / 'var' / 'replica.sqlite3'
+
+        with self.connect('primary.sqlite3').cursor() as cursor:
+            cursor.execute('CREATE TABLE item (name TEXT)')
+            cursor.execute("INSERT INTO item VALUES ('first')")
+
+        refresh_replica(primary, replica)
+        reader = sqlite3.connect(replica)
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.execute('SELECT count(*) FROM item').fetchone(), (1,))
+
+        with self.connect('primary.sqlite3').cursor() as cursor:
+            cursor.execute("INSERT INTO item VALUES ('second')")
+
+        # The connection opened before the refresh sees the new rows
+        refresh_replica(primary, replica)
+        self.assertEqual(reader.execute('SELECT count(*) FROM item').fetchone(), (2,))
@@ -0,0 +1,172 @@
+import os
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from apps.core.middleware.metrics import AGGREGATE_FILE, LATENCY_BUCKETS, RouteMetrics, load_metrics, merge_snapshots
+from apps.core.utils.file_store import write_json_atomic
+from apps.core.utils.prometheus import Exposition
+from apps.tasks.models import Tag
+
+
+def parse_samples(text: str) -> dict:
+    return {
+        line.rsplit(' ', 1)[0]: float(line.rsplit(' ', 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith('#')
+    }
+
+
+class MetricsTestCase(TestCase):
+    def setUp(self):
+        Tag.objects.create(name='Measured')
+
+        metrics_patcher = patch('apps.core.middleware.metrics.route_metrics', RouteMetrics())
+        self.metrics = metrics_patcher.start()
+        self.addCleanup(metrics_patcher.stop)
+
+    def scrape(self, token='scrape-token', **config):
+        with override_settings(METRICS={'TOKEN': 'scrape-token', **config}):
+            return self.client.get(reverse('metrics'), headers={'Authorization': f'Bearer {token}'})
+
+    def test_requests_are_recorded_per_route(self):
+        self.client.get(reverse('tag-list'))
+        self.client.get(reverse('tag-list'))
+        self.client.get(reverse('task-detail', kwargs={'pk': 0}))
+        self.client.get('/missing/')
+
+        routes = load_metrics()
+        self.assertEqual(set(routes), {('tag-list', 'GET'), ('task-detail', 'GET')})
+
+        tags = routes[('tag-list', 'GET')]
+        self.assertEqual(tags['status'], {'200': 2})
+        self.assertEqual(sum(tags['latency']['buckets']), 2)
+        self.assertEqual(tags['queries']['sum'], 4)
+        self.assertGreater(tags['size']['sum'], 0)
+        self.assertEqual(routes[('task-detail', 'GET')]['status'], {'404': 1})
+
+    def test_prometheus_endpoint(self):
+        self.client.get(reverse('tag-list'))
+        response = self.scrape()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+
+        samples = parse_samples(response.content.decode())
+        labels = 'route="tag-list",method="GET"'
+        self.assertEqual(samples[f'http_requests_total{{{labels},status="200"}}'], 1)
+        self.assertEqual(samples[f'http_request_duration_seconds_count{{{labels}}}'], 1)
+        self.assertEqual(samples[f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'], 1)
+        self.assertEqual(samples[f'http_request_db_queries_bucket{{{labels},le="1"}}'], 0)
+        self.assertEqual(samples[f'http_request_db_queries_bucket{{{labels},le="2"}}'], 1)
+        self.assertIn(f'http_response_size_bytes_sum{{{labels}}}', samples)
+
+    def test_endpoint_needs_the_token(self):
+        self.assertEqual(self.scrape(token='guessed').status_code, 404)
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 404)
+
+        # Local clients aren't trusted either, the proxy connects from there
+        with override_settings(METRICS={'TOKEN': 'scrape-token'}):
+            response = self.client.get(reverse('metrics'), REMOTE_ADDR='127.0.0.1')
+        self.assertEqual(response.status_code, 404)
+
+    def test_endpoint_is_off_without_a_token(self):
+        self.assertEqual(self.scrape(token='None', TOKEN=None).status_code, 404)
+        self.assertEqual(self.scrape(token='', TOKEN='').status_code, 404)
+
+    def test_workers_are_merged_through_the_directory(self):
+        with tempfile.TemporaryDirectory() as metrics_dir, override_settings(METRICS={'DIR': metrics_dir}):
+            other = RouteMetrics()
+            other.record('tag-list', 'GET', 500, 0.2, 3, 0.01, 100)
+            write_json_atomic(f'{metrics_dir}/metrics-{os.getppid()}-1.json', other.snapshot())
+
+            self.client.get(reverse('tag-list'))
+            response = self.scrape(DIR=metrics_dir)
+
+        samples = parse_samples(response.content.decode())
+        self.assertEqual(samples['http_requests_total{route="tag-list",method="GET",status="200"}'], 1)
+        self.assertEqual(samples['http_requests_total{route="tag-list",method="GET",status="500"}'], 1)
+        self.assertEqual(samples['http_request_duration_seconds_count{route="tag-list",method="GET"}'], 2)
+
+
+class RouteMetricsTestCase(TestCase):
+    def setUp(self):
+        metrics_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(metrics_dir.cleanup)
+        self.metrics_dir = Path(metrics_dir.name)
+
+        metrics_patcher = patch('apps.core.middleware.metrics.route_metrics', RouteMetrics())
+        self.metrics = metrics_patcher.start()
+        self.addCleanup(metrics_patcher.stop)
+
+    def write_metrics(self, name: str, requests: int) -> None:
+        worker = RouteMetrics()
+        for _ in range(requests):
+            worker.record('tag-list', 'GET', 200, 0.01, 1, 0.001, 100)
+        write_json_atomic(self.metrics_dir / name, worker.snapshot())
+
+    def test_files_are_keyed_on_pid_and_start(self):
+        self.metrics.flush(self.metrics_dir, force=True)
+        first = self.metrics.file_name
+
+        self.assertRegex(first, rf'^metrics-{os.getpid()}-\d+\.json$')
+        self.assertTrue((self.metrics_dir / first).exists())
+        self.assertNotEqual(RouteMetrics().file_name, first)
+
+    def test_concurrent_flushes(self):
+        self.metrics.record('tag-list', 'GET', 200, 0.01, 1, 0.001, 100)
+        errors = []
+
+        def flush(force: bool):
+            for _ in range(50):
+                try:
+                    self.metrics.flush(self.metrics_dir, force=force)
+                    write_json_atomic(self.metrics_dir / 'shared.json', self.metrics.snapshot())
+                except Exception as error:
+                    errors.append(error)
+
+        threads = [threading.Thread(target=flush, args=(index % 2 == 0,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(load_metrics(self.metrics_dir)[('tag-list', 'GET')]['status'], {'200': 1})
+        self.assertEqual(list(self.metrics_dir.glob('.*.tmp')), [])
+
+    def test_dead_workers_are_folded_into_the_aggregate(self):
+        # Two earlier processes with this pid, a live worker and folded ones
+        self.write_metrics(f'metrics-{os.getpid()}-1.json', requests=2)
+        self.write_metrics(f'metrics-{os.getpid()}-3.json', requests=1)
+        self.write_metrics(f'metrics-{os.getppid()}-2.json', requests=3)
+        self.write_metrics(AGGREGATE_FILE, requests=4)
+        self.metrics.record('tag-list', 'GET', 200, 0.01, 1, 0.001, 100)
+
+        for _ in range(2):
+            routes = load_metrics(self.metrics_dir)
+            self.assertEqual(routes[('tag-list', 'GET')]['status'], {'200': 11})
+
+        self.assertEqual(
+            sorted(path.name for path in self.metrics_dir.glob('metrics-*.json')),
+            sorted([AGGREGATE_FILE, f'metrics-{os.getppid()}-2.json', self.metrics.file_name]),
+        )
+
+    def test_histogram_buckets(self):
+        metrics = RouteMetrics()
+        for duration in (0.001, 0.005, 0.3, 60):
+            metrics.record('tag-list', 'GET', 200, duration, 0, 0.0, None)
+
+        data = merge_snapshots([metrics.snapshot()])[('tag-list', 'GET')]
+        buckets = data['latency']['buckets']
+        self.assertEqual(len(buckets), len(LATENCY_BUCKETS) + 1)
+        self.assertEqual((buckets[0], buckets[LATENCY_BUCKETS.index(0.5)], buckets[-1]), (2, 1, 1))
+        self.assertEqual(data['size'], {'buckets': [0] * len(data['size']['buckets']), 'sum': 0})
+
+    def test_label_escaping(self):
+        exposition = Exposition()
+        exposition.sample('up', {'route': 'a"b\\c\nd'}, 1)
+
+        self.assertEqual(exposition.render(), 'up{route="a\\"b\\\\c\\nd"} 1\n')
@@ -0,0 +1,169 @@
+import io
+import json
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+from django.conf import settings
+from django.core.management import call_command
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from apps.core.utils.ndjson_dump import DumpError, dump, dump_models, iter_json_array, load, model_label, read_manifest
+from apps.projects.models import Project, ProjectFile
+from apps.tasks.models import ProjectTaskSummary, Tag, Task
+from apps.users.models import User
+
+
+class NDJSONDumpTestCase(TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = Path(tmp_dir.name)
+
+        self.project = Project.objects.create(
+            name='Dump Project',
+            description='Project that goes through a dump and a load.'
+        )
+        self.user = User.objects.create(
+            username='dump_user',
+            first_name='dump',
+            last_name='user',
+            email='dump@example.com',
+            password='1q9i2w8u3e7y4r6t5',
+            project=self.project,
+        )
+        self.tags = Tag.objects.bulk_create([Tag(name='Backend'), Tag(name='DevOPS')])
+        self.task = Task.objects.create(
+            name='Dumped task',
+            description='Task whose timestamps must survive the round trip.',
+            project=self.project,
+            assignee=self.user,
+            deadline=timezone.now() + timedelta(days=3),
+        )
+        self.task.tags.set(self.tags)
+        project_file = ProjectFile.objects.create(file_name='notes.py', file_path='documents/notes.py')
+        self.project.files.add(project_file)
+
+        # Written an hour ago: a load must not replace it with the load time
+        Task.objects.filter(pk=self.task.pk).update(updated_at=timezone.now() - timedelta(hours=1))
+
+    def snapshot(self) -> dict:
+        return {
+            model_label(model): list(model._base_manager.order_by('pk').values())
+            for model in dump_models()
+        }
+
+    def test_dependency_order(self):
+        order = [model_label(model) for model in dump_models()]
+
+        self.assertLess(order.index('projects.project'), order.index('users.user'))
+        self.assertLess(order.index('users.user'), order.index('tasks.task'))
+        self.assertLess(order.index('projects.fileblob'), order.index('projects.projectfile'))
+        self.assertEqual(order[-2:], ['projects.project_files', 'tasks.task_tags'])
+        self.assertNotIn('users.user_groups', order)
+        self.assertNotIn('tasks.projecttasksummary', order)
+
+    def test_round_trip(self):
+        before = self.snapshot()
+
+        for compress in (False, True):
+            with self.subTest(compress=compress):
+                directory = self.tmp_dir / f'dump-{compress}'
+                dump(directory, compress=compress)
+                call_command('load', str(directory), '--replace', stdout=io.StringIO())
+
+                self.assertEqual(self.snapshot(), before)
+
+        summary = ProjectTaskSummary.objects.get(project=self.project)
+        self.assertEqual(summary.total, 1)
+        self.project.refresh_from_db()
+        self.assertEqual((self.project.files_count, self.project.users_count), (1, 1))
+        self.assertTrue(Task.objects.filter(project=self.project).exists())
+
+    def test_load_refuses_tables_with_rows(self):
+        dump(self.tmp_dir)
+
+        with self.assertRaises(DumpError):
+            load(self.tmp_dir)
+
+    @patch('apps.projects.utils.project_counters.reconcile_counters')
+    @patch('apps.tasks.utils.task_summary.rebuild_summaries')
+    @patch('apps.core.management.commands.load.load', return_value={})
+    def test_load_rebuilds_the_loaded_database(self, load_dump, rebuild_summaries, reconcile_counters):
+        call_command('load', str(self.tmp_dir), '--database', 'other', stdout=io.StringIO())
+
+        self.assertEqual(load_dump.call_args.kwargs['using'], 'other')
+        rebuild_summaries.assert_called_once_with(using='other')
+        reconcile_counters.assert_called_once_with(using='other')
+
+    def test_convert_db_backup(self):
+        out = io.StringIO()
+        call_command('convert_dumpdata', str(settings.BASE_DIR / 'db_backup.json'), str(self.tmp_dir), stdout=out)
+        call_command('load', str(self.tmp_dir), '--replace', stdout=out)
+
+        task = Task.objects.get()
+        self.assertEqual(task.status, 'NEW')
+        self.assertEqual(task.created_at.isoformat(), '2024-08-20T10:17:53.800000+00:00')
+        self.assertEqual(sorted(task.tags.values_list('name', flat=True)), ['Tag 1', 'Tag 2'])
+        self.assertEqual(User.objects.count(), 2)
+        self.assertIsNotNone(Project.objects.get().updated_at)
+
+
+class DumpSnapshotTestCase(SimpleTestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = Path(tmp_dir.name)
+
+        # A live database in WAL mode, as in production, the test databases stay untouched
+        self.connections = ConnectionHandler({
+            'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'},
+            'live': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': self.tmp_dir / 'live.sqlite3',
+                'OPTIONS': settings.SQLITE_PRODUCTION_OPTIONS,
+            },
+        })
+        self.writer = self.connections['live']
+        self.addCleanup(self.writer.close)
+
+        with self.writer.schema_editor(atomic=False) as editor:
+            editor.create_model(Tag)
+            editor.create_model(Task)
+        with self.writer.cursor() as cursor:
+            cursor.execute("INSERT INTO tasks_tag (name) VALUES ('Backend'), ('DevOPS')")
+
+        connections_patcher = patch('apps.core.utils.ndjson_dump.connections', self.connections)
+        connections_patcher.start()
+        self.addCleanup(connections_patcher.stop)
+
+    def test_writes_during_a_dump(self):
+        def write(label, rows):
+            if label != 'tasks.tag':
+                return
+            # Committed after the tags were read, before the links are
+            with self.writer.cursor() as cursor:
+                cursor.execute('PRAGMA foreign_keys = OFF')
+                cursor.execute("INSERT INTO tasks_tag (name) VALUES ('Frontend')")
+                cursor.execute('INSERT INTO tasks_task_tags (task_id, tag_id) VALUES (1, 3)')
+
+        dump(self.tmp_dir / 'dump', using='live', app_labels=('tasks',), progress=write)
+
+        rows = {entry['model']: entry['rows'] for entry in read_manifest(self.tmp_dir / 'dump')['models']}
+        self.assertEqual(rows, {'tasks.tag': 2, 'tasks.task': 0, 'tasks.task_tags': 0})
+        with self.writer.cursor() as cursor:
+            cursor.execute('SELECT count(*) FROM tasks_task_tags')
+            self.assertEqual(cursor.fetchone(), (1,))
+
+
+class IterJSONArrayTestCase(TestCase):
+    def test_small_chunks(self):
+        document = [{'pk': i, 'fields': {'name': f'item {i}', 'value': 10 ** i}} for i in range(20)] + [123456, 'end']
+        text = json.dumps(document, indent=2)
+
+        self.assertEqual(list(iter_json_array(io.StringIO(text), chunk_size=7)), document)
+
+    def test_truncated_document(self):
+        with self.assertRaises(DumpError):
+            list(iter_json_array(io.StringIO('[{"pk": 1}, {"pk": 2'), chunk_size=4))
@@ -0,0 +1,83 @@
+import json
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from apps.core.middleware import query_budget
+from apps.core.middleware.query_budget import QueryBudgetExceeded, RouteQueryStats
+from apps.core.testing import assert_query_budget
+from apps.tasks.models import Tag
+from apps.tasks.views.tag_views import TagListAPIView
+
+
+class QueryBudgetMiddlewareTestCase(TestCase):
+    def setUp(self):
+        Tag.objects.create(name='Budget')
+
+        stats_patcher = patch.object(query_budget, 'route_stats', RouteQueryStats(window=10))
+        self.stats = stats_patcher.start()
+        self.addCleanup(stats_patcher.stop)
+
+    def test_within_budget(self):
+        response = self.client.get(reverse('tag-list'))
+        self.assertEqual(response.status_code, 200)
+
+        snapshot = self.stats.snapshot()['tag-list']
+        self.assertEqual(snapshot['requests'], 1)
+        self.assertEqual(snapshot['over_budget'], 0)
+        self.assertEqual(snapshot['budget'], 2)
+        self.assertEqual(snapshot['samples'][0][0], 2)
+
+    @patch.object(TagListAPIView, 'query_budget', {'GET': 1})
+    def test_over_budget_raises_in_tests(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get(reverse('tag-list'))
+
+    @override_settings(QUERY_BUDGET={'RAISE': False})
+    @patch.object(TagListAPIView, 'query_budget', {'GET': 1})
+    def test_over_budget_logs_warning(self):
+        with self.assertLogs('apps.core.middleware.query_budget', level='WARNING') as logs:
+            response = self.client.get(reverse('tag-list'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('tag-list ran 2 queries', logs.output[0])
+        self.assertEqual(self.stats.snapshot()['tag-list']['over_budget'], 1)
+
+    @override_settings(QUERY_BUDGET={'RAISE': True, 'DEFAULT': 0})
+    def test_default_budget_for_views_without_one(self):
+        with patch.object(TagListAPIView, 'query_budget', None):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get(reverse('tag-list'))
+
+    def test_assert_query_budget_helper(self):
+        with assert_query_budget(TagListAPIView):
+            self.client.get(reverse('tag-list'))
+
+        with self.assertRaises(QueryBudgetExceeded):
+            with assert_query_budget(TagListAPIView):
+                self.client.get(reverse('tag-list'))
+                self.client.get(reverse('tag-list'))
+
+
+class QueryBudgetReportTestCase(TestCase):
+    def test_report_merges_worker_files(self):
+        stats = RouteQueryStats(window=10)
+        stats.record('task-list', 3, 1.5, 3, False)
+        stats.record('task-list', 5, 2.5, 3, True)
+
+        with tempfile.TemporaryDirectory() as report_dir:
+            stats.flush(report_dir, force=True)
+            # a second worker process with the same numbers
+            with open(f'{report_dir}/query-budget-0.json', 'w') as f:
+                json.dump(stats.snapshot(), f)
+
+            out = StringIO()
+            call_command('query_budget_report', dir=report_dir, json=True, stdout=out)
+            summary = json.loads(out.getvalue())
+
+        self.assertEqual(summary['task-list']['requests'], 4)
+        self.assertEqual(summary['task-list']['over_budget'], 2)
+        self.assertEqual(summary['task-list']['queries_max'], 5)
+        self.assertEqual(summary['task-list']['budget'], 3)
@@ -0,0 +1,124 @@
+from io import StringIO
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from apps.core import response_cache
+from apps.projects.models import Project, ProjectFile
+from apps.tasks.models import Tag, Task
+from apps.tasks.utils.bulk_tasks import bulk_transition_tasks
+from apps.users.models import User
+
+RESPONSE_CACHE = {
+    'ENABLED': True,
+    'ALIAS': 'responses',
+    'TIMEOUT': 300,
+    'KEY_PREFIX': 'test-rc',
+    'MODELS': ['tasks.Tag', 'tasks.Task', 'projects.Project', 'projects.ProjectFile', 'users.User'],
+}
+
+
+@override_settings(RESPONSE_CACHE=RESPONSE_CACHE)
+class ResponseCacheTestCase(TestCase):
+    def setUp(self):
+        caches['responses'].clear()
+        Tag.objects.create(name='Cached')
+
+    def test_second_request_is_served_from_cache(self):
+        url = reverse('tag-list')
+        first = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(
+            response_cache.get_stats()['TagListAPIView.get'],
+            {'hit': 1, 'miss': 1},
+        )
+
+    def test_query_params_are_part_of_the_key(self):
+        Project.objects.create(name='First', description='Project listed by the cached endpoint.')
+        Project.objects.create(name='Second', description='Project listed by the cached endpoint.')
+        url = reverse('project-list')
+
+        small = self.client.get(url, {'page_size': 1})
+        default = self.client.get(url)
+
+        self.assertEqual(len(small.data['results']), 1)
+        self.assertEqual(len(default.data['results']), 2)
+
+    def test_write_invalidates_after_commit(self):
+        url = reverse('tag-list')
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Tag.objects.create(name='Fresh')
+
+        response = self.client.get(url)
+        self.assertIn('Fresh', [tag['name'] for tag in response.data])
+
+    def test_m2m_change_invalidates(self):
+        project = Project.objects.create(name='Files', description='Project the cached files belong to.')
+        project_file = ProjectFile.objects.create(file_name='spec.pdf', file_path='documents/spec.pdf')
+        url = reverse('project-file-list')
+
+        self.assertEqual(self.client.get(url).data[0]['project'], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            project.files.add(project_file)
+
+        self.assertEqual(self.client.get(url).data[0]['project'], [project.pk])
+
+    def test_bulk_task_writes_bump_the_version(self):
+        project = Project.objects.create(name='Bulk', description='Project of the bulk updated tasks.')
+        Task.objects.create(name='Bulk task', description='Task moved by a bulk transition.', project=project)
+        before = response_cache.get_versions(['tasks.Task'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_transition_tasks(Task.objects.all(), {'status': 'IN_PROGRESS'})
+
+        self.assertNotEqual(response_cache.get_versions(['tasks.Task']), before)
+
+    def test_project_list_counters_stay_fresh(self):
+        project = Project.objects.create(name='Counted', description='Project whose counters are cached.')
+        project_file = ProjectFile.objects.create(file_name='spec.pdf', file_path='documents/spec.pdf')
+        url = reverse('project-list')
+
+        def counters() -> dict:
+            row = self.client.get(url).data['results'][0]
+            return {field: row[field] for field in ('tasks_count', 'open_tasks_count', 'files_count', 'users_count')}
+
+        self.assertEqual(counters(), {'tasks_count': 0, 'open_tasks_count': 0, 'files_count': 0, 'users_count': 0})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(name='Counted task', description='Task counted by the summary.', project=project)
+        self.assertEqual(counters()['tasks_count'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_transition_tasks(Task.objects.all(), {'status': 'CLOSED'})
+        self.assertEqual(counters()['open_tasks_count'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            project.files.add(project_file)
+        self.assertEqual(counters()['files_count'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create(username='counted_user', email='counted@example.com', project=project)
+        self.assertEqual(counters()['users_count'], 1)
+
+    def test_lost_version_never_matches_an_old_one(self):
+        key = response_cache.version_key('tasks.Tag')
+        old = response_cache.get_versions(['tasks.Tag'])
+        caches['responses'].delete(key)
+
+        self.assertGreater(response_cache.get_versions(['tasks.Tag'])[0], old[0])
+
+    def test_stats_command(self):
+        self.client.get(reverse('tag-list'))
+        out = StringIO()
+        call_command('response_cache_stats', '--reset', stdout=out)
+
+        self.assertIn('TagListAPIView.get', out.getvalue())
+        self.assertEqual(response_cache.get_stats()['TagListAPIView.get'], {'hit': 0, 'miss': 0})
@@ -0,0 +1,106 @@
+import pstats
+import re
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from apps.core.middleware.server_timing import ProfileSampler
+from apps.tasks.models import Tag
+from apps.users.models import User
+
+
+def parse_server_timing(header: str) -> dict:
+    return {
+        entry.split(';')[0]: dict(param.split('=', 1) for param in entry.split(';')[1:])
+        for entry in re.split(r',\s*', header)
+    }
+
+
+class ServerTimingTestCase(TestCase):
+    def setUp(self):
+        Tag.objects.create(name='Timed')
+
+        profile_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(profile_dir.cleanup)
+        self.profile_dir = Path(profile_dir.name)
+
+        settings_override = override_settings(SERVER_TIMING={'PROFILE_DIR': self.profile_dir, 'PROFILE_LIMIT': 2})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        sampler_patcher = patch('apps.core.middleware.server_timing.sampler', ProfileSampler())
+        sampler_patcher.start()
+        self.addCleanup(sampler_patcher.stop)
+
+        self.staff = User.objects.create(username='staff_user', email='staff@example.com', is_staff=True)
+        self.user = User.objects.create(username='plain_user', email='plain@example.com')
+
+    def test_phases(self):
+        response = self.client.get(reverse('tag-list'))
+        timings = parse_server_timing(response['Server-Timing'])
+
+        self.assertEqual(list(timings), ['db', 'serialize', 'render', 'app', 'total'])
+        self.assertEqual(timings['db']['desc'], '"2 queries"')
+        self.assertGreater(float(timings['serialize']['dur']), 0)
+        self.assertGreater(float(timings['render']['dur']), 0)
+
+        parts = sum(float(timings[name]['dur']) for name in ('db', 'serialize', 'render', 'app'))
+        self.assertAlmostEqual(parts, float(timings['total']['dur']), delta=0.05)
+        self.assertNotIn('X-Profile-Dump', response)
+
+    async def test_async_views_are_timed(self):
+        response = await self.async_client.get(reverse('async-tag-list'))
+        timings = parse_server_timing(response['Server-Timing'])
+
+        self.assertEqual(timings['db']['desc'], '"2 queries"')
+
+    def test_other_paths_are_not_timed(self):
+        response = self.client.get('/')
+        self.assertNotIn('Server-Timing', response)
+
+    # The session and user lookups of a logged-in client don't fit the view budget
+    @override_settings(QUERY_BUDGET={'ENABLED': False})
+    def test_staff_profile_capture(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('tag-list'), headers={'X-Profile': '1'})
+
+        dump = self.profile_dir / response['X-Profile-Dump']
+        self.assertTrue(dump.exists())
+        self.assertIn('-GET-tag-list-', dump.name)
+        stats = pstats.Stats(str(dump))
+        self.assertTrue(any(name == 'get_objects' for _, _, name in stats.stats))
+
+    @override_settings(QUERY_BUDGET={'ENABLED': False})
+    def test_profile_needs_staff(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('tag-list'), {'_profile': 1})
+
+        self.assertIn('Server-Timing', response)
+        self.assertNotIn('X-Profile-Dump', response)
+        self.assertEqual(list(self.profile_dir.iterdir()), [])
+
+    @override_settings(QUERY_BUDGET={'ENABLED': False})
+    def test_sampling_limit(self):
+        self.client.force_login(self.staff)
+        responses = [self.client.get(reverse('tag-list'), {'_profile': 1}) for _ in range(3)]
+
+        self.assertEqual(['X-Profile-Dump' in response for response in responses], [True, True, False])
+        self.assertEqual(len(list(self.profile_dir.glob('*.prof'))), 2)
+
+
+class ProfileSamplerTestCase(TestCase):
+    def test_one_capture_at_a_time(self):
+        sampler = ProfileSampler()
+
+        self.assertTrue(sampler.acquire(limit=5, window=60))
+        self.assertFalse(sampler.acquire(limit=5, window=60))
+        sampler.release()
+        self.assertTrue(sampler.acquire(limit=5, window=60))
+
+    def test_window_expires(self):
+        sampler = ProfileSampler()
+
+        self.assertTrue(sampler.acquire(limit=1, window=0))
+        sampler.release()
+        self.assertTrue(sampler.acquire(limit=1, window=0))
@@ -0,0 +1,496 @@
+import csv
+import gc
+import hashlib
+import io
+import json
+import platform
+import random
+import time
+import tracemalloc
+from collections import Counter
+from datetime import timedelta
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.test import Client
+from django.urls import NoReverseMatch, URLResolver, reverse
+from django.utils import timezone
+from apps.core.utils.query_tracker import QueryTracker
+from apps.core.utils.stats import percentile
+
+DEFAULT_DATASET = {
+    'projects': 20,
+    'tasks': 2000,
+    'tags': 30,
+    'users': 50,
+    'files': 40,
+}
+
+# Latency and allocations may grow by the threshold or by these absolute
+# amounts, whichever is larger, before a route counts as regressed
+LATENCY_METRICS = ('p50_ms',)
+MIN_LATENCY_DELTA_MS = 2.0
+MIN_ALLOC_DELTA_KIB = 16
+
+# Slow routes (password hashing on register) stop early once they have enough samples
+MAX_ROUTE_SECONDS = 3
+MIN_SAMPLES = 5
+
+IMPORT_HEADER = ['name', 'description', 'priority', 'assignee', 'tags', 'deadline']
+
+WORDS = (
+    'report', 'release', 'backend', 'frontend', 'invoice', 'migration', 'review', 'deploy',
+    'customer', 'dashboard', 'search', 'export', 'payment', 'onboarding', 'cache', 'metrics',
+)
+
+
+def iter_route_names(patterns=None):
+    """Names of every route under ``apps/routers.py``, in URLconf order."""
+    if patterns is None:
+        from apps.routers import urlpatterns as patterns
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_route_names(pattern.url_patterns)
+        elif pattern.name:
+            yield pattern.name
+
+
+def csv_content(rows: list[list]) -> bytes:
+    stream = io.StringIO()
+    csv.writer(stream).writerows(rows)
+    return stream.getvalue().encode()
+
+
+def seed_dataset(projects: int, tasks: int, tags: int, users: int, files: int, seed: int = 0) -> dict:
+    """
+    Fills the (empty, freshly migrated) database with a reproducible dataset
+    and returns the ids the scenarios need. Everything goes in with
+    ``bulk_create``; the aggregates the receivers would keep up are rebuilt
+    at the end.
+    """
+    from apps.projects.models import Project
+    from apps.projects.utils.blob_storage import store_file
+    from apps.projects.utils.project_counters import reconcile_counters
+    from apps.tasks.choices.priorities import Priority
+    from apps.tasks.choices.statuses import Statuses
+    from apps.tasks.models import Tag, Task
+    from apps.tasks.utils.task_summary import rebuild_summaries
+    from apps.users.models import User
+
+    rng = random.Random(seed)
+    now = timezone.now()
+
+    project_rows = Project.objects.bulk_create([
+        Project(name=f'Bench project {i:04d}', description=f'Benchmark project number {i} with its tasks and files.')
+        for i in range(projects)
+    ])
+    tag_rows = Tag.objects.bulk_create([Tag(name=f'bench-tag-{i:04d}') for i in range(tags)])
+
+    password = make_password('bench-password')
+    user_rows = User.objects.bulk_create([
+        User(
+            username=f'bench_user_{i}',
+            first_name='Bench',
+            last_name=f'User{i}',
+            email=f'bench{i}@example.com',
+            password=password,
+            project=rng.choice(project_rows),
+        )
+        for i in range(users)
+    ])
+
+    statuses = [task_status.name for task_status in Statuses]
+    priorities = [value for value, _ in Priority.choices()]
+    task_rows = Task.objects.bulk_create([
+        Task(
+            name=f'Bench task {i:06d}',
+            description=f"Benchmark task about the {' '.join(rng.sample(WORDS, 4))} work, number {i}.",
+            status=rng.choice(statuses),
+            priority=rng.choice(priorities),
+            project=rng.choice(project_rows),
+            assignee=rng.choice(user_rows) if user_rows and rng.random() < 0.8 else None,
+            deadline=now + timedelta(days=rng.randint(-30, 90), minutes=rng.randint(0, 1440)),
+        )
+        for i in range(tasks)
+    ], batch_size=500)
+
+    if tag_rows:
+        Task.tags.through.objects.bulk_create([
+            Task.tags.through(task_id=task.pk, tag_id=tag.pk)
+            for task in task_rows
+            for tag in rng.sample(tag_rows, rng.randint(0, min(3, len(tag_rows))))
+        ], batch_size=1000)
+
+    deadline = (now + timedelta(days=10)).isoformat()
+    file_rows = []
+    for i in range(files):
+        # Every fourth upload repeats an earlier one, as re-uploads do
+        content_id = i - i % 4 if i % 4 == 3 else i
+        rows = [IMPORT_HEADER] + [
+            [f'Imported bench task {content_id}-{row}', 'Task imported by the benchmark, long enough to be valid.',
+             3, '', '', deadline]
+            for row in range(20)
+        ]
+        file_rows.append(store_file(f'bench-{i:04d}.csv', [csv_content(rows)]))
+
+    if project_rows:
+        Project.files.through.objects.bulk_create([
+            Project.files.through(project_id=project_rows[i % len(project_rows)].pk, projectfile_id=project_file.pk)
+            for i, project_file in enumerate(file_rows)
+        ])
+
+    rebuild_summaries()
+    reconcile_counters()
+
+    return {
+        'project': project_rows[0].pk if project_rows else None,
+        'project_name': project_rows[0].name if project_rows else None,
+        'task': task_rows[0].pk if task_rows else None,
+        'task_ids': [task.pk for task in task_rows[:20]],
+        'tag': tag_rows[0].pk if tag_rows else None,
+        'tag_ids': [tag.pk for tag in tag_rows[:2]],
+        'file': file_rows[0].pk if file_rows else None,
+    }
+
+
+def open_upload_session(client: Client, data: dict) -> None:
+    """Opens the upload session the upload scenarios work with; adds its id to ``data``."""
+    content = b'name,description\nbench,upload\n'
+    response = client.post(reverse('upload-session-list'), {
+        'file_name': 'bench-upload.csv',
+        'size': len(content),
+        'project': data['project_name'],
+        'sha256': hashlib.sha256(content).hexdigest(),
+    }, content_type='application/json')
+
+    data['upload_session'] = response.data['id'] if response.status_code == 201 else None
+    data['upload_content'] = content
+
+
+# route name -> request. Writes run in a transaction that is rolled back,
+# so every iteration sees the same dataset.
+SCENARIOS = {
+    'task-list': lambda data: {'method': 'get', 'path': reverse('task-list')},
+    'task-detail': lambda data: {'method': 'get', 'path': reverse('task-detail', kwargs={'pk': data['task']})},
+    'task-export': lambda data: {'method': 'get', 'path': reverse('task-export') + f"?project={data['project_name']}"},
+    'task-bulk-create': lambda data: {
+        'method': 'post',
+        'path': reverse('task-bulk-create'),
+        'write': True,
+        'data': [
+            {
+                'name': f'Bench bulk task {i}',
+                'description': 'Task created by the benchmark of the bulk endpoint, long enough.',
+                'priority': 3,
+                'project': data['project_name'],
+                'tags': data['tag_ids'],
+            }
+            for i in range(20)
+        ],
+    },
+    'task-bulk-transition': lambda data: {
+        'method': 'post',
+        'path': reverse('task-bulk-transition'),
+        'write': True,
+        'data': {'ids': data['task_ids'], 'status': 'IN_PROGRESS'},
+    },
+    'tag-list': lambda data: {'method': 'get', 'path': reverse('tag-list')},
+    'tag-detail': lambda data: {'method': 'get', 'path': reverse('tag-detail', kwargs={'pk': data['tag']})},
+    'project-list': lambda data: {'method': 'get', 'path': reverse('project-list')},
+    'project-detail': lambda data: {'method': 'get', 'path': reverse('project-detail', kwargs={'pk': data['project']})},
+    'project-summary': lambda data: {'method': 'get', 'path': reverse('project-summary', kwargs={'pk': data['project']})},
+    'project-file-list': lambda data: {'method': 'get', 'path': reverse('project-file-list')},
+    'project-file-detail': lambda data: {
+        'method': 'get', 'path': reverse('project-file-detail', kwargs={'pk': data['file']}),
+    },
+    'project-file-download': lambda data: {
+        'method': 'get', 'path': reverse('project-file-download', kwargs={'pk': data['file']}),
+    },
+    'project-file-import': lambda data: {
+        'method': 'post', 'path': reverse('project-file-import', kwargs={'pk': data['file']}), 'write': True,
+    },
+    'upload-session-list': lambda data: {
+        'method': 'post',
+        'path': reverse('upload-session-list'),
+        'write': True,
+        'data': {
+            'file_name': 'bench-other.csv',
+            'size': 1024,
+            'project': data['project_name'],
+            'sha256': '0' * 64,
+        },
+    },
+    'upload-session-detail': lambda data: {
+        'method': 'get', 'path': reverse('upload-session-detail', kwargs={'pk': data['upload_session']}),
+    },
+    'upload-chunk': lambda data: {
+        'method': 'put',
+        'path': reverse('upload-chunk', kwargs={'pk': data['upload_session'], 'index': 0}),
+        'write': True,
+        'body': data['upload_content'],
+    },
+    'user-list': lambda data: {'method': 'get', 'path': reverse('user-list')},
+    'user-register': lambda data: {
+        'method': 'post',
+        'path': reverse('user-register'),
+        'write': True,
+        'data': {
+            'username': 'bench_new_user',
+            'first_name': 'Bench',
+            'last_name': 'Newcomer',
+            'email': 'bench-new@example.com',
+            'position': 'PROGRAMMER',
+            'password': 'xK9#bench-Passw0rd',
+            're_password': 'xK9#bench-Passw0rd',
+        },
+    },
+    'async-task-list': lambda data: {'method': 'get', 'path': reverse('async-task-list')},
+    'async-task-detail': lambda data: {
+        'method': 'get', 'path': reverse('async-task-detail', kwargs={'pk': data['task']}),
+    },
+    'async-tag-list': lambda data: {'method': 'get', 'path': reverse('async-tag-list')},
+    'async-project-list': lambda data: {'method': 'get', 'path': reverse('async-project-list')},
+    'async-project-detail': lambda data: {
+        'method': 'get', 'path': reverse('async-project-detail', kwargs={'pk': data['project']}),
+    },
+}
+
+# Routes that can't be repeated against the same dataset
+SKIPPED_ROUTES = {
+    'upload-session-commit': "moves the assembled upload into blob storage, a rollback can't undo that",
+}
+
+
+def send(client: Client, request: dict):
+    method = getattr(client, request['method'])
+
+    if 'body' in request:
+        response = method(request['path'], request['body'], content_type='application/octet-stream')
+    elif 'data' in request:
+        response = method(request['path'], request['data'], content_type='application/json')
+    else:
+        response = method(request['path'])
+
+    if response.streaming:
+        # The rows of a streamed response are only queried and rendered now
+        for _ in response.streaming_content:
+            pass
+    response.close()
+
+    return response
+
+
+def perform(client: Client, request: dict):
+    if not request.get('write'):
+        return send(client, request)
+
+    with transaction.atomic():
+        response = send(client, request)
+        transaction.set_rollback(True)
+
+    return response
+
+
+def measure_route(client: Client, request: dict, requests: int, warmup: int, alloc_samples: int) -> dict:
+    """
+    Latency and queries of ``requests`` calls after ``warmup`` untimed ones,
+    then the peak traced memory of ``alloc_samples`` more calls. tracemalloc
+    slows everything down, so it never runs during the timed calls.
+    """
+    deadline = time.monotonic() + MAX_ROUTE_SECONDS
+    latencies = []
+    queries = []
+    statuses = Counter()
+    # Garbage left by the previous route would be collected on this one's clock
+    gc.collect()
+
+    for i in range(warmup + requests):
+        tracker = QueryTracker()
+        started = time.perf_counter()
+        with tracker.track():
+            response = perform(client, request)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        if i >= warmup:
+            latencies.append(elapsed)
+            queries.append(tracker.count)
+            statuses[response.status_code] += 1
+
+        if len(latencies) >= MIN_SAMPLES and time.monotonic() > deadline:
+            break
+
+    peaks = []
+    for _ in range(alloc_samples):
+        tracemalloc.start()
+        try:
+            perform(client, request)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peaks.append(peak / 1024)
+
+    return {
+        'method': request['method'].upper(),
+        'requests': len(latencies),
+        'status': dict(sorted((str(code), amount) for code, amount in statuses.items())),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p95_ms': round(percentile(latencies, 95), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'mean_ms': round(sum(latencies) / len(latencies), 3) if latencies else 0,
+        'queries': max(queries, default=0),
+        'alloc_peak_kib': round(max(peaks, default=0), 1),
+    }
+
+
+def measure_rounds(client: Client, scenarios: dict, measured: dict, rounds: int, **options) -> None:
+    """Measures ``scenarios`` ``rounds`` times, ``measured`` keeps the fastest round (by p50) of each."""
+    for _ in range(max(rounds, 1)):
+        for name, request in scenarios.items():
+            result = measure_route(client, request, **options)
+            best = measured.get(name)
+            if best is None or result['p50_ms'] < best['p50_ms']:
+                measured[name] = result
+
+
+def run_benchmarks(data: dict, routes=None, requests: int = 30, warmup: int = 5, alloc_samples: int = 3,
+                   rounds: int = 3, client: Client = None, recheck=None) -> dict:
+    """
+    Runs the scenario of every route; ``routes`` limits it to some route names.
+
+    The routes are measured ``rounds`` times, one after another, and each
+    keeps its fastest round (by p50): a burst of load on a shared machine
+    then spoils one round instead of the result. ``recheck(results)`` names
+    the routes that look slower than expected; they get ``rounds`` more
+    rounds, so a slowdown only stands when none of them was fast.
+    """
+    client = client or Client(raise_request_exception=False)
+    results = {'routes': {}, 'skipped': {}}
+    scenarios = {}
+
+    if 'upload_session' not in data:
+        open_upload_session(client, data)
+
+    for name in iter_route_names():
+        if routes and name not in routes:
+            continue
+
+        if name in SKIPPED_ROUTES:
+            results['skipped'][name] = SKIPPED_ROUTES[name]
+            continue
+
+        if name not in SCENARIOS:
+            results['skipped'][name] = "no scenario, add one to apps.core.utils.bench.SCENARIOS"
+            continue
+
+        try:
+            scenarios[name] = SCENARIOS[name](data)
+        except (KeyError, NoReverseMatch):
+            results['skipped'][name] = "the dataset has no rows for this route"
+
+    options = {'requests': requests, 'warmup': warmup, 'alloc_samples': alloc_samples}
+    measure_rounds(client, scenarios, results['routes'], rounds, **options)
+
+    if recheck is not None:
+        suspects = {name: scenarios[name] for name in recheck(results) if name in scenarios}
+        measure_rounds(client, suspects, results['routes'], rounds, **options)
+
+    return results
+
+
+def calibrate(rounds: int = 5) -> float:
+    """
+    Milliseconds a fixed pure-Python workload takes here (median of ``rounds``).
+    Latencies are compared relative to it, so a baseline recorded on another
+    machine or under a different load still gates meaningfully.
+    """
+    document = {'tasks': [{'id': i, 'name': f'task {i}', 'tags': list(range(i % 5))} for i in range(2000)]}
+    timings = []
+
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(5):
+            json.loads(json.dumps(document))
+            sorted(document['tasks'], key=lambda task: task['name'])
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return round(percentile(timings, 50), 3)
+
+
+def environment() -> dict:
+    return {
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'machine': platform.machine(),
+        'created_at': timezone.now().isoformat(timespec='seconds'),
+    }
+
+
+def exceeds(current: float, base: float, threshold: float, min_delta: float) -> bool:
+    return current > max(base * (1 + threshold), base + min_delta)
+
+
+def matched_routes(results: dict, baseline: dict):
+    """(name, current, base) of the routes measured in both; new routes aren't compared."""
+    for name, current in results['routes'].items():
+        base = baseline.get('routes', {}).get(name)
+        if base is not None:
+            yield name, current, base
+
+
+def compare_results(results: dict, baseline: dict, threshold: float,
+                    min_latency_delta_ms: float = MIN_LATENCY_DELTA_MS, timing: bool = True) -> list[str]:
+    """
+    Regressions of ``results`` against ``baseline``, one message each.
+
+    Query counts and status codes don't depend on the machine, so any extra
+    query or changed status set is a regression. Latency and allocations
+    count too unless ``timing`` is off, see ``compare_timings``.
+    """
+    regressions = []
+
+    for name, current, base in matched_routes(results, baseline):
+        if current['queries'] > base['queries']:
+            regressions.append(f"{name}: {current['queries']} queries per request, baseline {base['queries']}")
+
+        if set(current['status']) != set(base['status']):
+            regressions.append(f"{name}: status codes {current['status']}, baseline {base['status']}")
+
+    if timing:
+        regressions.extend(compare_timings(results, baseline, threshold, min_latency_delta_ms))
+
+    return regressions
+
+
+def compare_timings(results: dict, baseline: dict, threshold: float,
+                    min_latency_delta_ms: float = MIN_LATENCY_DELTA_MS) -> list[str]:
+    """
+    Routes whose p50 latency or peak allocations grew by more than
+    ``threshold`` (0.5 = 50%) and a small absolute amount; the tails of a
+    few dozen samples are too noisy to compare. Baseline latencies are
+    first scaled by how much slower this run's ``calibration_ms`` is.
+    """
+    return [message for _, message in timing_regressions(results, baseline, threshold, min_latency_delta_ms)]
+
+
+def timing_regressions(results: dict, baseline: dict, threshold: float,
+                       min_latency_delta_ms: float = MIN_LATENCY_DELTA_MS) -> list[tuple[str, str]]:
+    """(route name, message) of every slowdown, see ``compare_timings``."""
+    slower = []
+    scale = 1.0
+    if results.get('calibration_ms') and baseline.get('calibration_ms'):
+        scale = results['calibration_ms'] / baseline['calibration_ms']
+
+    for name, current, base in matched_routes(results, baseline):
+        for metric in LATENCY_METRICS:
+            expected = base[metric] * scale
+            if exceeds(current[metric], expected, threshold, min_latency_delta_ms):
+                slower.append((name, f"{name}: {metric} {current[metric]:.2f}, baseline {expected:.2f}"))
+
+        if exceeds(current['alloc_peak_kib'], base['alloc_peak_kib'], threshold, MIN_ALLOC_DELTA_KIB):
+            slower.append((
+                name,
+                f"{name}: peak allocations {current['alloc_peak_kib']:.0f} KiB, baseline {base['alloc_peak_kib']:.0f} KiB",
+            ))
+
+    return slower
@@ -0,0 +1,59 @@
+import fcntl
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def write_json_atomic(path: Path, data) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # A temporary file of its own, concurrent writers of ``path`` can't truncate it
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with open(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_json(path: Path, default=None):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # A file being replaced right now or left half written by a killed worker
+        return default
+
+
+def read_json_files(directory: Path, pattern: str) -> list:
+    directory = Path(directory)
+
+    if not directory.is_dir():
+        return []
+
+    documents = []
+    for path in sorted(directory.glob(pattern)):
+        document = read_json(path)
+        if document is not None:
+            documents.append(document)
+
+    return documents
+
+
+@contextmanager
+def file_lock(path: Path):
+    """An exclusive lock shared by every process, held on ``path``."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,500 @@
+"""
+Streaming database dumps: one NDJSON file per model plus ``manifest.json``.
+
+Every line of a model file is the JSON array of one row, in the column
+order listed in the manifest. Dumping streams each table with a server-side
+iterator, all of them inside one read transaction; loading reads the files
+line by line and inserts them in batches, so neither side holds more than
+one batch in memory.
+"""
+import datetime
+import decimal
+import gzip
+import json
+import uuid
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from django.apps import apps
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+from django.utils import timezone
+
+DUMP_FORMAT = 1
+MANIFEST_NAME = 'manifest.json'
+
+DUMP_APPS = ('projects', 'users', 'tasks')
+
+# Rebuilt after a load (task summaries) or short-lived state not worth restoring
+EXCLUDED_MODELS = {'tasks.projecttasksummary', 'projects.uploadsession', 'projects.uploadchunk'}
+
+DUMP_CHUNK_SIZE = 2000
+LOAD_BATCH_SIZE = 2000
+
+# Starts a transaction that reads every table as of one point in time,
+# without taking the write lock
+READ_SNAPSHOT_SQL = {
+    'sqlite': 'BEGIN DEFERRED',
+    'postgresql': 'BEGIN ISOLATION LEVEL REPEATABLE READ READ ONLY',
+    'mysql': 'START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY',
+}
+
+
+class DumpError(Exception):
+    pass
+
+
+class NDJSONEncoder(json.JSONEncoder):
+    """Like ``DjangoJSONEncoder``, but keeps the microseconds of datetimes."""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+            return o.isoformat()
+        if isinstance(o, datetime.timedelta):
+            return o.total_seconds()
+        if isinstance(o, (decimal.Decimal, uuid.UUID)):
+            return str(o)
+        return super().default(o)
+
+
+def model_label(model) -> str:
+    return model._meta.label_lower
+
+
+def columns(model) -> list[str]:
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def dump_models(app_labels=DUMP_APPS) -> list:
+    """
+    Models to dump in dependency order: every model comes after the models
+    its foreign keys point to, the many-to-many through rows come last.
+    """
+    candidates = [
+        model
+        for app_label in app_labels
+        for model in apps.get_app_config(app_label).get_models(include_auto_created=True)
+        if model_label(model) not in EXCLUDED_MODELS and not model._meta.proxy
+    ]
+    included = set(candidates)
+
+    def dependencies(model) -> set:
+        return {
+            field.related_model
+            for field in model._meta.concrete_fields
+            if field.is_relation and field.related_model is not model
+        }
+
+    # Through rows of relations to models outside the dump (user groups and permissions)
+    candidates = [
+        model for model in candidates
+        if not model._meta.auto_created or dependencies(model) <= included
+    ]
+
+    ordered = []
+    pending = [model for model in candidates if not model._meta.auto_created]
+    while pending:
+        ready = [model for model in pending if dependencies(model) & included <= set(ordered)]
+        if not ready:
+            raise DumpError(f"Circular foreign keys between {[model_label(model) for model in pending]}")
+        ordered.extend(ready)
+        pending = [model for model in pending if model not in ready]
+
+    return ordered + [model for model in candidates if model._meta.auto_created]
+
+
+def open_text(path: Path, mode: str):
+    if path.suffix == '.gz':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def write_manifest(directory: Path, entries: list[dict]) -> None:
+    manifest = {
+        'format': DUMP_FORMAT,
+        'created_at': timezone.now().isoformat(),
+        'models': entries,
+    }
+    (directory / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + '\n')
+
+
+def read_manifest(directory: Path) -> dict:
+    path = Path(directory) / MANIFEST_NAME
+    if not path.exists():
+        raise DumpError(f"{path} doesn't exist, is {directory} a dump?")
+
+    manifest = json.loads(path.read_text())
+    if manifest.get('format') != DUMP_FORMAT:
+        raise DumpError(f"Unsupported dump format {manifest.get('format')}, expected {DUMP_FORMAT}.")
+    return manifest
+
+
+def dump_file_name(position: int, model, compress: bool) -> str:
+    return f"{position:02d}-{model_label(model)}.ndjson" + ('.gz' if compress else '')
+
+
+@contextmanager
+def read_snapshot(using: str):
+    """
+    A connection of its own to ``using`` inside one read transaction, so the
+    tables of a dump agree with each other while the writers carry on.
+    ``atomic`` would take the write lock for the whole dump with the
+    IMMEDIATE transactions of the production profile. Inside a transaction
+    already the caller's connection is used: it reads one snapshot too, and
+    a new connection wouldn't see its uncommitted rows.
+    """
+    if connections[using].in_atomic_block:
+        yield connections[using]
+        return
+
+    connection = connections.create_connection(using)
+    if connection.vendor not in READ_SNAPSHOT_SQL:
+        raise DumpError(f"Consistent dumps of {connection.vendor} databases aren't supported.")
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(READ_SNAPSHOT_SQL[connection.vendor])
+        yield connection
+    finally:
+        # Ends the read transaction too
+        connection.close()
+
+
+def dump(directory, using: str = DEFAULT_DB_ALIAS, compress: bool = False,
+         chunk_size: int = DUMP_CHUNK_SIZE, app_labels=DUMP_APPS, progress=None) -> list[dict]:
+    """
+    Writes every model of ``app_labels`` to ``directory``, returns the
+    manifest entries. All the tables are read in one read transaction (see
+    ``read_snapshot``), so the dump is a point-in-time copy of a live database.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    encoder = NDJSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    entries = []
+
+    with read_snapshot(using) as connection:
+        for position, model in enumerate(dump_models(app_labels), start=1):
+            model_columns = columns(model)
+            file_name = dump_file_name(position, model, compress)
+            query = model._base_manager.order_by('pk').values_list(*model_columns).query
+            rows = query.get_compiler(connection=connection).results_iter(
+                tuple_expected=True, chunked_fetch=True, chunk_size=chunk_size,
+            )
+            count = 0
+
+            with open_text(directory / file_name, 'w') as stream:
+                for row in rows:
+                    stream.write(encoder.encode(row))
+                    stream.write('\n')
+                    count += 1
+
+            entries.append({'model': model_label(model), 'file': file_name, 'columns': model_columns, 'rows': count})
+            if progress:
+                progress(model_label(model), count)
+
+    write_manifest(directory, entries)
+    return entries
+
+
+# Columns whose JSON values the database drivers take as they are
+PASSTHROUGH_TYPES = {
+    'AutoField', 'BigAutoField', 'SmallAutoField', 'BigIntegerField', 'IntegerField',
+    'SmallIntegerField', 'PositiveIntegerField', 'PositiveSmallIntegerField',
+    'PositiveBigIntegerField', 'BooleanField', 'CharField', 'TextField', 'SlugField',
+}
+
+
+def value_converter(field, connection):
+    """``None`` when the dumped value goes to the driver unchanged."""
+    target = field.target_field if field.is_relation else field
+    if target.get_internal_type() in PASSTHROUGH_TYPES:
+        return None
+    return lambda value: None if value is None else field.get_db_prep_save(field.to_python(value), connection)
+
+
+def insert_rows(model, model_columns: list[str], rows, using: str, batch_size: int) -> int:
+    """
+    Inserts ``rows`` (lists of column values) with one ``executemany`` per
+    batch. Like ``loaddata``'s raw saves, ``auto_now`` fields keep the dumped
+    values and no signals are sent; only the values that need it (dates,
+    JSON, ...) go through their field's conversion.
+    """
+    connection = connections[using]
+    fields = {field.attname: field for field in model._meta.concrete_fields}
+    converters = [
+        (position, converter)
+        for position, column in enumerate(model_columns)
+        if (converter := value_converter(fields[column], connection)) is not None
+    ]
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        connection.ops.quote_name(model._meta.db_table),
+        ', '.join(connection.ops.quote_name(fields[column].column) for column in model_columns),
+        ', '.join(['%s'] * len(model_columns)),
+    )
+    inserted = 0
+    rows = iter(rows)
+
+    with connection.cursor() as cursor:
+        while batch := list(islice(rows, batch_size)):
+            for values in batch:
+                for position, converter in converters:
+                    values[position] = converter(values[position])
+
+            cursor.executemany(sql, batch)
+            inserted += len(batch)
+
+    return inserted
+
+
+def iter_dump_rows(path: Path):
+    with open_text(path, 'r') as stream:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+def with_missing_columns(model, entry: dict, rows):
+    """Fills the columns the model gained since the dump with their defaults."""
+    model_columns = list(entry['columns'])
+    if model._meta.auto_created:
+        # Through rows may come without ids, the database assigns them
+        return model_columns, rows
+
+    now = timezone.now().isoformat()
+    missing = [field for field in model._meta.concrete_fields if field.attname not in model_columns]
+    if not missing:
+        return model_columns, rows
+
+    defaults = [missing_value(field, now) for field in missing]
+    return model_columns + [field.attname for field in missing], (values + defaults for values in rows)
+
+
+def clear_apps(app_labels, using: str) -> None:
+    """Deletes every row of ``app_labels``, including the models left out of dumps."""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        for app_label in app_labels:
+            for model in apps.get_app_config(app_label).get_models(include_auto_created=True):
+                if not model._meta.proxy:
+                    cursor.execute(f'DELETE FROM {connection.ops.quote_name(model._meta.db_table)}')
+
+
+def load(directory, using: str = DEFAULT_DB_ALIAS, batch_size: int = LOAD_BATCH_SIZE,
+         replace: bool = False, progress=None) -> dict[str, int]:
+    """
+    Loads a dump into the (empty) tables in one transaction. Foreign keys are
+    checked once at the end, as ``loaddata`` does, so the order of the rows
+    doesn't matter. ``replace`` deletes the current rows first.
+    """
+    directory = Path(directory)
+    manifest = read_manifest(directory)
+    connection = connections[using]
+
+    plan = []
+    for entry in manifest['models']:
+        try:
+            model = apps.get_model(entry['model'])
+        except LookupError:
+            raise DumpError(f"The dump has rows of {entry['model']}, which isn't installed.")
+
+        unknown = set(entry['columns']) - set(columns(model))
+        if unknown:
+            raise DumpError(f"{entry['model']} has no columns {sorted(unknown)}, run migrate first.")
+        plan.append((model, entry))
+
+    loaded = {}
+    model_list = [model for model, _ in plan]
+
+    with transaction.atomic(using=using):
+        if replace:
+            clear_apps({model._meta.app_label for model in model_list}, using)
+        else:
+            not_empty = [model_label(model) for model in model_list if model._base_manager.using(using).exists()]
+            if not_empty:
+                raise DumpError(f"{', '.join(not_empty)} already have rows, load with replace to overwrite them.")
+
+        with connection.constraint_checks_disabled():
+            for model, entry in plan:
+                model_columns, rows = with_missing_columns(model, entry, iter_dump_rows(directory / entry['file']))
+                loaded[entry['model']] = insert_rows(model, model_columns, rows, using, batch_size)
+                if progress:
+                    progress(entry['model'], loaded[entry['model']])
+
+        connection.check_constraints(table_names=[model._meta.db_table for model in model_list])
+
+        # Explicit ids don't move the sequences on backends that have them
+        sequence_sql = connection.ops.sequence_reset_sql(no_style(), model_list)
+        if sequence_sql:
+            with connection.cursor() as cursor:
+                for sql in sequence_sql:
+                    cursor.execute(sql)
+
+    return loaded
+
+
+def iter_json_array(stream, chunk_size: int = 1 << 16):
+    """
+    Yields the items of a top-level JSON array one at a time, reading
+    ``stream`` in chunks instead of parsing the whole document.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+    eof = False
+
+    while True:
+        position = 0
+        length = len(buffer)
+
+        while True:
+            while position < length and buffer[position] in ' \t\r\n,':
+                position += 1
+
+            if not started and position < length:
+                if buffer[position] != '[':
+                    raise DumpError("The document isn't a JSON array.")
+                started = True
+                position += 1
+                continue
+
+            if position < length and buffer[position] == ']':
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # The item continues in the next chunk
+                break
+
+            # A number at the very end of the buffer may be cut short
+            if end == length and not eof:
+                break
+
+            yield item
+            position = end
+
+        if eof:
+            raise DumpError("Unexpected end of the JSON document.")
+
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+
+
+def open_dumpdata(path: Path):
+    """``dumpdata`` output in UTF-8 or, as ``db_backup.json``, UTF-16 with a BOM."""
+    with open(path, 'rb') as stream:
+        head = stream.read(4)
+
+    if head.startswith((b'\xff\xfe', b'\xfe\xff')):
+        encoding = 'utf-16'
+    else:
+        encoding = 'utf-8-sig'
+    return open(path, encoding=encoding)
+
+
+def normalize_choice(field, value):
+    # Rows written with the old non-str ``Statuses`` default hold "Statuses.NEW"
+    if field.choices and isinstance(value, str) and '.' in value:
+        valid = {str(choice) for choice, _ in field.flatchoices}
+        if value not in valid and value.rsplit('.', 1)[1] in valid:
+            return value.rsplit('.', 1)[1]
+    return value
+
+
+def missing_value(field, now: str):
+    if field.has_default():
+        default = field.get_default()
+        return default.isoformat() if isinstance(default, (datetime.date, datetime.datetime)) else default
+    if isinstance(field, models.DateTimeField) and not field.null:
+        # auto_now(_add) fields added after the backup was taken
+        return now
+    return None
+
+
+def convert_dumpdata(source, directory, compress: bool = False, app_labels=DUMP_APPS, progress=None) -> list[dict]:
+    """
+    Converts ``dumpdata`` JSON (such as ``db_backup.json``) into an NDJSON
+    dump of the current models, streaming both files. Fields the models
+    gained since the backup get their defaults; rows of models outside the
+    dump (permissions, sessions, ...) are dropped.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    encoder = NDJSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    now = timezone.now().isoformat()
+
+    model_list = dump_models(app_labels)
+    by_label = {model_label(model): model for model in model_list}
+    positions = {model: position for position, model in enumerate(model_list, start=1)}
+    # (model, field name) -> through model, for the m2m lists of dumpdata
+    throughs = {
+        (field.model, field.name): field.remote_field.through
+        for model in model_list
+        for field in model._meta.many_to_many
+        if field.remote_field.through in positions
+    }
+    # Through rows get new ids, only the two foreign keys are written
+    through_columns = {
+        field.remote_field.through: [
+            field.remote_field.through._meta.get_field(field.m2m_field_name()).attname,
+            field.remote_field.through._meta.get_field(field.m2m_reverse_field_name()).attname,
+        ]
+        for field in (model._meta.get_field(name) for model, name in throughs)
+    }
+
+    streams = {}
+    counts = dict.fromkeys(model_list, 0)
+
+    def write(model, values: list) -> None:
+        if model not in streams:
+            streams[model] = open_text(directory / dump_file_name(positions[model], model, compress), 'w')
+        streams[model].write(encoder.encode(values))
+        streams[model].write('\n')
+        counts[model] += 1
+
+    try:
+        with open_dumpdata(source) as stream:
+            for obj in iter_json_array(stream):
+                model = by_label.get(obj['model'])
+                if model is None:
+                    continue
+
+                fields = obj['fields']
+                values = []
+                for field in model._meta.concrete_fields:
+                    if field.primary_key:
+                        values.append(obj['pk'])
+                    elif field.name in fields:
+                        values.append(normalize_choice(field, fields[field.name]))
+                    else:
+                        values.append(missing_value(field, now))
+                write(model, values)
+
+                for field in model._meta.many_to_many:
+                    through = throughs.get((model, field.name))
+                    if through is None:
+                        continue
+                    for related_pk in fields.get(field.name, []):
+                        write(through, [obj['pk'], related_pk])
+    finally:
+        for output in streams.values():
+            output.close()
+
+    entries = []
+    for model in model_list:
+        file_name = dump_file_name(positions[model], model, compress)
+        if model not in streams:
+            # Empty file, so the manifest stays complete
+            open_text(directory / file_name, 'w').close()
+        entries.append({
+            'model': model_label(model),
+            'file': file_name,
+            'columns': through_columns.get(model, columns(model)),
+            'rows': counts[model],
+        })
+        if progress:
+            progress(model_label(model), counts[model])
+
+    write_manifest(directory, entries)
+    return entries
@@ -0,0 +1,45 @@
+from itertools import accumulate
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def escape_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{escape_label(value)}"' for name, value in labels.items()) + '}'
+
+
+def format_value(value) -> str:
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+class Exposition:
+    """Builds a document in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self.lines = []
+
+    def header(self, name: str, kind: str, help_text: str) -> None:
+        self.lines.append(f'# HELP {name} {help_text}')
+        self.lines.append(f'# TYPE {name} {kind}')
+
+    def sample(self, name: str, labels: dict, value) -> None:
+        self.lines.append(f'{name}{format_labels(labels)} {format_value(value)}')
+
+    def histogram(self, name: str, labels: dict, bounds, buckets: list, total) -> None:
+        """``buckets`` holds the count of every bucket alone, the last one is +Inf."""
+        cumulative = list(accumulate(buckets))
+
+        for bound, count in zip([*map(format_value, bounds), '+Inf'], cumulative):
+            self.sample(f'{name}_bucket', {**labels, 'le': bound}, count)
+        self.sample(f'{name}_sum', labels, total)
+        self.sample(f'{name}_count', labels, cumulative[-1])
+
+    def render(self) -> str:
+        return '\n'.join(self.lines) + '\n'
@@ -0,0 +1,63 @@
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import partial
+from django.db import connections
+
+_context_trackers = ContextVar('query_trackers', default=())
+
+
+class QueryTracker:
+    """
+    ``execute_wrapper`` that counts the queries and the time spent in SQL.
+
+    Unlike ``connection.queries`` it works with ``DEBUG = False`` and keeps
+    no SQL text, so it is cheap enough to run on every request.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+    @contextmanager
+    def track(self):
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+    @contextmanager
+    def track_context(self):
+        """
+        ``track()`` for async code. The async ORM runs the queries in
+        ``sync_to_async`` threads, on connections that are shared between
+        requests, so the tracker travels in a context variable instead and
+        ``count_in_context`` (installed on every connection) picks it up.
+        Nested trackers all see the queries, like nested ``track()`` calls.
+        """
+        token = _context_trackers.set((*_context_trackers.get(), self))
+        try:
+            yield self
+        finally:
+            _context_trackers.reset(token)
+
+
+def count_in_context(execute, sql, params, many, context):
+    for tracker in _context_trackers.get():
+        execute = partial(tracker, execute)
+
+    return execute(sql, params, many, context)
+
+
+def install_context_tracking(sender, connection, **kwargs) -> None:
+    """``connection_created`` receiver, see ``QueryTracker.track_context()``."""
+    if count_in_context not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_in_context)
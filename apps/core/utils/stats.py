@@ -0,0 +1,6 @@
+def percentile(values: list, pct: float):
+    """Nearest-rank percentile, 0 for no values."""
+    if not values:
+        return 0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
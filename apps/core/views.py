@@ -0,0 +1,51 @@
+import hmac
+from django.http import Http404, HttpResponse
+from apps.core.middleware.metrics import LATENCY_BUCKETS, QUERY_BUCKETS, SIZE_BUCKETS, get_metrics_settings, load_metrics
+from apps.core.utils.prometheus import CONTENT_TYPE, Exposition
+
+HISTOGRAM_METRICS = (
+    ('latency', 'http_request_duration_seconds', LATENCY_BUCKETS, "Time from the request to the response."),
+    ('queries', 'http_request_db_queries', QUERY_BUCKETS, "SQL queries run per request."),
+    ('size', 'http_response_size_bytes', SIZE_BUCKETS, "Body size of the responses, streamed ones of unknown size aside."),
+)
+
+
+def render_metrics(routes: dict) -> str:
+    exposition = Exposition()
+    routes = sorted(routes.items())
+
+    exposition.header('http_requests_total', 'counter', "Requests by URL name, method and status code.")
+    for (route, method), data in routes:
+        for status, count in sorted(data['status'].items()):
+            exposition.sample('http_requests_total', {'route': route, 'method': method, 'status': status}, count)
+
+    for key, name, bounds, help_text in HISTOGRAM_METRICS:
+        exposition.header(name, 'histogram', help_text)
+        for (route, method), data in routes:
+            exposition.histogram(name, {'route': route, 'method': method}, bounds, data[key]['buckets'], data[key]['sum'])
+
+    exposition.header('http_request_db_seconds_total', 'counter', "Time spent in SQL.")
+    for (route, method), data in routes:
+        exposition.sample('http_request_db_seconds_total', {'route': route, 'method': method}, data['sql_seconds'])
+
+    return exposition.render()
+
+
+def has_metrics_token(request, token) -> bool:
+    scheme, _, credentials = request.headers.get('Authorization', '').partition(' ')
+    if not token or scheme.lower() != 'bearer':
+        return False
+    return hmac.compare_digest(credentials.strip().encode(), token.encode())
+
+
+def metrics(request):
+    """
+    Request metrics of every worker in the Prometheus text format, for
+    scrapers sending ``METRICS['TOKEN']`` as a bearer token.
+    """
+    config = get_metrics_settings()
+
+    if not has_metrics_token(request, config['TOKEN']):
+        raise Http404
+
+    return HttpResponse(render_metrics(load_metrics(config['DIR'])), content_type=CONTENT_TYPE)
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from apps.projects.models import ProjectFile
+from apps.projects.utils.blob_storage import move_to_blob
+
+
+class Command(BaseCommand):
+    help = "Move project files stored under their own path into the deduplicated blob store."
+
+    def handle(self, *args, **options):
+        moved = missing = 0
+        blobs = set()
+
+        for project_file in ProjectFile.objects.filter(blob__isnull=True).iterator():
+            try:
+                blobs.add(move_to_blob(project_file).pk)
+            except FileNotFoundError:
+                missing += 1
+                self.stdout.write(self.style.WARNING(
+                    f"ProjectFile {project_file.pk}: {project_file.file_path.name} is missing on disk."
+                ))
+            else:
+                moved += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Moved {moved} files into {len(blobs)} blobs, {missing} missing."
+        ))
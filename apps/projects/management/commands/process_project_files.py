@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from apps.projects.models import ProjectFile
+from apps.projects.utils.file_processing import process_file
+
+
+class Command(BaseCommand):
+    help = (
+        "Extract the metadata of project files still waiting for it, e.g. files stored "
+        "before the processing existed or queued when a worker was restarted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--failed', action='store_true', help="Retry the files that failed as well.")
+        parser.add_argument('--stuck', action='store_true', help="Retry files left PROCESSING by a dead worker.")
+
+    def handle(self, *args, **options):
+        statuses = [ProjectFile.PENDING]
+        if options['failed']:
+            statuses.append(ProjectFile.FAILED)
+        if options['stuck']:
+            statuses.append(ProjectFile.PROCESSING)
+
+        results = {ProjectFile.DONE: 0, ProjectFile.FAILED: 0}
+        file_ids = ProjectFile.objects.filter(processing_status__in=statuses).values_list('pk', flat=True)
+
+        for file_id in file_ids.iterator():
+            result = process_file(file_id, statuses=statuses)
+            if result:
+                results[result] += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {results[ProjectFile.DONE]} files, {results[ProjectFile.FAILED]} failed."
+        ))
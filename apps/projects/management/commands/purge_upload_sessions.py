@@ -0,0 +1,28 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.projects.models import UploadSession
+from apps.projects.utils.upload_sessions import discard_session, get_upload_settings
+
+
+class Command(BaseCommand):
+    help = "Delete abandoned upload sessions together with their temporary files."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, help="Idle time after which an open session is abandoned, UPLOAD_SESSIONS['EXPIRE_HOURS'] by default.")
+
+    def handle(self, *args, **options):
+        hours = options['hours'] or get_upload_settings()['EXPIRE_HOURS']
+        cutoff = timezone.now() - timedelta(hours=hours)
+
+        # Served by the (status, updated_at) index; commits stuck by a crash included
+        sessions = UploadSession.objects.filter(
+            status__in=[UploadSession.OPEN, UploadSession.COMMITTING], updated_at__lt=cutoff
+        )
+        purged = 0
+
+        for session in sessions.iterator():
+            discard_session(session)
+            purged += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} abandoned upload sessions."))
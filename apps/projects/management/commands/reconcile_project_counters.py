@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.projects.utils.project_counters import find_counter_drift, reconcile_counters
+from apps.tasks.utils.task_summary import find_inconsistencies, rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the project file/user counters and the task counts (ProjectTaskSummary) "
+        "with the actual rows and repair the drifted ones."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help="Only report the drift and fail if there is any.")
+
+    def handle(self, *args, **options):
+        counters = find_counter_drift()
+        summaries = find_inconsistencies()
+
+        if not counters and not summaries:
+            self.stdout.write(self.style.SUCCESS("All project counters are consistent."))
+            return
+
+        for project_id, drift in counters.items():
+            details = ', '.join(f"{field}: {stored} != {actual}" for field, (stored, actual) in drift.items())
+            self.stdout.write(self.style.WARNING(f"Project {project_id}: {details}"))
+
+        for project_id, drift in summaries.items():
+            stored, actual = drift.get('total', (None, None))
+            details = f"tasks_count: {stored} != {actual}" if 'total' in drift else "task summary buckets"
+            self.stdout.write(self.style.WARNING(f"Project {project_id}: {details}"))
+
+        if options['check']:
+            raise CommandError(f"{len(set(counters) | set(summaries))} projects have drifted counters.")
+
+        if counters:
+            reconcile_counters(counters)
+        if summaries:
+            rebuild_summaries(summaries)
+
+        self.stdout.write(self.style.SUCCESS(f"Repaired the counters of {len(set(counters) | set(summaries))} projects."))
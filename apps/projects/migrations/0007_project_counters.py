@@ -0,0 +1,44 @@
+# Generated by Django 5.1 on 2026-10-18 18:33
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def fill_counters(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    User = apps.get_model('users', 'User')
+
+    files = models.Subquery(
+        Project.files.through.objects.filter(project_id=models.OuterRef('pk'))
+        .values('project_id').annotate(amount=models.Count('*')).values('amount')
+    )
+    users = models.Subquery(
+        User.objects.filter(project_id=models.OuterRef('pk'))
+        .values('project_id').annotate(amount=models.Count('*')).values('amount')
+    )
+    Project.objects.update(
+        files_count=Coalesce(files, 0),
+        users_count=Coalesce(users, 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_file_metadata'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='files_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='users_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-18 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0008_project_created_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='uploadsession',
+            name='status',
+            field=models.CharField(choices=[('OPEN', 'Open'), ('COMMITTING', 'Committing'), ('COMMITTED', 'Committed')], default='OPEN', max_length=10),
+        ),
+    ]
@@ -1,2 +1,4 @@
+from .file_blob import *
 from .project import *
 from .project_file import *
+from .upload_session import *
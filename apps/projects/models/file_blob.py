@@ -0,0 +1,25 @@
+from django.db import models
+
+
+class FileBlob(models.Model):
+    """
+    File contents stored once under their SHA-256 digest and shared by
+    every ``ProjectFile`` with the same bytes. ``ref_count`` is the number
+    of those files; the blob goes away with the last one.
+    """
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    size = models.BigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    @property
+    def storage_name(self) -> str:
+        return blob_storage_name(self.sha256)
+
+    def __str__(self):
+        return self.sha256
+
+
+def blob_storage_name(sha256: str) -> str:
+    # Two levels of fan-out keep the directories small
+    return f'blobs/{sha256[:2]}/{sha256[2:4]}/{sha256}'
@@ -5,14 +5,35 @@ class Project(models.Model):
     name = models.CharField(unique=True, max_length=100)
     description = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    # Also bumped when files are attached or detached, see apps.projects.receivers
+    updated_at = models.DateTimeField(auto_now=True)
     files = models.ManyToManyField('ProjectFile', related_name='project')
+    # Denormalized counters, see apps.projects.utils.project_counters
+    files_count = models.IntegerField(default=0)
+    users_count = models.IntegerField(default=0)
 
     @property
     def count_of_files(self):
-        return self.files.count()
+        return self.files_count
+
+    # Live tasks are already counted by apps.tasks in ProjectTaskSummary;
+    # select_related('task_summary') to read them without a query per project
+    @property
+    def tasks_count(self) -> int:
+        summary = getattr(self, 'task_summary', None)
+        return summary.total if summary is not None else 0
+
+    @property
+    def open_tasks_count(self) -> int:
+        summary = getattr(self, 'task_summary', None)
+        return summary.total - summary.status_closed if summary is not None else 0
 
     def __str__(self):
         return self.name
 
     class Meta:
         ordering = ['-name']
+        indexes = [
+            # Date range filter and cursor ordering of the project list
+            models.Index(fields=['created_at', 'id'], name='project_created_idx'),
+        ]
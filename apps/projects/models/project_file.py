@@ -1,9 +1,28 @@
 from django.db import models
+from apps.projects.models.file_blob import FileBlob
 
 
 class ProjectFile(models.Model):
+    PENDING = 'PENDING'
+    PROCESSING = 'PROCESSING'
+    DONE = 'DONE'
+    FAILED = 'FAILED'
+    PROCESSING_STATUSES = [
+        (PENDING, 'Pending'),
+        (PROCESSING, 'Processing'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+
     file_name = models.CharField(max_length=120)
+    # Points at the blob for files stored by content
     file_path = models.FileField(upload_to='documents/')
+    blob = models.ForeignKey(FileBlob, on_delete=models.PROTECT, null=True, blank=True, related_name='files')
+    # Filled in after the upload by apps.projects.utils.file_processing
+    mime_type = models.CharField(max_length=100, blank=True)
+    metadata = models.JSONField(default=dict, blank=True)
+    processing_status = models.CharField(max_length=10, choices=PROCESSING_STATUSES, default=PENDING)
+    processed_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
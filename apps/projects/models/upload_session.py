@@ -0,0 +1,62 @@
+import uuid
+from django.db import models
+from apps.projects.models.project import Project
+from apps.projects.models.project_file import ProjectFile
+
+
+class UploadSession(models.Model):
+    """
+    A file being uploaded in numbered chunks. The chunks are written into
+    a temporary file and the ``ProjectFile`` is only created on commit.
+    """
+    OPEN = 'OPEN'
+    # Claimed by a commit, no chunk is written any more
+    COMMITTING = 'COMMITTING'
+    COMMITTED = 'COMMITTED'
+    STATUSES = [(OPEN, 'Open'), (COMMITTING, 'Committing'), (COMMITTED, 'Committed')]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    file_name = models.CharField(max_length=120)
+    size = models.BigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+    # Optional checksum announced by the client, verified on commit
+    sha256 = models.CharField(max_length=64, blank=True)
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, null=True, blank=True, related_name='upload_sessions')
+    status = models.CharField(max_length=10, choices=STATUSES, default=OPEN)
+    project_file = models.OneToOneField(ProjectFile, on_delete=models.SET_NULL, null=True, blank=True, related_name='upload_session')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def chunk_count(self) -> int:
+        return max(1, -(-self.size // self.chunk_size))
+
+    def chunk_range(self, index: int) -> tuple[int, int]:
+        """(offset, length) of chunk ``index`` in the file."""
+        offset = index * self.chunk_size
+        return offset, min(self.chunk_size, self.size - offset)
+
+    def __str__(self):
+        return f"Upload of {self.file_name} ({self.status})"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'updated_at'], name='upload_status_updated_idx'),
+        ]
+
+
+class UploadChunk(models.Model):
+    session = models.ForeignKey(UploadSession, on_delete=models.CASCADE, related_name='chunks')
+    index = models.PositiveIntegerField()
+    size = models.PositiveIntegerField()
+    sha256 = models.CharField(max_length=64)
+    received_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Chunk {self.index} of {self.session_id}"
+
+    class Meta:
+        ordering = ['index']
+        constraints = [
+            models.UniqueConstraint(fields=['session', 'index'], name='upload_chunk_unique_index'),
+        ]
@@ -0,0 +1,41 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from apps.projects.models import Project, ProjectFile
+from apps.projects.utils.file_processing import queue_processing
+from apps.projects.utils.project_counters import recount_files
+
+
+@receiver(m2m_changed, sender=Project.files.through)
+def update_projects_on_files_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Recounts ``files_count``, which also bumps ``updated_at`` of the affected projects."""
+    if action == 'pre_clear' and reverse:
+        # The links are gone by post_clear
+        instance._cleared_project_ids = list(instance.project.values_list('pk', flat=True))
+        return
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        recount_files(pk=instance.pk)
+    elif action == 'post_clear':
+        recount_files(pk__in=instance.__dict__.pop('_cleared_project_ids', []))
+    else:
+        recount_files(pk__in=pk_set)
+
+
+@receiver(pre_delete, sender=ProjectFile)
+def remember_file_projects(sender, instance: ProjectFile, **kwargs):
+    # Deleting a file drops its links without m2m_changed
+    instance._project_ids = list(Project.objects.filter(files=instance).values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=ProjectFile)
+def update_projects_on_file_delete(sender, instance: ProjectFile, **kwargs):
+    recount_files(pk__in=getattr(instance, '_project_ids', []))
+
+
+@receiver(post_save, sender=ProjectFile)
+def queue_file_processing(sender, instance: ProjectFile, created: bool, **kwargs):
+    if created:
+        queue_processing(instance.pk)
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from apps.projects.models import ProjectFile
 from apps.projects.serializers.project_serializers import *
+from apps.projects.utils.blob_storage import store_file
 from apps.projects.utils.upload_file_helpers import *
 
 
@@ -37,17 +38,11 @@ class CreateProjectFileSerializer(serializers.ModelSerializer):
         return value
 
     def create(self, validated_data):
-        file_path = create_file_path(
-            file_name=validated_data['file_name']
-        )
         raw_file = self.context['request'].FILES['file_path']
 
         if check_file_size(file=raw_file):
-            save_file(file_path=file_path, file_content=raw_file)
-
-            validated_data['file_path'] = file_path
-
-            return ProjectFile.objects.create(**validated_data)
+            # Identical contents are stored once, whatever the file is called
+            return store_file(validated_data['file_name'], raw_file.chunks())
 
         else:
             raise serializers.ValidationError(
@@ -1,3 +1,6 @@
+from datetime import datetime, time, timedelta
+from django.db.models import QuerySet
+from django.utils import timezone
 from rest_framework import serializers
 from apps.projects.models import Project
 
@@ -6,7 +9,38 @@ class AllProjectsSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Project
-        fields = ('id', 'name', 'created_at')
+        fields = ('id', 'name', 'created_at', 'files_count', 'tasks_count', 'open_tasks_count', 'users_count')
+
+
+class ProjectListFilterSerializer(serializers.Serializer):
+    """
+    ``date_from``/``date_to`` (``YYYY-MM-DD``, both days included) become a
+    half-open ``created_at`` range served by ``project_created_idx``.
+    """
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+
+    def validate(self, data: dict) -> dict:
+        if data.get('date_from') and data.get('date_to') and data['date_from'] > data['date_to']:
+            raise serializers.ValidationError(
+                {"date_to": "The end of the date range couldn't be before its start"}
+            )
+        return data
+
+    @staticmethod
+    def start_of(day) -> datetime:
+        return timezone.make_aware(datetime.combine(day, time.min))
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        data = self.validated_data
+
+        if data.get('date_from'):
+            queryset = queryset.filter(created_at__gte=self.start_of(data['date_from']))
+
+        if data.get('date_to'):
+            queryset = queryset.filter(created_at__lt=self.start_of(data['date_to'] + timedelta(days=1)))
+
+        return queryset
 
 
 class CreateProjectSerializer(serializers.ModelSerializer):
@@ -29,7 +63,7 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Project
-        fields = ('id', 'name', 'description', 'count_of_files')
+        fields = ('id', 'name', 'description', 'count_of_files', 'files_count', 'tasks_count', 'users_count')
 
 
 class ProjectShortInfoSerializer(serializers.ModelSerializer):
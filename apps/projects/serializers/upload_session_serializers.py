@@ -0,0 +1,81 @@
+from rest_framework import serializers
+from apps.projects.models import Project, UploadChunk, UploadSession
+from apps.projects.utils.upload_file_helpers import check_extension
+from apps.projects.utils.upload_sessions import get_upload_settings
+
+
+class CreateUploadSessionSerializer(serializers.ModelSerializer):
+    project = serializers.SlugRelatedField(
+        slug_field='name',
+        queryset=Project.objects.all(),
+        required=False,
+    )
+    chunk_size = serializers.IntegerField(required=False, min_value=1)
+    sha256 = serializers.RegexField(r'^[0-9a-fA-F]{64}$', required=False)
+
+    class Meta:
+        model = UploadSession
+        fields = ('file_name', 'size', 'chunk_size', 'sha256', 'project')
+
+    def validate_file_name(self, value: str) -> str:
+        if not value.isascii() or '/' in value or '\\' in value:
+            raise serializers.ValidationError(
+                "Please, provide a valid file name."
+            )
+        if not check_extension(value):
+            raise serializers.ValidationError(
+                "Valid file extensions: ['.csv', '.doc', '.pdf', '.xlsx', '.py']"
+            )
+
+        return value
+
+    def validate_size(self, value: int) -> int:
+        max_size = get_upload_settings()['MAX_FILE_SIZE']
+
+        if not 0 < value <= max_size:
+            raise serializers.ValidationError(
+                f"The file size must be between 1 and {max_size} bytes."
+            )
+
+        return value
+
+    def validate_chunk_size(self, value: int) -> int:
+        max_chunk_size = get_upload_settings()['MAX_CHUNK_SIZE']
+
+        if value > max_chunk_size:
+            raise serializers.ValidationError(
+                f"The chunk size couldn't be more than {max_chunk_size} bytes."
+            )
+
+        return value
+
+    def validate(self, data: dict) -> dict:
+        data.setdefault('chunk_size', get_upload_settings()['CHUNK_SIZE'])
+        return data
+
+
+class UploadChunkSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = UploadChunk
+        fields = ('index', 'size', 'sha256')
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    project = serializers.SlugRelatedField(slug_field='name', read_only=True)
+    chunks = serializers.SerializerMethodField()
+    received = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadSession
+        fields = (
+            'id', 'file_name', 'size', 'chunk_size', 'chunks', 'received',
+            'sha256', 'project', 'status', 'project_file', 'created_at',
+        )
+
+    def get_chunks(self, obj: UploadSession) -> int:
+        return obj.chunk_count
+
+    def get_received(self, obj: UploadSession) -> list[int]:
+        """Indexes already stored: a resumed upload only sends the others."""
+        return list(obj.chunks.values_list('index', flat=True))
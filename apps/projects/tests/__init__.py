@@ -0,0 +1,8 @@
+from .blobs import *
+from .counters import *
+from .downloads import *
+from .file_processing import *
+from .project_files import *
+from .projects import *
+from .queries import *
+from .uploads import *
@@ -0,0 +1,111 @@
+import hashlib
+import os
+import tempfile
+from io import StringIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from apps.projects.models import FileBlob, Project, ProjectFile
+from apps.projects.utils.blob_storage import blob_path
+
+
+class FileBlobTestCase(TestCase):
+    def setUp(self):
+        self.media = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media.cleanup)
+        settings_override = override_settings(
+            MEDIA_ROOT=self.media.name,
+            UPLOAD_SESSIONS={'DIR': os.path.join(self.media.name, 'uploads'), 'CHUNK_SIZE': 8},
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.content = (
+            b'name,description\n'
+            b'Blob backed task,Stored once in the blob store whatever the uploaded file is called\n'
+        )
+        self.sha256 = hashlib.sha256(self.content).hexdigest()
+
+    def upload(self, file_name: str, content: bytes = None):
+        response = self.client.post(reverse('project-file-list'), {
+            'file_name': file_name,
+            'file_path': SimpleUploadedFile(file_name, content or self.content),
+        })
+        self.assertEqual(response.status_code, 201, response.data)
+        return ProjectFile.objects.get(file_name=file_name)
+
+    def delete(self, project_file: ProjectFile):
+        response = self.client.delete(reverse('project-file-detail', kwargs={'pk': project_file.pk}))
+        self.assertEqual(response.status_code, 200, response.data)
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self.upload('first.csv')
+        second = self.upload('second.csv')
+        other = self.upload('other.csv', b'name,description\n')
+
+        blob = FileBlob.objects.get(pk=self.sha256)
+        self.assertEqual((blob.size, blob.ref_count), (len(self.content), 2))
+        self.assertEqual(first.blob_id, second.blob_id)
+        self.assertEqual(first.file_path.name, second.file_path.name)
+        self.assertNotEqual(other.blob_id, blob.pk)
+        self.assertEqual(blob_path(self.sha256).read_bytes(), self.content)
+        # Only the blobs are left on disk, no temporary files
+        self.assertEqual(len(os.listdir(os.path.join(self.media.name, 'blobs'))), 2)
+
+    def test_blob_is_removed_with_its_last_file(self):
+        first = self.upload('first.csv')
+        second = self.upload('second.csv')
+
+        self.delete(first)
+        self.assertEqual(FileBlob.objects.get(pk=self.sha256).ref_count, 1)
+        self.assertTrue(blob_path(self.sha256).exists())
+
+        self.delete(second)
+        self.assertFalse(FileBlob.objects.filter(pk=self.sha256).exists())
+        self.assertFalse(blob_path(self.sha256).exists())
+
+    def test_chunked_upload_reuses_the_blob(self):
+        self.upload('first.csv')
+
+        response = self.client.post(reverse('upload-session-list'), {
+            'file_name': 'chunked.csv',
+            'size': len(self.content),
+        }, content_type='application/json')
+        session_id = response.data['id']
+
+        for index in range(response.data['chunks']):
+            self.client.put(
+                reverse('upload-chunk', kwargs={'pk': session_id, 'index': index}),
+                self.content[index * 8:(index + 1) * 8],
+                content_type='application/octet-stream',
+            )
+        response = self.client.post(reverse('upload-session-commit', kwargs={'pk': session_id}))
+        self.assertEqual(response.status_code, 201, response.data)
+
+        self.assertEqual(FileBlob.objects.get().ref_count, 2)
+        self.assertEqual(ProjectFile.objects.get(file_name='chunked.csv').file_path.read(), self.content)
+
+    def test_imports_read_blob_backed_files(self):
+        project = Project.objects.create(name='Blob Project', description='Project of the imported tasks.')
+        project_file = self.upload('tasks.csv')
+        project.files.add(project_file)
+
+        response = self.client.post(reverse('project-file-import', kwargs={'pk': project_file.pk}))
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response.data['created'], 1)
+
+    def test_move_legacy_files(self):
+        os.makedirs(os.path.join(self.media.name, 'documents'))
+        for name in ('a.csv', 'b.csv'):
+            with open(os.path.join(self.media.name, 'documents', name), 'wb') as stream:
+                stream.write(self.content)
+            ProjectFile.objects.create(file_name=name, file_path=f'documents/{name}')
+        ProjectFile.objects.create(file_name='gone.csv', file_path='documents/gone.csv')
+
+        out = StringIO()
+        call_command('move_files_to_blobs', stdout=out)
+
+        self.assertIn('Moved 2 files into 1 blobs, 1 missing', out.getvalue())
+        self.assertEqual(FileBlob.objects.get().ref_count, 2)
+        self.assertEqual(os.listdir(os.path.join(self.media.name, 'documents')), [])
@@ -0,0 +1,127 @@
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apps.projects.models import Project, ProjectFile
+from apps.tasks.models import Task
+from apps.users.models import User
+
+
+class ProjectCountersTestCase(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(name='Counter Project', description='Project whose counters are checked.')
+        self.other = Project.objects.create(name='Other Project', description='Second project for the moves.')
+        self.files = [
+            ProjectFile.objects.create(file_name=f'file_{i}.csv', file_path=f'documents/file_{i}.csv')
+            for i in range(3)
+        ]
+
+    def assertCounters(self, project: Project, **expected):
+        project.refresh_from_db()
+        self.assertEqual({field: getattr(project, field) for field in expected}, expected)
+
+    def create_user(self, username: str, project: Project = None) -> User:
+        return User.objects.create(
+            username=username,
+            first_name='counter',
+            last_name='user',
+            email=f'{username}@example.com',
+            password='1q9i2w8u3e7y4r6t5',
+            project=project,
+        )
+
+    def test_files_count(self):
+        self.project.files.add(*self.files[:2])
+        self.assertCounters(self.project, files_count=2)
+
+        # Already linked and never linked files must not change the count
+        self.project.files.add(self.files[0])
+        self.project.files.remove(self.files[0], self.files[2])
+        self.assertCounters(self.project, files_count=1)
+
+        self.files[2].project.add(self.project, self.other)
+        self.assertCounters(self.project, files_count=2)
+        self.assertCounters(self.other, files_count=1)
+
+        self.files[2].project.clear()
+        self.assertCounters(self.project, files_count=1)
+        self.assertCounters(self.other, files_count=0)
+
+        self.project.files.set(self.files)
+        self.files[0].delete()
+        self.assertCounters(self.project, files_count=2)
+
+        self.project.files.clear()
+        self.assertCounters(self.project, files_count=0)
+
+    def test_users_count(self):
+        user = self.create_user('counter_user', self.project)
+        self.create_user('second_user', self.project)
+        self.assertCounters(self.project, users_count=2)
+
+        user = User.objects.get(pk=user.pk)
+        user.project = self.other
+        user.save()
+        self.assertCounters(self.project, users_count=1)
+        self.assertCounters(self.other, users_count=1)
+
+        # The project wasn't loaded, the receiver has to look it up
+        user = User.objects.only('username').get(pk=user.pk)
+        user.project = None
+        user.save(update_fields=['project'])
+        self.assertCounters(self.other, users_count=0)
+
+        User.objects.get(username='second_user').delete()
+        self.assertCounters(self.project, users_count=0)
+
+    def test_counters_in_responses(self):
+        self.project.files.add(self.files[0])
+        self.create_user('counter_user', self.project)
+        Task.objects.create(
+            name='Counted task',
+            description='Task counted through the project task summary row.',
+            project=self.project,
+            deadline=timezone.now() + timezone.timedelta(days=3),
+        )
+        expected = {'files_count': 1, 'tasks_count': 1, 'users_count': 1}
+
+        detail = self.client.get(reverse('project-detail', kwargs={'pk': self.project.pk}))
+        self.assertEqual({field: detail.data[field] for field in expected}, expected)
+
+        listed = {project['id']: project for project in self.client.get(reverse('project-list')).data['results']}
+        self.assertEqual({field: listed[self.project.pk][field] for field in expected}, expected)
+
+    def test_task_changes_invalidate_the_etag(self):
+        url = reverse('project-detail', kwargs={'pk': self.project.pk})
+        etag = self.client.get(url)['ETag']
+
+        Task.objects.create(
+            name='Late task',
+            description='Task created after the client cached the project detail.',
+            project=self.project,
+            deadline=timezone.now() + timezone.timedelta(days=3),
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['tasks_count'], 1)
+
+    def test_reconcile_command(self):
+        self.project.files.add(*self.files)
+        self.create_user('counter_user', self.other)
+        Project.objects.filter(pk=self.project.pk).update(files_count=7)
+        Project.objects.filter(pk=self.other.pk).update(users_count=0)
+
+        with self.assertRaises(CommandError):
+            call_command('reconcile_project_counters', '--check', stdout=StringIO())
+
+        out = StringIO()
+        call_command('reconcile_project_counters', stdout=out)
+        self.assertIn('files_count: 7 != 3', out.getvalue())
+        self.assertCounters(self.project, files_count=3)
+        self.assertCounters(self.other, users_count=1)
+
+        out = StringIO()
+        call_command('reconcile_project_counters', '--check', stdout=out)
+        self.assertIn('consistent', out.getvalue())
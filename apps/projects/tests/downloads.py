@@ -0,0 +1,104 @@
+import os
+import tempfile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from apps.projects.models import ProjectFile
+
+
+class DownloadProjectFileTestCase(TestCase):
+    def setUp(self):
+        self.media = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=self.media.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.content = bytes(range(256)) * 40
+        self.client.post(reverse('project-file-list'), {
+            'file_name': 'data.csv',
+            'file_path': SimpleUploadedFile('data.csv', self.content),
+        })
+        self.project_file = ProjectFile.objects.get()
+        self.url = reverse('project-file-download', kwargs={'pk': self.project_file.pk})
+
+    def test_full_download(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        self.assertEqual(response['ETag'], f'"{self.project_file.blob_id}"')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="data.csv"')
+
+    def test_not_modified(self):
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=f'"{self.project_file.blob_id}"')
+        self.assertEqual(response.status_code, 304)
+
+    def test_ranges(self):
+        size = len(self.content)
+        cases = {
+            'bytes=0-99': (0, 99),
+            'bytes=10000-': (10000, size - 1),
+            'bytes=-24': (size - 24, size - 1),
+            'bytes=100-999999': (100, size - 1),
+        }
+        for header, (start, end) in cases.items():
+            with self.subTest(range=header):
+                response = self.client.get(self.url, HTTP_RANGE=header)
+
+                self.assertEqual(response.status_code, 206)
+                self.assertEqual(response['Content-Range'], f'bytes {start}-{end}/{size}')
+                self.assertEqual(int(response['Content-Length']), end - start + 1)
+                self.assertEqual(b''.join(response.streaming_content), self.content[start:end + 1])
+
+    def test_unsatisfiable_and_ignored_ranges(self):
+        response = self.client.get(self.url, HTTP_RANGE=f'bytes={len(self.content)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.content)}')
+
+        for header in ('bytes=0-1,5-6', 'items=0-1', 'bytes=9-3'):
+            with self.subTest(range=header):
+                self.assertEqual(self.client.get(self.url, HTTP_RANGE=header).status_code, 200)
+
+    def test_if_range(self):
+        etag = f'"{self.project_file.blob_id}"'
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=etag)
+        self.assertEqual(response.status_code, 206)
+
+        # The file changed since the first part was fetched: start over
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+
+    def test_legacy_file(self):
+        os.makedirs(os.path.join(self.media.name, 'documents'))
+        with open(os.path.join(self.media.name, 'documents', 'old.pdf'), 'wb') as stream:
+            stream.write(b'%PDF-1.4 legacy')
+        legacy = ProjectFile.objects.create(file_name='old.pdf', file_path='documents/old.pdf')
+        url = reverse('project-file-download', kwargs={'pk': legacy.pk})
+
+        response = self.client.get(url, HTTP_RANGE='bytes=0-3')
+        self.assertEqual(b''.join(response.streaming_content), b'%PDF')
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        os.remove(os.path.join(self.media.name, 'documents', 'old.pdf'))
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_sendfile_modes(self):
+        with override_settings(FILE_DOWNLOADS={'SENDFILE': 'x-accel-redirect', 'ACCEL_PREFIX': '/protected/'}):
+            response = self.client.get(self.url, HTTP_RANGE='bytes=0-9')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected/{self.project_file.file_path.name}')
+        self.assertEqual(response['ETag'], f'"{self.project_file.blob_id}"')
+
+        with override_settings(FILE_DOWNLOADS={'SENDFILE': 'x-sendfile'}):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response['X-Sendfile'], self.project_file.file_path.path)
@@ -0,0 +1,110 @@
+import os
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from apps.projects.models import ProjectFile
+from apps.projects.utils.file_metadata import pdf_metadata, text_metadata
+
+PDF = (
+    b'%PDF-1.4\n'
+    b'1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n'
+    b'2 0 obj << /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >> endobj\n'
+    b'3 0 obj << /Type /Page /Parent 2 0 R >> endobj\n'
+    b'4 0 obj << /Type/Page /Parent 2 0 R >> endobj\n'
+    b'%%EOF\n'
+)
+
+
+class FileProcessingTestCase(TestCase):
+    def setUp(self):
+        self.media = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=self.media.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def upload(self, file_name: str, content: bytes) -> ProjectFile:
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('project-file-list'), {
+                'file_name': file_name,
+                'file_path': SimpleUploadedFile(file_name, content),
+            })
+        self.assertEqual(response.status_code, 201, response.data)
+        return ProjectFile.objects.get(file_name=file_name)
+
+    def write(self, name: str, content: bytes) -> Path:
+        path = Path(self.media.name) / name
+        path.write_bytes(content)
+        return path
+
+    def test_metadata_of_each_type(self):
+        cases = [
+            ('tasks.csv', b'name,description\nfirst,a\nsecond,"multi\nline"\n', 'text/csv', {'rows': 2}),
+            ('report.pdf', PDF, 'application/pdf', {'pages': 2}),
+            ('script.py', b'import os\n\nprint(os.name)', 'text/x-python', {'lines': 3}),
+            ('notes.doc', b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1' + b'\0' * 8, 'application/msword', {}),
+        ]
+        for file_name, content, mime_type, metadata in cases:
+            with self.subTest(file_name=file_name):
+                project_file = self.upload(file_name, content)
+
+                self.assertEqual(project_file.processing_status, ProjectFile.DONE)
+                self.assertEqual(project_file.mime_type, mime_type)
+                self.assertEqual(project_file.metadata, {'size': len(content), **metadata})
+                self.assertIsNotNone(project_file.processed_at)
+
+    def test_detail_exposes_metadata(self):
+        project_file = self.upload('tasks.csv', b'name,description\nfirst,a\n')
+
+        with patch('apps.projects.utils.file_processing.extract_metadata') as extract:
+            response = self.client.get(reverse('project-file-detail', kwargs={'pk': project_file.pk}))
+
+        extract.assert_not_called()
+        self.assertEqual(response.data['processing_status'], ProjectFile.DONE)
+        self.assertEqual(response.data['metadata']['rows'], 1)
+        self.assertEqual(response.data['mime_type'], 'text/csv')
+
+    def test_same_contents_reuse_the_results(self):
+        first = self.upload('first.csv', b'name,description\nfirst,a\n')
+
+        with patch('apps.projects.utils.file_processing.extract_metadata') as extract:
+            second = self.upload('second.csv', b'name,description\nfirst,a\n')
+
+        extract.assert_not_called()
+        self.assertEqual(second.metadata, first.metadata)
+
+    def test_broken_file_fails(self):
+        project_file = self.upload('broken.xlsx', b'not a zip archive')
+
+        self.assertEqual(project_file.processing_status, ProjectFile.FAILED)
+        self.assertIn('error', project_file.metadata)
+
+    def test_pdf_markers_across_blocks(self):
+        # One marker split by the 64 KB block boundary, one "/Pages" that
+        # looks like a page until the next block
+        content = b'%PDF-1.4\n' + b' ' * (64 * 1024 - 9 - 5) + b'/Type /Page >>'
+        content += b' ' * (64 * 1024 - len(content) % (64 * 1024) - 11) + b'/Type /Page' + b's /Count 1 >>'
+        self.assertEqual(pdf_metadata(self.write('split.pdf', content)), {'pages': 1})
+
+    def test_text_lines(self):
+        self.assertEqual(text_metadata(self.write('empty.py', b'')), {'lines': 0})
+        self.assertEqual(text_metadata(self.write('one.py', b'pass\n')), {'lines': 1})
+
+    def test_command_processes_pending_files(self):
+        os.makedirs(os.path.join(self.media.name, 'documents'))
+        self.write('documents/old.py', b'a = 1\nb = 2\n')
+        # Created without running the on-commit queue
+        project_file = ProjectFile.objects.create(file_name='old.py', file_path='documents/old.py')
+        ProjectFile.objects.create(file_name='gone.py', file_path='documents/gone.py')
+
+        out = StringIO()
+        call_command('process_project_files', stdout=out)
+
+        self.assertIn('Processed 1 files, 1 failed', out.getvalue())
+        project_file.refresh_from_db()
+        self.assertEqual(project_file.metadata, {'size': 12, 'lines': 2})
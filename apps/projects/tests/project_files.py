@@ -1,5 +1,7 @@
+import tempfile
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db.models import QuerySet
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from unittest.mock import patch, Mock, MagicMock
 from rest_framework import status
 from apps.projects.models import ProjectFile, Project
@@ -7,51 +9,38 @@ from apps.projects.serializers.project_file_serializers import CreateProjectFile
 
 
 class TestCreateProjectFileSerializer(TestCase):
-    @patch('apps.projects.serializers.project_file_serializers.save_file')
-    def test_create_project_file(self, mock_save_file):
-        # save_file в конце возвращает путь к файлу. Подменяем эту функцию фейковым результатом
-        mock_save_file.return_value = "documents/Mock_Project/mock_file.pdf"
-
-        # Создаётся проект, для которого тестовый файл будет "записан"
-        project = Project.objects.create(
-            name="Mock Project",
-            description="Mock Project description for test cases with mock data."
-        )
-
-        # мок объект файла для записи
-        mock_file = Mock()
-        mock_file.name = "mock_file.pdf"
-        mock_file.size = 1024 * 1024  # 1 MB
-
-        # Создаётся мок контекст
-        context = {
-            "project": project,
-            "file": mock_file
-        }
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_create_project_file(self):
+        # Файл передаётся в поле file_path, create() читает его из request.FILES
+        upload = SimpleUploadedFile("mock_file.pdf", b"%PDF-1.4 mock file content")
+        request = Mock(FILES={"file_path": upload})
 
         data = {
-            "file_name": "mock_file.pdf"
+            "file_name": "mock_file.pdf",
+            "file_path": upload,
         }
 
-        serializer = CreateProjectFileSerializer(data=data, context=context)
+        serializer = CreateProjectFileSerializer(data=data, context={"request": request})
 
-        # Проверка валидности переданных фейковых данных
+        # Проверка валидности переданных данных
         self.assertTrue(serializer.is_valid(), serializer.errors)
 
         # если всё ок - вызываем метод create() через save() в сериализаторе
         project_file = serializer.save()
 
-        # Проверка, что нужный метод был вызван лишь один раз и с нужными аргументами
-        mock_save_file.assert_called_once_with(mock_file, "documents/Mock_Project/mock_file.pdf")
-
-        # Проверка, что созданный путь к файлу корректен
-        self.assertEqual(project_file.file_path, "documents/Mock_Project/mock_file.pdf")
-
-        # Дополнительная проверка, что имя "созданного" файла такое, как ожидалось и что первый проект тот, что мы создали
+        # Содержимое сохранено в хранилище блобов, путь к файлу указывает на блоб
         self.assertEqual(project_file.file_name, "mock_file.pdf")
-        self.assertEqual(project_file.project.first(), project)
-
+        self.assertEqual(project_file.file_path.name, project_file.blob.storage_name)
+        self.assertEqual(project_file.blob.size, len(b"%PDF-1.4 mock file content"))
 
+        with project_file.file_path.open('rb') as stored:
+            self.assertEqual(stored.read(), b"%PDF-1.4 mock file content")
 
 
 class ProjectFileListGenericViewTest(TestCase):
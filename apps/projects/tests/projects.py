@@ -1,3 +1,4 @@
+from datetime import datetime, timezone as dt_timezone
 from django.test import TestCase
 from unittest.mock import MagicMock
 from django.urls import reverse
@@ -5,10 +6,9 @@ from apps.projects.models import Project
 from unittest.mock import patch, MagicMock
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
-from django.db.models import QuerySet
 from apps.projects.models import Project
 from apps.projects.serializers.project_serializers import (
-    AllProjectsSerializer, ProjectDetailSerializer,
+    AllProjectsSerializer, ProjectDetailSerializer, ProjectListFilterSerializer,
 )
 from apps.projects.views.project_views import ProjectsListAPIView, ProjectDetailAPIView
 
@@ -75,20 +75,15 @@ class TestProjectListAPIView(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(response.data, [])
 
-    @patch.object(ProjectsListAPIView, 'get_objects')
-    def test_get_project_list(self, mock_get_objects):
-        projects = [self.project1, self.project2]
-
-        mock_queryset = MagicMock(spec=QuerySet)
-        mock_queryset.__iter__.return_value = iter(projects)
-        mock_get_objects.return_value = mock_queryset
-
+    def test_get_project_list(self):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        # Проверка содержимого ответа
+        # Проверка содержимого ответа: новые проекты первыми, постранично
+        projects = Project.objects.select_related('task_summary').order_by('-created_at', '-id')
         serializer = AllProjectsSerializer(projects, many=True)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data['results'], serializer.data)
+        self.assertIsNone(response.data['next'])
 
     def test_create_project(self):
         data = {
@@ -119,3 +114,51 @@ class TestProjectModel(TestCase):
 
         # Проверяем, что метод __str__ возвращает ожидаемое значение
         self.assertEqual(str(mock_project), 'Test Project')
+
+
+class TestProjectListFilters(APITestCase):
+    def setUp(self):
+        self.url = reverse('project-list')
+        self.projects = []
+
+        for day in (1, 2, 3, 4):
+            project = Project.objects.create(
+                name=f'Project {day}',
+                description='Project created on a given day of the month for the range filter.',
+            )
+            Project.objects.filter(pk=project.pk).update(
+                created_at=datetime(2030, 1, day, 12, tzinfo=dt_timezone.utc)
+            )
+            self.projects.append(project)
+
+    def test_date_range_includes_both_days(self):
+        response = self.client.get(self.url, {'date_from': '2030-01-02', 'date_to': '2030-01-03'})
+        self.assertEqual(
+            [project['name'] for project in response.data['results']],
+            ['Project 3', 'Project 2'],
+        )
+
+        response = self.client.get(self.url, {'date_from': '2030-01-04'})
+        self.assertEqual([project['name'] for project in response.data['results']], ['Project 4'])
+
+    def test_invalid_range(self):
+        response = self.client.get(self.url, {'date_from': '2030-01-05', 'date_to': '2030-01-01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('date_to', response.data)
+
+        response = self.client.get(self.url, {'date_from': '01.01.2030'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cursor_walks_the_range(self):
+        response = self.client.get(self.url, {'page_size': 3})
+        seen = [project['name'] for project in response.data['results']]
+        seen += [project['name'] for project in self.client.get(response.data['next']).data['results']]
+        self.assertEqual(seen, ['Project 4', 'Project 3', 'Project 2', 'Project 1'])
+
+    def test_range_uses_the_index(self):
+        serializer = ProjectListFilterSerializer(data={'date_from': '2030-01-02', 'date_to': '2030-01-03'})
+        serializer.is_valid(raise_exception=True)
+        plan = serializer.filter_queryset(Project.objects.all()).order_by('-created_at', '-id').explain()
+
+        self.assertIn('project_created_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
@@ -0,0 +1,62 @@
+from django.test import TestCase
+from django.urls import reverse
+from apps.projects.models import Project, ProjectFile
+
+
+class ProjectQueryCountTestCase(TestCase):
+    """
+    The number of queries of every project endpoint must not depend on the
+    number of returned rows.
+    """
+
+    def create_projects(self, amount: int) -> list[Project]:
+        projects = []
+        for i in range(Project.objects.count(), Project.objects.count() + amount):
+            project = Project.objects.create(
+                name=f'Query Project {i}',
+                description='Project used to pin the number of queries per endpoint.'
+            )
+            project_file = ProjectFile.objects.create(
+                file_name=f'file_{i}.csv',
+                file_path=f'documents/file_{i}.csv',
+            )
+            project.files.add(project_file)
+            projects.append(project)
+        return projects
+
+    def test_project_list(self):
+        for amount in (1, 10):
+            self.create_projects(amount)
+            # one cursor page with the counters joined in (was exists + projects)
+            with self.assertNumQueries(1):
+                self.client.get(reverse('project-list'))
+
+    def test_project_detail(self):
+        project = self.create_projects(1)[0]
+        # validators, project with its counters (was 3 before the counter columns)
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('project-detail', kwargs={'pk': project.pk}))
+
+        # validators only
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse('project-detail', kwargs={'pk': project.pk}),
+                HTTP_IF_NONE_MATCH=response['ETag'],
+            )
+        self.assertEqual(response.status_code, 304)
+
+    def test_project_file_list(self):
+        for amount in (1, 10):
+            self.create_projects(amount)
+            # exists + files + prefetched projects
+            with self.assertNumQueries(3):
+                response = self.client.get('/api/v1/projects/files/')
+            self.assertTrue(all(item['project'] for item in response.data))
+
+    def test_project_file_detail(self):
+        project = self.create_projects(1)[0]
+        project_file = project.files.first()
+        # file + prefetched projects
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/api/v1/projects/files/{project_file.pk}/')
+        self.assertEqual(response.data['project'][0]['name'], project.name)
@@ -0,0 +1,165 @@
+import fcntl
+import hashlib
+import os
+import tempfile
+from datetime import timedelta
+from io import BytesIO, StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from apps.projects.models import Project, ProjectFile, UploadSession
+from apps.projects.utils.upload_sessions import UploadError, file_digest, temp_path, write_chunk
+
+
+class UploadSessionTestCase(TestCase):
+    def setUp(self):
+        self.media = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media.cleanup)
+        settings_override = override_settings(
+            MEDIA_ROOT=self.media.name,
+            UPLOAD_SESSIONS={'DIR': os.path.join(self.media.name, 'uploads'), 'CHUNK_SIZE': 4},
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.project = Project.objects.create(
+            name='Upload Project',
+            description='Project the uploaded files are attached to.'
+        )
+        self.content = b'0123456789abcdefghij!'
+
+    def create_session(self, **overrides) -> dict:
+        data = {
+            'file_name': 'report.csv',
+            'size': len(self.content),
+            'project': self.project.name,
+            'sha256': hashlib.sha256(self.content).hexdigest(),
+            **overrides,
+        }
+        response = self.client.post(reverse('upload-session-list'), data, content_type='application/json')
+        self.assertEqual(response.status_code, 201, response.data)
+        return response.data
+
+    def put_chunk(self, session_id, index: int, body: bytes):
+        return self.client.put(
+            reverse('upload-chunk', kwargs={'pk': session_id, 'index': index}),
+            body,
+            content_type='application/octet-stream',
+        )
+
+    def upload_all(self, session_id):
+        for index in range(-(-len(self.content) // 4)):
+            self.put_chunk(session_id, index, self.content[index * 4:index * 4 + 4])
+
+    def commit(self, session_id):
+        return self.client.post(reverse('upload-session-commit', kwargs={'pk': session_id}))
+
+    def test_out_of_order_retried_and_resumed_upload(self):
+        session = self.create_session()
+        self.assertEqual(session['chunks'], 6)
+
+        chunks = [self.content[i:i + 4] for i in range(0, len(self.content), 4)]
+        for index in (5, 2, 0, 2):
+            response = self.put_chunk(session['id'], index, chunks[index])
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data['sha256'], hashlib.sha256(chunks[index]).hexdigest())
+
+        response = self.commit(session['id'])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('[1, 3, 4]', response.data['message'])
+        self.assertFalse(ProjectFile.objects.exists())
+
+        # Resume: only send what the server hasn't got yet
+        received = self.client.get(reverse('upload-session-detail', kwargs={'pk': session['id']})).data['received']
+        for index in set(range(6)) - set(received):
+            self.put_chunk(session['id'], index, chunks[index])
+
+        response = self.commit(session['id'])
+        self.assertEqual(response.status_code, 201, response.data)
+
+        project_file = ProjectFile.objects.get()
+        self.assertEqual(project_file.file_path.read(), self.content)
+        self.assertEqual(list(project_file.project.all()), [self.project])
+        self.assertFalse(temp_path(UploadSession.objects.get()).exists())
+
+        self.assertEqual(self.commit(session['id']).status_code, 409)
+
+    def test_wrong_chunk_size_and_index(self):
+        session = self.create_session()
+
+        self.assertEqual(self.put_chunk(session['id'], 0, b'too long').status_code, 400)
+        self.assertEqual(self.put_chunk(session['id'], 5, b'').status_code, 400)
+        self.assertEqual(self.put_chunk(session['id'], 6, b'!').status_code, 400)
+
+    def test_checksum_mismatch(self):
+        session = self.create_session(sha256='0' * 64)
+        self.upload_all(session['id'])
+
+        response = self.commit(session['id'])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Checksum mismatch', response.data['message'])
+
+        # The session is open again, a wrong chunk can be sent anew
+        self.assertEqual(UploadSession.objects.get(pk=session['id']).status, UploadSession.OPEN)
+        self.assertEqual(self.put_chunk(session['id'], 0, b'0123').status_code, 200)
+
+    def test_commit_excludes_chunk_writes(self):
+        session = UploadSession.objects.get(pk=self.create_session()['id'])
+        self.upload_all(session.pk)
+        observed = []
+
+        def hash_claimed_file(path):
+            # The session is claimed and the writers are locked out while hashing
+            observed.append(UploadSession.objects.get(pk=session.pk).status)
+            fd = os.open(path, os.O_WRONLY)
+            try:
+                with self.assertRaises(BlockingIOError):
+                    fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            finally:
+                os.close(fd)
+            return file_digest(path)
+
+        with patch('apps.projects.utils.upload_sessions.file_digest', side_effect=hash_claimed_file):
+            self.assertEqual(self.commit(session.pk).status_code, 201)
+
+        self.assertEqual(observed, [UploadSession.COMMITTING])
+        self.assertEqual(ProjectFile.objects.get().file_path.read(), self.content)
+
+    def test_chunks_of_claimed_or_moved_uploads(self):
+        session = UploadSession.objects.get(pk=self.create_session()['id'])
+
+        UploadSession.objects.filter(pk=session.pk).update(status=UploadSession.COMMITTING)
+        with self.assertRaisesMessage(UploadError, 'being committed'):
+            write_chunk(session, 0, BytesIO(b'XXXX'))
+        with open(temp_path(session), 'rb') as stream:
+            self.assertEqual(stream.read(4), b'\0' * 4)
+
+        # A retried PUT arriving after the commit moved the file
+        UploadSession.objects.filter(pk=session.pk).update(status=UploadSession.OPEN)
+        temp_path(session).unlink()
+        self.assertEqual(self.put_chunk(session.pk, 0, b'XXXX').status_code, 400)
+
+    def test_invalid_session(self):
+        response = self.client.post(
+            reverse('upload-session-list'),
+            {'file_name': '../evil.sh', 'size': 0},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('file_name', response.data)
+        self.assertIn('size', response.data)
+
+    def test_abort_and_purge(self):
+        aborted = self.create_session()
+        response = self.client.delete(reverse('upload-session-detail', kwargs={'pk': aborted['id']}))
+        self.assertEqual(response.status_code, 204)
+
+        abandoned = UploadSession.objects.get(pk=self.create_session()['id'])
+        UploadSession.objects.filter(pk=abandoned.pk).update(updated_at=timezone.now() - timedelta(days=2))
+
+        call_command('purge_upload_sessions', stdout=StringIO())
+
+        self.assertFalse(UploadSession.objects.exists())
+        self.assertFalse(temp_path(abandoned).exists())
@@ -1,10 +1,20 @@
 from django.urls import path
 from apps.projects.views.project_views import *
 from apps.projects.views.project_file_views import *
+from apps.projects.views.upload_views import *
+from apps.tasks.views.project_summary_views import ProjectTaskSummaryAPIView
+from apps.tasks.views.task_import_views import ProjectFileImportAPIView
 
 urlpatterns = [
     path('', ProjectsListAPIView.as_view(), name='project-list'),
     path('<int:pk>/', ProjectDetailAPIView.as_view(), name='project-detail'),
-    path('files/', ProjectFileListGenericView.as_view()),
-    path('files/<int:pk>/', ProjectFileDetailGenericView.as_view()),
+    path('<int:pk>/summary/', ProjectTaskSummaryAPIView.as_view(), name='project-summary'),
+    path('files/', ProjectFileListGenericView.as_view(), name='project-file-list'),
+    path('files/<int:pk>/', ProjectFileDetailGenericView.as_view(), name='project-file-detail'),
+    path('files/<int:pk>/download/', DownloadProjectFileView.as_view(), name='project-file-download'),
+    path('files/<int:pk>/import/', ProjectFileImportAPIView.as_view(), name='project-file-import'),
+    path('files/uploads/', UploadSessionCreateAPIView.as_view(), name='upload-session-list'),
+    path('files/uploads/<uuid:pk>/', UploadSessionDetailAPIView.as_view(), name='upload-session-detail'),
+    path('files/uploads/<uuid:pk>/chunks/<int:index>/', UploadChunkAPIView.as_view(), name='upload-chunk'),
+    path('files/uploads/<uuid:pk>/commit/', UploadSessionCommitAPIView.as_view(), name='upload-session-commit'),
 ]
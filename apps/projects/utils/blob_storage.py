@@ -0,0 +1,133 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from apps.projects.models import FileBlob, ProjectFile
+from apps.projects.models.file_blob import blob_storage_name
+from apps.projects.utils.upload_file_helpers import delete_file
+
+BLOB_DIR = 'blobs'
+
+
+def blob_path(sha256: str) -> Path:
+    return Path(default_storage.path(blob_storage_name(sha256)))
+
+
+def spool(chunks: Iterable[bytes]) -> tuple[Path, str, int]:
+    """
+    Writes ``chunks`` to a temporary file next to the blobs, hashing them
+    on the way. Returns (temporary path, sha256, size).
+    """
+    directory = Path(default_storage.path(BLOB_DIR))
+    directory.mkdir(parents=True, exist_ok=True)
+
+    digest = hashlib.sha256()
+    size = 0
+    fd, name = tempfile.mkstemp(dir=directory, suffix='.part')
+
+    try:
+        with os.fdopen(fd, 'wb') as stream:
+            for chunk in chunks:
+                stream.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+    except BaseException:
+        os.unlink(name)
+        raise
+
+    return Path(name), digest.hexdigest(), size
+
+
+def acquire_blob(path: Path, sha256: str, size: int) -> FileBlob:
+    """
+    Takes a reference on the blob with ``sha256``, moving the file at
+    ``path`` into place when the contents are new and dropping it when
+    they are already stored.
+
+    The file is moved only after the blob row is written, i.e. while the
+    transaction holds the write lock, so it can't race ``release_blob``
+    removing the same blob.
+    """
+    with transaction.atomic():
+        if FileBlob.objects.filter(pk=sha256).update(ref_count=F('ref_count') + 1):
+            path.unlink(missing_ok=True)
+            return FileBlob.objects.get(pk=sha256)
+
+        try:
+            with transaction.atomic():
+                blob = FileBlob.objects.create(sha256=sha256, size=size, ref_count=1)
+        except IntegrityError:
+            # Someone stored the same contents in between
+            FileBlob.objects.filter(pk=sha256).update(ref_count=F('ref_count') + 1)
+            path.unlink(missing_ok=True)
+            return FileBlob.objects.get(pk=sha256)
+
+        destination = blob_path(sha256)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(path, destination)
+
+    return blob
+
+
+def release_blob(sha256: str) -> bool:
+    """Drops a reference; returns True when it was the last one and the file is gone."""
+    with transaction.atomic():
+        FileBlob.objects.filter(pk=sha256).update(ref_count=F('ref_count') - 1)
+        deleted, _ = FileBlob.objects.filter(pk=sha256, ref_count__lte=0).delete()
+
+        if deleted:
+            blob_path(sha256).unlink(missing_ok=True)
+
+    return bool(deleted)
+
+
+def store_file(file_name: str, chunks: Iterable[bytes]) -> ProjectFile:
+    """Stores the uploaded contents once per digest and creates a ``ProjectFile`` for them."""
+    path, sha256, size = spool(chunks)
+
+    try:
+        with transaction.atomic():
+            blob = acquire_blob(path, sha256, size)
+            return ProjectFile.objects.create(file_name=file_name, file_path=blob.storage_name, blob=blob)
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def delete_project_file(project_file: ProjectFile) -> None:
+    """
+    Deletes the row, and the file on disk once no other ``ProjectFile``
+    shares it. Files stored before blobs existed own their path.
+    """
+    with transaction.atomic():
+        if not project_file.blob_id:
+            delete_file(file_path=project_file.file_path.path)
+
+        project_file.delete()
+
+        if project_file.blob_id:
+            release_blob(project_file.blob_id)
+
+
+def move_to_blob(project_file: ProjectFile) -> FileBlob:
+    """Moves a file stored before blobs existed into the blob store."""
+    old_path = Path(project_file.file_path.path)
+
+    with open(old_path, 'rb') as stream:
+        path, sha256, size = spool(iter(lambda: stream.read(64 * 1024), b''))
+
+    try:
+        with transaction.atomic():
+            blob = acquire_blob(path, sha256, size)
+            project_file.blob = blob
+            project_file.file_path = blob.storage_name
+            project_file.save(update_fields=['blob', 'file_path'])
+    finally:
+        path.unlink(missing_ok=True)
+
+    old_path.unlink(missing_ok=True)
+
+    return blob
@@ -0,0 +1,115 @@
+import mimetypes
+import re
+from pathlib import Path
+from typing import Callable
+from apps.projects.utils.file_readers import iter_csv_rows, iter_xlsx_rows
+
+READ_BLOCK_SIZE = 64 * 1024
+
+# Leading bytes of the binary formats we accept
+SIGNATURES = [
+    (b'%PDF-', 'application/pdf'),
+    (b'PK\x03\x04', 'application/zip'),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'application/msword'),
+]
+
+PDF_PAGE_RE = re.compile(rb'/Type\s*/Page(?![a-zA-Z])')
+PDF_COUNT_RE = re.compile(rb'/Count\s+(\d+)')
+# Longest match the block boundary may split
+PDF_OVERLAP = 32
+
+
+def iter_blocks(path, block_size: int = READ_BLOCK_SIZE):
+    with open(path, 'rb') as stream:
+        while block := stream.read(block_size):
+            yield block
+
+
+def detect_mime_type(path, file_name: str) -> str:
+    """Content sniffing for the binary formats, the file name for the rest."""
+    with open(path, 'rb') as stream:
+        head = stream.read(8)
+
+    guessed = mimetypes.guess_type(file_name)[0]
+
+    for signature, mime_type in SIGNATURES:
+        if head.startswith(signature):
+            # .xlsx files are zip archives too
+            if mime_type == 'application/zip' and guessed and guessed != mime_type:
+                return guessed
+            return mime_type
+
+    return guessed or 'application/octet-stream'
+
+
+def count_rows(rows) -> dict:
+    """Data rows only: the first row is the header."""
+    total = sum(1 for _ in rows)
+    return {'rows': max(total - 1, 0)}
+
+
+def csv_metadata(path) -> dict:
+    return count_rows(iter_csv_rows(path))
+
+
+def xlsx_metadata(path) -> dict:
+    return count_rows(iter_xlsx_rows(path))
+
+
+def pdf_metadata(path) -> dict:
+    """
+    Counts the page objects while reading the file block by block. Pages
+    hidden in compressed object streams leave only the page tree's
+    ``/Count`` readable, so the largest one is the fallback.
+    """
+    pages = 0
+    largest_count = 0
+    tail = b''
+
+    for block in iter_blocks(path):
+        data = tail + block
+        # A match touching the end of the block may still turn into
+        # ``/Pages``: it is counted with the next block, whose overlap
+        # repeats it. Matches ending before the overlap were counted already.
+        skip = len(tail)
+        pages += sum(1 for match in PDF_PAGE_RE.finditer(data) if skip <= match.end() < len(data))
+        for match in PDF_COUNT_RE.finditer(data):
+            largest_count = max(largest_count, int(match.group(1)))
+        tail = data[-PDF_OVERLAP:]
+
+    return {'pages': pages or largest_count}
+
+
+def text_metadata(path) -> dict:
+    lines = 0
+    last = b''
+
+    for block in iter_blocks(path):
+        lines += block.count(b'\n')
+        last = block[-1:]
+
+    # A last line without the trailing newline still counts
+    if last and last != b'\n':
+        lines += 1
+
+    return {'lines': lines}
+
+
+EXTRACTORS: dict[str, Callable[[Path], dict]] = {
+    '.csv': csv_metadata,
+    '.xlsx': xlsx_metadata,
+    '.pdf': pdf_metadata,
+    '.py': text_metadata,
+}
+
+
+def extract_metadata(path, file_name: str) -> tuple[str, dict]:
+    """(MIME type, metadata) of the stored file; unknown extensions only get the size."""
+    path = Path(path)
+    metadata = {'size': path.stat().st_size}
+    extractor = EXTRACTORS.get(Path(file_name).suffix.lower())
+
+    if extractor is not None:
+        metadata.update(extractor(path))
+
+    return detect_mime_type(path, file_name), metadata
@@ -0,0 +1,107 @@
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from apps.projects.models import ProjectFile
+from apps.projects.utils.file_metadata import extract_metadata
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FILE_PROCESSING = {
+    'WORKERS': 2,
+    # Process in the committing thread instead of the pool (tests, scripts)
+    'EAGER': False,
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_file_processing_settings() -> dict:
+    return {**DEFAULT_FILE_PROCESSING, **getattr(settings, 'FILE_PROCESSING', {})}
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_file_processing_settings()['WORKERS'],
+                thread_name_prefix='file-processing',
+            )
+    return _executor
+
+
+def queue_processing(project_file_id: int) -> None:
+    """Hands the file to the worker pool once the upload is committed."""
+    def submit():
+        if get_file_processing_settings()['EAGER']:
+            process_file(project_file_id)
+        else:
+            get_executor().submit(run_in_worker, project_file_id)
+
+    transaction.on_commit(submit)
+
+
+def run_in_worker(project_file_id: int) -> None:
+    # Worker threads get their own connections, which Django won't close for them
+    close_old_connections()
+    try:
+        process_file(project_file_id)
+    except Exception:
+        logger.exception("Processing of ProjectFile %s failed", project_file_id)
+    finally:
+        close_old_connections()
+
+
+def process_file(project_file_id: int, statuses=(ProjectFile.PENDING,)) -> str | None:
+    """
+    Extracts the metadata of a stored file. Returns the resulting status,
+    or ``None`` when the file is gone or someone else has claimed it.
+    """
+    claimed = ProjectFile.objects.filter(pk=project_file_id, processing_status__in=statuses).update(
+        processing_status=ProjectFile.PROCESSING
+    )
+    if not claimed:
+        return None
+
+    project_file = ProjectFile.objects.filter(pk=project_file_id).first()
+    if project_file is None:
+        return None
+
+    # What gets extracted depends on the extension, so a file with the
+    # same blob and extension that is already done can lend its results
+    done = None
+    if project_file.blob_id:
+        done = (
+            ProjectFile.objects.filter(
+                blob_id=project_file.blob_id,
+                processing_status=ProjectFile.DONE,
+                file_name__iendswith=Path(project_file.file_name).suffix or project_file.file_name,
+            )
+            .exclude(pk=project_file.pk)
+            .values('mime_type', 'metadata')
+            .first()
+        )
+
+    if done:
+        mime_type, metadata, processing_status = done['mime_type'], done['metadata'], ProjectFile.DONE
+    else:
+        try:
+            mime_type, metadata = extract_metadata(project_file.file_path.path, project_file.file_name)
+            processing_status = ProjectFile.DONE
+        except Exception as e:
+            logger.warning("Couldn't extract the metadata of ProjectFile %s: %s", project_file.pk, e)
+            mime_type, metadata, processing_status = '', {'error': str(e)}, ProjectFile.FAILED
+
+    ProjectFile.objects.filter(pk=project_file.pk).update(
+        mime_type=mime_type,
+        metadata=metadata,
+        processing_status=processing_status,
+        processed_at=timezone.now(),
+    )
+    return processing_status
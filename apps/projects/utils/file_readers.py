@@ -0,0 +1,148 @@
+import csv
+import posixpath
+import zipfile
+from pathlib import Path
+from typing import Iterator
+from xml.etree.ElementTree import ParseError, iterparse, parse
+
+SHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PACKAGE_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# What the readers raise on a file that isn't what its extension says: not
+# UTF-8, not a zip, broken XML, or a workbook without its sheet
+FILE_READ_ERRORS = (UnicodeDecodeError, csv.Error, zipfile.BadZipFile, ParseError, KeyError)
+
+
+class FileReadError(ValueError):
+    pass
+
+
+def iter_csv_rows(path) -> Iterator[list]:
+    with open(path, encoding='utf-8-sig', newline='') as stream:
+        yield from csv.reader(stream)
+
+
+def _column_index(reference: str) -> int:
+    index = 0
+    for char in reference:
+        if not char.isalpha():
+            break
+        index = index * 26 + ord(char.upper()) - ord('A') + 1
+    return index - 1
+
+
+def _number(text: str):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    if 'xl/sharedStrings.xml' not in archive.namelist():
+        return []
+
+    strings = []
+    with archive.open('xl/sharedStrings.xml') as stream:
+        for _, element in iterparse(stream):
+            if element.tag == f'{SHEET_NS}si':
+                strings.append(''.join(text.text or '' for text in element.iter(f'{SHEET_NS}t')))
+                element.clear()
+    return strings
+
+
+def _first_sheet(archive: zipfile.ZipFile) -> str:
+    try:
+        with archive.open('xl/workbook.xml') as stream:
+            sheet = parse(stream).getroot().find(f'{SHEET_NS}sheets/{SHEET_NS}sheet')
+        with archive.open('xl/_rels/workbook.xml.rels') as stream:
+            relations = {
+                relation.get('Id'): relation.get('Target')
+                for relation in parse(stream).getroot().iter(f'{PACKAGE_REL_NS}Relationship')
+            }
+        target = relations[sheet.get(f'{REL_NS}id')]
+    except (KeyError, AttributeError):
+        return 'xl/worksheets/sheet1.xml'
+
+    return target.lstrip('/') if target.startswith('/') else posixpath.join('xl', target)
+
+
+def _cell_value(cell, shared_strings: list[str]):
+    cell_type = cell.get('t')
+
+    if cell_type == 'inlineStr':
+        return ''.join(text.text or '' for text in cell.iter(f'{SHEET_NS}t'))
+
+    value = cell.findtext(f'{SHEET_NS}v')
+    if value is None:
+        return None
+    if cell_type == 's':
+        return shared_strings[int(value)]
+    if cell_type == 'b':
+        return value == '1'
+    if cell_type in ('str', 'e'):
+        return value
+    return _number(value)
+
+
+def iter_xlsx_rows(path) -> Iterator[list]:
+    """
+    Streams the rows of the first worksheet of an ``.xlsx`` file.
+
+    The sheet XML is parsed incrementally and every row is dropped from the
+    tree as soon as it has been yielded, so memory stays flat however long
+    the sheet is (only the shared strings table is kept). Numbers come back
+    as ``int``/``float``: dates are Excel serial numbers.
+    """
+    with zipfile.ZipFile(path) as archive:
+        shared_strings = _shared_strings(archive)
+
+        with archive.open(_first_sheet(archive)) as stream:
+            sheet_data = None
+
+            for event, element in iterparse(stream, events=('start', 'end')):
+                if event == 'start':
+                    if element.tag == f'{SHEET_NS}sheetData':
+                        sheet_data = element
+                    continue
+
+                if element.tag != f'{SHEET_NS}row':
+                    continue
+
+                row = []
+                for cell in element.iter(f'{SHEET_NS}c'):
+                    index = _column_index(cell.get('r', '')) if cell.get('r') else len(row)
+                    row.extend([None] * (index - len(row)))
+                    row.append(_cell_value(cell, shared_strings))
+
+                yield row
+
+                element.clear()
+                if sheet_data is not None:
+                    sheet_data.clear()
+
+
+FILE_READERS = {
+    '.csv': iter_csv_rows,
+    '.xlsx': iter_xlsx_rows,
+}
+
+
+def iter_file_rows(path, extension: str = None) -> Iterator[list]:
+    """
+    Yields the rows (header first) of a stored ``.csv`` or ``.xlsx`` file.
+    Blobs have no extension on disk, so theirs comes from the file name.
+    A file that can't be decoded raises ``FileReadError`` while iterating.
+    """
+    extension = (extension or Path(str(path)).suffix).lower()
+
+    if extension not in FILE_READERS:
+        raise ValueError(f"Can't read rows from '{extension}' files, expected one of {list(FILE_READERS)}")
+
+    return _reraise_read_errors(FILE_READERS[extension](path), extension)
+
+
+def _reraise_read_errors(rows: Iterator[list], extension: str) -> Iterator[list]:
+    try:
+        yield from rows
+    except FILE_READ_ERRORS as e:
+        raise FileReadError(f"Not a valid {extension} file: {e}") from e
@@ -0,0 +1,89 @@
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from apps.core.response_cache import invalidate
+from apps.projects.models import Project
+
+# Kept by the receivers in apps.projects.receivers and apps.users.receivers
+COUNTER_FIELDS = ('files_count', 'users_count')
+
+
+def invalidate_projects() -> None:
+    # ``QuerySet.update()`` sends no post_save, and the counters are part of
+    # the cached project responses
+    invalidate(Project._meta.label)
+
+
+def adjust_counter(field: str, delta: int, **lookup) -> None:
+    """``UPDATE project SET field = field + delta`` for the projects matching ``lookup``."""
+    if delta:
+        # The counters are part of the project representation, hence its ETag
+        Project.objects.filter(**lookup).update(**{field: F(field) + delta}, updated_at=timezone.now())
+        invalidate_projects()
+
+
+def recount_files(**lookup) -> None:
+    """
+    Recounts ``files_count`` of the projects matching ``lookup``.
+
+    ``m2m_changed`` doesn't say how many links a ``remove()`` actually
+    deleted, so file changes recount instead of adding a delta; the
+    correlated COUNT is an index range scan on the through table.
+    """
+    Project.objects.filter(**lookup).update(
+        files_count=actual_counts()['files_count'],
+        updated_at=timezone.now(),
+    )
+    invalidate_projects()
+
+
+def actual_counts() -> dict[str, Subquery]:
+    from apps.users.models import User
+
+    files = (
+        Project.files.through.objects.filter(project_id=OuterRef('pk'))
+        .order_by().values('project_id').annotate(amount=Count('*')).values('amount')
+    )
+    users = (
+        User.objects.filter(project_id=OuterRef('pk'))
+        .order_by().values('project_id').annotate(amount=Count('*')).values('amount')
+    )
+    return {
+        'files_count': Coalesce(Subquery(files), Value(0)),
+        'users_count': Coalesce(Subquery(users), Value(0)),
+    }
+
+
+def find_counter_drift() -> dict[int, dict[str, tuple[int, int]]]:
+    """Returns {project_id: {field: (stored, actual)}} for every drifted counter."""
+    actual = {f'actual_{field}': expression for field, expression in actual_counts().items()}
+    drift = {}
+
+    for row in Project.objects.order_by('pk').annotate(**actual).values('pk', *COUNTER_FIELDS, *actual):
+        fields = {
+            field: (row[field], row[f'actual_{field}'])
+            for field in COUNTER_FIELDS
+            if row[field] != row[f'actual_{field}']
+        }
+        if fields:
+            drift[row['pk']] = fields
+
+    return drift
+
+
+def reconcile_counters(project_ids=None, using: str = None) -> int:
+    """
+    Recounts the counters of ``project_ids`` (all projects by default) in one
+    UPDATE on the ``using`` database, the routed one by default.
+    """
+    projects = Project.objects.using(using)
+
+    if project_ids is not None:
+        projects = projects.filter(pk__in=list(project_ids))
+
+    with transaction.atomic(using=using):
+        updated = projects.update(**actual_counts())
+        invalidate_projects()
+
+    return updated
@@ -0,0 +1,177 @@
+import fcntl
+import hashlib
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from apps.projects.models import ProjectFile, UploadChunk, UploadSession
+from apps.projects.utils.blob_storage import acquire_blob
+
+DEFAULT_UPLOAD_SESSIONS = {
+    'DIR': Path(settings.BASE_DIR) / 'var' / 'uploads',
+    'CHUNK_SIZE': 5 * 1024 * 1024,
+    'MAX_CHUNK_SIZE': 32 * 1024 * 1024,
+    'MAX_FILE_SIZE': 2 * 1024 * 1024 * 1024,
+    'EXPIRE_HOURS': 24,
+}
+
+READ_BLOCK_SIZE = 64 * 1024
+
+
+class UploadError(Exception):
+    pass
+
+
+def get_upload_settings() -> dict:
+    return {**DEFAULT_UPLOAD_SESSIONS, **getattr(settings, 'UPLOAD_SESSIONS', {})}
+
+
+def temp_path(session: UploadSession) -> Path:
+    return Path(get_upload_settings()['DIR']) / f'{session.pk}.part'
+
+
+def open_session(session: UploadSession) -> None:
+    """Creates the (sparse) temporary file the chunks are written into."""
+    path = temp_path(session)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, 'wb') as stream:
+        stream.truncate(session.size)
+
+
+@contextmanager
+def locked_temp_file(session: UploadSession, flags: int, operation: int):
+    """
+    The temporary file opened with ``flags`` and locked with ``operation``:
+    chunk writers share the lock, a commit waits for them with an exclusive one.
+    """
+    try:
+        fd = os.open(temp_path(session), flags)
+    except FileNotFoundError:
+        raise UploadError("The upload has already been committed or discarded")
+
+    try:
+        fcntl.flock(fd, operation)
+        yield fd
+    finally:
+        # Releases the lock too
+        os.close(fd)
+
+
+def write_chunk(session: UploadSession, index: int, stream) -> UploadChunk:
+    """
+    Copies chunk ``index`` from ``stream`` to its offset in the temporary
+    file, hashing it on the way, without holding it in memory.
+
+    Chunks land at fixed offsets, so they can arrive in any order, in
+    parallel, and be sent again after a failure: a retry simply overwrites
+    the same range. Once a commit claimed the session no chunk is written.
+    """
+    if not 0 <= index < session.chunk_count:
+        raise UploadError(f"Chunk index must be between 0 and {session.chunk_count - 1}")
+
+    offset, length = session.chunk_range(index)
+    digest = hashlib.sha256()
+    received = 0
+
+    with locked_temp_file(session, os.O_WRONLY, fcntl.LOCK_SH) as fd:
+        # Checked under the lock: a commit claims the session before it
+        # waits for the writers, so the file can't change after it's hashed
+        if not UploadSession.objects.filter(pk=session.pk, status=UploadSession.OPEN).exists():
+            raise UploadError("The upload is being committed")
+
+        while received < length:
+            block = stream.read(min(READ_BLOCK_SIZE, length - received))
+            if not block:
+                break
+            os.pwrite(fd, block, offset + received)
+            digest.update(block)
+            received += len(block)
+
+    if received != length or stream.read(1):
+        raise UploadError(f"Chunk {index} must be exactly {length} bytes long")
+
+    chunk, _ = UploadChunk.objects.update_or_create(
+        session=session,
+        index=index,
+        defaults={'size': received, 'sha256': digest.hexdigest()},
+    )
+    # Keeps an upload that is still progressing away from purge_upload_sessions
+    UploadSession.objects.filter(pk=session.pk).update(updated_at=timezone.now())
+
+    return chunk
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+
+    with open(path, 'rb') as stream:
+        while block := stream.read(READ_BLOCK_SIZE):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def missing_chunks(session: UploadSession) -> list[int]:
+    received = set(session.chunks.values_list('index', flat=True))
+    return [index for index in range(session.chunk_count) if index not in received]
+
+
+def commit_session(session: UploadSession) -> ProjectFile:
+    """
+    Checks that every chunk arrived, verifies the announced checksum and
+    hands the temporary file over to the blob store.
+
+    The session is claimed first, then the chunk writes in progress are
+    waited for, so the bytes hashed are the bytes stored under the digest.
+    """
+    missing = missing_chunks(session)
+    if missing:
+        raise UploadError(f"Missing chunks: {missing}")
+
+    # Only one of two concurrent commits gets the session
+    claimed = UploadSession.objects.filter(pk=session.pk, status=UploadSession.OPEN).update(
+        status=UploadSession.COMMITTING, updated_at=timezone.now()
+    )
+    if not claimed:
+        raise UploadError("The upload has already been committed")
+
+    path = temp_path(session)
+    try:
+        with locked_temp_file(session, os.O_RDONLY, fcntl.LOCK_EX):
+            digest = file_digest(path)
+
+            if session.sha256 and session.sha256.lower() != digest:
+                raise UploadError(f"Checksum mismatch: expected {session.sha256}, got {digest}")
+
+            with transaction.atomic():
+                # Moves the temporary file into the blob store, or drops it when the
+                # same contents are already there: the bytes are never copied
+                blob = acquire_blob(path, digest, session.size)
+                project_file = ProjectFile.objects.create(
+                    file_name=session.file_name,
+                    file_path=blob.storage_name,
+                    blob=blob,
+                )
+                if session.project_id:
+                    session.project.files.add(project_file)
+
+                session.status = UploadSession.COMMITTED
+                session.project_file = project_file
+                session.save(update_fields=['status', 'project_file', 'updated_at'])
+                session.chunks.all().delete()
+    except UploadError:
+        # The file is still in place, chunks may be sent again
+        UploadSession.objects.filter(pk=session.pk, status=UploadSession.COMMITTING).update(
+            status=UploadSession.OPEN
+        )
+        raise
+
+    return project_file
+
+
+def discard_session(session: UploadSession) -> None:
+    temp_path(session).unlink(missing_ok=True)
+    session.delete()
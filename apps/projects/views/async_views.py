@@ -0,0 +1,72 @@
+from django.http import Http404
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from apps.core.async_views import AsyncAPIView, aget_object_or_404
+from apps.core.conditional import ConditionalRequestMixin
+from apps.core.pagination import PaginationModeMixin
+from apps.projects.models import Project
+from apps.projects.serializers.project_serializers import (
+    AllProjectsSerializer, ProjectDetailSerializer, ProjectListFilterSerializer,
+)
+from apps.projects.views.project_views import ProjectDetailAPIView, ProjectsListAPIView
+
+
+class AsyncProjectsListView(PaginationModeMixin, AsyncAPIView):
+    """Async ``ProjectsListAPIView.get``: one cursor page per query."""
+    default_pagination_mode = ProjectsListAPIView.default_pagination_mode
+    cursor_ordering = ProjectsListAPIView.cursor_ordering
+    query_budget = ProjectsListAPIView.query_budget
+
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        filters = ProjectListFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        projects = filters.filter_queryset(Project.objects.select_related('task_summary'))
+        page = await self.paginator.apaginate_queryset(projects, request, view=self)
+
+        if not page and not request.query_params.get('cursor') and not request.query_params.get('page'):
+            return Response(
+                data=[],
+                status=status.HTTP_204_NO_CONTENT
+            )
+
+        serializer = AllProjectsSerializer(page, many=True)
+        return self.paginator.get_paginated_response(serializer.data)
+
+
+class AsyncProjectDetailView(ConditionalRequestMixin, AsyncAPIView):
+    """Async ``ProjectDetailAPIView.get`` with the same validators."""
+    query_budget = {'GET': 2}
+
+    async def aget_validators(self):
+        versions = await (
+            Project.objects.filter(pk=self.kwargs['pk'])
+            .order_by()
+            .values_list('updated_at', 'task_summary__updated_at')
+            .afirst()
+        )
+
+        if versions is None:
+            raise Http404
+
+        self.updated_at, summary_updated_at = versions
+        return ProjectDetailAPIView.project_etag(self.updated_at, summary_updated_at)
+
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        not_modified = await self.aevaluate_preconditions(request)
+
+        if not_modified is not None:
+            return not_modified
+
+        project = await aget_object_or_404(Project.objects.select_related('task_summary'), pk=self.kwargs['pk'])
+
+        serializer = ProjectDetailSerializer(project)
+
+        return self.set_validators(Response(
+            serializer.data,
+            status=status.HTTP_200_OK,
+        ), ProjectDetailAPIView.project_etag(
+            project.updated_at,
+            ProjectDetailAPIView.summary_updated_at(project),
+        ))
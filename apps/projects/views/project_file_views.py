@@ -1,14 +1,26 @@
-from django.http import FileResponse
+import os
+from datetime import datetime, timezone as dt_timezone
+from django.http import Http404, HttpResponse
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.generics import get_object_or_404, ListCreateAPIView, RetrieveDestroyAPIView
+from apps.core.conditional import ConditionalRequestMixin
+from apps.core.file_responses import file_download_response
+from apps.core.pagination import PaginationModeMixin
+from apps.core.response_cache import cache_response
 from apps.projects.models import ProjectFile, Project
 from apps.projects.serializers.project_file_serializers import *
+from apps.projects.utils.blob_storage import delete_project_file
 
 
-class ProjectFileListGenericView(ListCreateAPIView):
+class ProjectFileListGenericView(PaginationModeMixin, ListCreateAPIView):
+    default_pagination_mode = None
+    cursor_ordering = ('-created_at', '-id')
+    # exists + files + prefetched projects
+    query_budget = {'GET': 3}
+
     def get_serializer_class(self):
         if self.request.method == 'GET':
             return AllProjectFilesSerializer
@@ -17,14 +29,16 @@ class ProjectFileListGenericView(ListCreateAPIView):
     def get_queryset(self):
         project_name = self.request.query_params.get('project')
 
+        project_files = ProjectFile.objects.prefetch_related('project')
+
         if project_name:
-            project_file = ProjectFile.objects.filter(
+            return project_files.filter(
                 project__name=project_name
             )
-            return project_file
 
-        return ProjectFile.objects.all()
+        return project_files
 
+    @cache_response('projects.ProjectFile', 'projects.Project')
     def list(self, request: Request, *args, **kwargs) -> Response:
         project_files = self.get_queryset()
 
@@ -34,6 +48,12 @@ class ProjectFileListGenericView(ListCreateAPIView):
                 status=status.HTTP_204_NO_CONTENT
             )
 
+        page = self.paginate_queryset(project_files)
+
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(project_files, many=True)
 
         return Response(
@@ -44,9 +64,13 @@ class ProjectFileListGenericView(ListCreateAPIView):
 
 class ProjectFileDetailGenericView(RetrieveDestroyAPIView):
     serializer_class = ProjectFileDetailSerializer
+    query_budget = {'GET': 2}
 
     def get_object(self):
-        return get_object_or_404(ProjectFile, pk=self.kwargs['pk'])
+        return get_object_or_404(
+            ProjectFile.objects.prefetch_related('project'),
+            pk=self.kwargs['pk']
+        )
 
     def retrieve(self, request: Request, *args, **kwargs) -> Response:
         file = self.get_object()
@@ -62,15 +86,14 @@ class ProjectFileDetailGenericView(RetrieveDestroyAPIView):
         file = self.get_object()
 
         try:
-            delete_file(file_path=file.file_path.path)
+            # The contents go away with the last file sharing them
+            delete_project_file(file)
 
         except Exception as e:
             return Response(
                 data={"message": str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        else:
-            file.delete()
 
         return Response(
             data={
@@ -80,23 +103,58 @@ class ProjectFileDetailGenericView(RetrieveDestroyAPIView):
         )
 
 
-class DownloadProjectFileView(APIView):
-   def get_object(self):
-       return get_object_or_404(ProjectFile, pk=self.kwargs['pk'])
+class DownloadProjectFileView(ConditionalRequestMixin, APIView):
+    """
+    Downloads a project file with ``Range``/``If-Range`` support for
+    resumed and partial transfers.
+
+    Blob-backed files are validated by their SHA-256 digest, which can't
+    change, so clients revalidate with a single indexed lookup. With
+    ``FILE_DOWNLOADS['SENDFILE']`` set the body is sent by the front proxy.
+    """
+    query_budget = {'GET': 1}
+
+    def get_object(self):
+        return get_object_or_404(ProjectFile.objects.select_related('blob'), pk=self.kwargs['pk'])
+
+    def get_validators(self) -> tuple[str, datetime] | None:
+        self.object = self.get_object()
 
+        if self.object.blob_id:
+            return f'"{self.object.blob_id}"', self.object.blob.created_at
 
-   def get(self, request: Request, *args, **kwargs) -> FileResponse:
-       project_file = self.get_object()
+        # Files stored before blobs: size and mtime stand in for the digest
+        try:
+            stat = os.stat(self.object.file_path.path)
+        except FileNotFoundError:
+            raise Http404
 
+        return (
+            f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"',
+            datetime.fromtimestamp(stat.st_mtime, tz=dt_timezone.utc),
+        )
 
-       file_handle = project_file.file_path.open()
+    def get(self, request: Request, *args, **kwargs) -> HttpResponse:
+        response = self.evaluate_preconditions(request)
+        if response is not None:
+            return response
 
+        project_file = self.object
+        path = project_file.file_path.path
 
-       response = FileResponse(file_handle, content_type='application/octet-stream')
-       response['Content-Disposition'] = f'attachment; filename="{project_file.file_name}"'
+        if not os.path.exists(path):
+            raise Http404
 
+        response = file_download_response(
+            request,
+            path=path,
+            storage_name=project_file.file_path.name,
+            file_name=project_file.file_name,
+            etag=self.validators[0],
+            last_modified=self.validators[1],
+        )
 
-       return response
+        return self.set_validators(response, self.validators)
 
 
 #########################################################################################
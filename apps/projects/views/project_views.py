@@ -1,50 +1,50 @@
-from datetime import datetime
+from django.db import transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
+from apps.core.conditional import ConditionalRequestMixin, make_etag
+from apps.core.pagination import PaginationModeMixin
+from apps.core.response_cache import cache_response
 from apps.projects.models import Project
 from apps.projects.serializers.project_serializers import *
 
 
-class ProjectsListAPIView(APIView):
-    def get_objects(self, date_from=None, date_to=None):
-        if date_from and date_to:
-            date_from = timezone.make_aware(
-                datetime.strptime(date_from, '%Y-%m-%d')
-            )
-            date_to = timezone.make_aware(
-                datetime.strptime(date_to, '%Y-%m-%d')
-            ) if date_from else timezone.now().strftime('%Y-%m-%d')
-
-            projects = Project.objects.filter(
-                created_at__range=[date_from, date_to]
-            )
+class ProjectsListAPIView(PaginationModeMixin, APIView):
+    """
+    Newest projects first, a cursor page at a time.
 
-            return projects
+    The date range and the keyset ordering share ``project_created_idx``;
+    the counters are columns of the project and of its task summary row,
+    so a page is a single ``SELECT ... LEFT JOIN``.
+    """
+    default_pagination_mode = 'cursor'
+    cursor_ordering = ('-created_at', '-id')
+    # ?pagination=page adds the COUNT(*)
+    query_budget = {'GET': 2}
 
-        return Project.objects.all()
+    def get_objects(self, filters: ProjectListFilterSerializer):
+        return filters.filter_queryset(Project.objects.select_related('task_summary'))
 
+    @cache_response('projects.Project')
     def get(self, request: Request) -> Response:
-        date_from = request.query_params.get('date_from')
-        date_to = request.query_params.get('date_to')
+        filters = ProjectListFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
 
-        projects = self.get_objects(date_from, date_to)
+        projects = self.get_objects(filters)
+        page = self.paginator.paginate_queryset(projects, request, view=self)
 
-        if not projects.exists():
+        # An empty first page stands for the former .exists() check
+        if not page and not request.query_params.get('cursor') and not request.query_params.get('page'):
             return Response(
                 data=[],
                 status=status.HTTP_204_NO_CONTENT
             )
 
-        serializer = AllProjectsSerializer(projects, many=True)
-
-        return Response(
-            serializer.data,
-            status=status.HTTP_200_OK,
-        )
+        serializer = AllProjectsSerializer(page, many=True)
+        return self.paginator.get_paginated_response(serializer.data)
 
     def post(self, request: Request) -> Response:
         serializer = CreateProjectSerializer(data=request.data)
@@ -63,41 +63,81 @@ class ProjectsListAPIView(APIView):
         )
 
 
-class ProjectDetailAPIView(APIView):
+class ProjectDetailAPIView(ConditionalRequestMixin, APIView):
+    # validators, project with its counters; a 304 costs only the validators
+    query_budget = {'GET': 2}
+
     def get_object(self, pk: int):
-        return get_object_or_404(Project, pk=pk)
+        return get_object_or_404(Project.objects.select_related('task_summary'), pk=pk)
+
+    def get_validators(self):
+        versions = (
+            Project.objects.filter(pk=self.kwargs['pk'])
+            .order_by()
+            .values_list('updated_at', 'task_summary__updated_at')
+            .first()
+        )
+
+        if versions is None:
+            raise Http404
+
+        # The task count comes from the summary, which changes on its own
+        self.updated_at, summary_updated_at = versions
+        return self.project_etag(self.updated_at, summary_updated_at)
+
+    @staticmethod
+    def summary_updated_at(project: Project):
+        summary = getattr(project, 'task_summary', None)
+        return summary.updated_at if summary is not None else None
+
+    @staticmethod
+    def project_etag(updated_at, summary_updated_at):
+        versions = [updated_at] + ([summary_updated_at] if summary_updated_at else [])
+        return make_etag(*versions), max(versions)
 
     def get(self, request: Request, pk: int) -> Response:
+        not_modified = self.evaluate_preconditions(request)
+
+        if not_modified is not None:
+            return not_modified
+
         project = self.get_object(pk=pk)
 
         serializer = ProjectDetailSerializer(project)
 
-        return Response(
+        return self.set_validators(Response(
             serializer.data,
             status=status.HTTP_200_OK,
-        )
+        ), self.project_etag(project.updated_at, self.summary_updated_at(project)))
 
     def put(self, request: Request, pk: int) -> Response:
-        project = self.get_object(pk=pk)
+        with transaction.atomic():
+            precondition_failed = self.evaluate_preconditions(request)
 
-        serializer = CreateProjectSerializer(
-            instance=project,
-            data=request.data,
-            partial=True
-        )
+            if precondition_failed is not None:
+                return precondition_failed
 
-        if serializer.is_valid(raise_exception=True):
-            serializer.save()
+            if not self.claim_version(request, Project.objects.filter(pk=pk)):
+                return Response(
+                    data={"message": "The project has been modified concurrently."},
+                    status=status.HTTP_412_PRECONDITION_FAILED,
+                )
 
-            return Response(
-                serializer.validated_data,
-                status=status.HTTP_200_OK,
+            project = self.get_object(pk=pk)
+
+            serializer = CreateProjectSerializer(
+                instance=project,
+                data=request.data,
+                partial=True
             )
 
-        return Response(
-            serializer.errors,
-            status=status.HTTP_400_BAD_REQUEST,
-        )
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        return self.set_validators(Response(
+            serializer.validated_data,
+            status=status.HTTP_200_OK,
+        ), self.project_etag(project.updated_at, self.summary_updated_at(project)))
 
     def delete(self, request: Request, pk: int) -> Response:
         project = self.get_object(pk=pk)
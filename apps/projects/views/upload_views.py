@@ -0,0 +1,104 @@
+from io import BytesIO
+from rest_framework.generics import get_object_or_404
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.views import APIView
+from apps.projects.models import UploadSession
+from apps.projects.serializers.project_file_serializers import ProjectFileDetailSerializer
+from apps.projects.serializers.upload_session_serializers import *
+from apps.projects.utils.upload_sessions import (
+    UploadError, commit_session, discard_session, open_session, write_chunk,
+)
+
+
+class OpenUploadSessionMixin:
+    def get_session(self, pk) -> UploadSession:
+        return get_object_or_404(UploadSession.objects.select_related('project'), pk=pk)
+
+    def get_open_session(self, pk) -> UploadSession | Response:
+        session = self.get_session(pk)
+
+        if session.status != UploadSession.OPEN:
+            return Response(
+                data={"message": "The upload has already been committed."},
+                status=status.HTTP_409_CONFLICT
+            )
+
+        return session
+
+
+class UploadSessionCreateAPIView(APIView):
+    def post(self, request: Request) -> Response:
+        serializer = CreateUploadSessionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        session = serializer.save()
+        open_session(session)
+
+        return Response(
+            UploadSessionSerializer(session).data,
+            status=status.HTTP_201_CREATED
+        )
+
+
+class UploadSessionDetailAPIView(OpenUploadSessionMixin, APIView):
+    def get(self, request: Request, pk) -> Response:
+        return Response(
+            UploadSessionSerializer(self.get_session(pk)).data,
+            status=status.HTTP_200_OK
+        )
+
+    def delete(self, request: Request, pk) -> Response:
+        session = self.get_open_session(pk)
+        if isinstance(session, Response):
+            return session
+
+        discard_session(session)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class UploadChunkAPIView(OpenUploadSessionMixin, APIView):
+    """
+    ``PUT`` the raw bytes of one chunk. The body is streamed to disk and
+    never parsed, so it doesn't count against ``DATA_UPLOAD_MAX_MEMORY_SIZE``.
+    """
+
+    def put(self, request: Request, pk, index: int) -> Response:
+        session = self.get_open_session(pk)
+        if isinstance(session, Response):
+            return session
+
+        try:
+            chunk = write_chunk(session, index, request.stream or BytesIO())
+        except UploadError as e:
+            return Response(
+                data={"message": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            UploadChunkSerializer(chunk).data,
+            status=status.HTTP_200_OK
+        )
+
+
+class UploadSessionCommitAPIView(OpenUploadSessionMixin, APIView):
+    def post(self, request: Request, pk) -> Response:
+        session = self.get_open_session(pk)
+        if isinstance(session, Response):
+            return session
+
+        try:
+            project_file = commit_session(session)
+        except UploadError as e:
+            return Response(
+                data={"message": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            ProjectFileDetailSerializer(project_file).data,
+            status=status.HTTP_201_CREATED
+        )
@@ -5,4 +5,5 @@ urlpatterns = [
     path('tasks/', include('apps.tasks.urls')),
     path('projects/', include('apps.projects.urls')),
     path('users/', include('apps.users.urls')),
+    path('async/', include('apps.async_routers')),
 ]
@@ -1,7 +1,7 @@
 from enum import Enum
 
 
-class Statuses(Enum):
+class Statuses(str, Enum):
     NEW = "NEW"
     IN_PROGRESS = "IN_PROGRESS"
     PENDING = "PENDING"
@@ -12,3 +12,4 @@ class Statuses(Enum):
     @classmethod
     def choices(cls):
         return [(attr.name, attr.value) for attr in cls]
+
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.tasks.utils.task_summary import find_inconsistencies, rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = "Compare the per-project task summaries with the tasks table."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fix', action='store_true', help="Rebuild the drifted summaries.")
+
+    def handle(self, *args, **options):
+        inconsistencies = find_inconsistencies()
+
+        if not inconsistencies:
+            self.stdout.write(self.style.SUCCESS("All project task summaries are consistent."))
+            return
+
+        for project_id, drift in inconsistencies.items():
+            details = ', '.join(
+                f"{field}: {stored} != {actual}" for field, (stored, actual) in drift.items()
+            )
+            self.stdout.write(self.style.WARNING(f"Project {project_id}: {details}"))
+
+        if options['fix']:
+            rebuild_summaries(inconsistencies)
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(inconsistencies)} project task summaries."))
+        else:
+            raise CommandError(f"{len(inconsistencies)} project task summaries are inconsistent.")
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.tasks.serializers.task_filter_serializers import TaskExportSerializer
+from apps.tasks.models import Task
+from apps.tasks.utils.task_export import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, export_tasks
+
+
+class Command(BaseCommand):
+    help = "Stream tasks as NDJSON or CSV to a file or stdout, with constant memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', choices=list(EXPORT_FORMATS), default='ndjson')
+        parser.add_argument('--file', help="Write to this file instead of stdout.")
+        parser.add_argument('--project', help="Only export the tasks of this project (by name).")
+        parser.add_argument('--assignee', help="Only export the tasks of this assignee (by email).")
+        parser.add_argument('--status', help="Comma-separated statuses.")
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        params = {
+            key: options[key]
+            for key in ('project', 'assignee', 'status')
+            if options[key]
+        }
+        task_filter = TaskExportSerializer(data=params)
+
+        if not task_filter.is_valid():
+            raise CommandError(task_filter.errors)
+
+        lines = export_tasks(
+            task_filter.filter_queryset(Task.objects.all()),
+            options['output'],
+            chunk_size=options['chunk_size'],
+        )
+
+        if not options['file']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+
+        with open(options['file'], 'w', encoding='utf-8', newline='') as stream:
+            stream.writelines(lines)
+
+        self.stderr.write(self.style.SUCCESS(f"Exported the tasks to {options['file']}."))
@@ -0,0 +1,48 @@
+import zipfile
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from apps.projects.models import ProjectFile
+from apps.tasks.utils.task_import import IMPORT_CHUNK_SIZE, import_tasks
+
+
+class Command(BaseCommand):
+    help = "Create tasks from a .csv/.xlsx file and report the throughput in rows per second."
+
+    def add_arguments(self, parser):
+        source = parser.add_mutually_exclusive_group(required=True)
+        source.add_argument('--file-id', type=int, help="Id of a stored ProjectFile.")
+        source.add_argument('--path', help="Path of a file on disk.")
+        parser.add_argument('--project', help="Project name for rows without a project column.")
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE)
+        parser.add_argument('--show-errors', type=int, default=20, help="How many row errors to print.")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        extension = None
+
+        if options['file_id']:
+            try:
+                project_file = ProjectFile.objects.get(pk=options['file_id'])
+            except ProjectFile.DoesNotExist:
+                raise CommandError(f"ProjectFile {options['file_id']} does not exist.")
+            path = project_file.file_path.path
+            extension = Path(project_file.file_name).suffix
+
+        try:
+            report = import_tasks(
+                path,
+                default_project=options['project'],
+                chunk_size=options['chunk_size'],
+                extension=extension,
+            )
+        # FileReadError is a ValueError
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            raise CommandError(str(e))
+
+        for error in report['errors'][:options['show_errors']]:
+            self.stdout.write(self.style.WARNING(f"Row {error['row']}: {error['errors']}"))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Read {report['rows']} rows: {report['created']} tasks created, {report['failed']} rejected "
+            f"in {report['seconds']} s ({report['rows_per_second']} rows/s)."
+        ))
@@ -0,0 +1,42 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from apps.tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        "Hard-delete soft-deleted tasks older than --days in small batches, "
+        "each in its own short transaction so the SQLite write lock is released between them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30, help="Keep tombstones younger than this many days.")
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--pause', type=float, default=0.05, help="Seconds to sleep between batches.")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        tombstones = Task.all_objects.filter(deleted_at__lt=cutoff)
+        purged = 0
+
+        while True:
+            with transaction.atomic():
+                # Served by the partial index over tombstones
+                ids = list(tombstones.order_by('deleted_at').values_list('pk', flat=True)[:options['batch_size']])
+
+                if not ids:
+                    break
+
+                Task.tags.through.objects.filter(task_id__in=ids).delete()
+                Task.all_objects.filter(pk__in=ids).delete()
+
+            purged += len(ids)
+            self.stdout.write(f"Purged {purged} tasks...")
+
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} soft-deleted tasks older than {cutoff:%Y-%m-%d %H:%M}."))
@@ -0,0 +1,97 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from apps.tasks.models import Task
+from apps.tasks.utils.task_search import FTS_TABLE, fts_table_sql, fts_triggers_sql
+
+SHADOW_TABLE = f'{FTS_TABLE}_new'
+PROGRESS_TABLE = f'{FTS_TABLE}_rebuild'
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the full-text search index of tasks into a new index, in chunks that each run in "
+        "their own short transaction, then swap it in. Searches keep using the old index meanwhile."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--pause', type=float, default=0.05, help="Seconds to sleep between chunks.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError("The full-text search index only exists on SQLite.")
+
+        table = Task._meta.db_table
+
+        # The shadow triggers keep the tasks indexed so far up to date; the
+        # others are copied with their current values when their chunk comes
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.drop_shadow(cursor)
+            cursor.execute(fts_table_sql(SHADOW_TABLE))
+            cursor.execute(f"CREATE TABLE {PROGRESS_TABLE} (last_id INTEGER NOT NULL)")
+            cursor.execute(f"INSERT INTO {PROGRESS_TABLE} (last_id) VALUES (0)")
+            for sql in fts_triggers_sql(SHADOW_TABLE, indexed_up_to=f'(SELECT last_id FROM {PROGRESS_TABLE})'):
+                cursor.execute(sql)
+
+        last_id = 0
+        indexed = 0
+
+        while True:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT max(id) FROM (SELECT id FROM {table} WHERE id > %s ORDER BY id LIMIT %s)",
+                    [last_id, options['chunk_size']],
+                )
+                end = cursor.fetchone()[0]
+                if end is None:
+                    break
+
+                indexed += self.copy_rows(cursor, table, last_id, end)
+                cursor.execute(f"UPDATE {PROGRESS_TABLE} SET last_id = %s", [end])
+
+            last_id = end
+            self.stdout.write(f"Indexed {indexed} tasks...")
+
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {SHADOW_TABLE}({SHADOW_TABLE}) VALUES ('optimize')")
+
+        # Tasks created since the last chunk, then the swap: short, but the
+        # writers must not see the index without its triggers
+        with transaction.atomic(), connection.cursor() as cursor:
+            indexed += self.copy_rows(cursor, table, last_id)
+            self.drop_shadow(cursor, keep_table=True)
+            for trigger in ('ai', 'ad', 'au'):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{trigger}")
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+            cursor.execute(f"ALTER TABLE {SHADOW_TABLE} RENAME TO {FTS_TABLE}")
+            for sql in fts_triggers_sql(FTS_TABLE):
+                cursor.execute(sql)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the search index of {indexed} tasks."))
+
+    @staticmethod
+    def copy_rows(cursor, table: str, after: int, up_to: int = None) -> int:
+        sql = (
+            f"INSERT INTO {SHADOW_TABLE}(rowid, name, description) "
+            f"SELECT id, name, description FROM {table} WHERE id > %s"
+        )
+        params = [after]
+        if up_to is not None:
+            sql += " AND id <= %s"
+            params.append(up_to)
+
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+    @staticmethod
+    def drop_shadow(cursor, keep_table: bool = False) -> None:
+        """Drops the shadow index of an interrupted rebuild, or only its bookkeeping."""
+        for trigger in ('ai', 'ad', 'au'):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {SHADOW_TABLE}_{trigger}")
+        cursor.execute(f"DROP TABLE IF EXISTS {PROGRESS_TABLE}")
+        if not keep_table:
+            cursor.execute(f"DROP TABLE IF EXISTS {SHADOW_TABLE}")
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from apps.tasks.utils.task_summary import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-project task summaries from the tasks table."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', type=int, action='append', dest='projects',
+                            help="Only rebuild this project id (can be repeated).")
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_summaries(options['projects'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} project task summaries."))
@@ -0,0 +1,52 @@
+# Generated by Django 5.1 on 2026-10-18 17:37
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def strip_status_enum_prefix(apps, schema_editor):
+    # Rows created with the old non-str ``Statuses`` default were stored as
+    # "Statuses.NEW" instead of "NEW", which the status filters never match.
+    Task = apps.get_model('tasks', 'Task')
+    for task_status in ('NEW', 'IN_PROGRESS', 'PENDING', 'BLOCKED', 'TESTING', 'CLOSED'):
+        Task.objects.filter(status=f'Statuses.{task_status}').update(status=task_status)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_projectfile_project_files'),
+        ('tasks', '0003_task_deadline_id_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='assignee',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='tasks', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='project',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='projects.project'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'status', 'deadline'], name='task_project_status_dl_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['assignee', 'status', 'deadline'], name='task_assignee_status_dl_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'deadline'], name='task_status_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['priority', 'deadline'], name='task_priority_deadline_idx'),
+        ),
+        migrations.RunPython(strip_status_enum_prefix, migrations.RunPython.noop),
+    ]
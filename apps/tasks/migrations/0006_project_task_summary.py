@@ -0,0 +1,60 @@
+# Generated by Django 5.1 on 2026-10-18 17:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+PRIORITIES = ('very_low', 'low', 'medium', 'high', 'critical')
+
+
+def fill_summaries(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    Task = apps.get_model('tasks', 'Task')
+    ProjectTaskSummary = apps.get_model('tasks', 'ProjectTaskSummary')
+
+    summaries = {pk: ProjectTaskSummary(project_id=pk) for pk in Project.objects.values_list('pk', flat=True)}
+    rows = (
+        Task.objects.filter(deleted_at__isnull=True)
+        .values('project_id', 'status', 'priority')
+        .annotate(amount=models.Count('id'))
+        .order_by()
+    )
+    for row in rows:
+        summary = summaries[row['project_id']]
+        status_field = f"status_{row['status'].lower()}"
+        priority_field = f"priority_{PRIORITIES[row['priority'] - 1]}"
+        summary.total += row['amount']
+        setattr(summary, status_field, getattr(summary, status_field) + row['amount'])
+        setattr(summary, priority_field, getattr(summary, priority_field) + row['amount'])
+
+    ProjectTaskSummary.objects.bulk_create(summaries.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_projectfile_project_files'),
+        ('tasks', '0005_task_soft_delete'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectTaskSummary',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_summary', serialize=False, to='projects.project')),
+                ('total', models.IntegerField(default=0)),
+                ('status_new', models.IntegerField(default=0)),
+                ('status_in_progress', models.IntegerField(default=0)),
+                ('status_pending', models.IntegerField(default=0)),
+                ('status_blocked', models.IntegerField(default=0)),
+                ('status_testing', models.IntegerField(default=0)),
+                ('status_closed', models.IntegerField(default=0)),
+                ('priority_very_low', models.IntegerField(default=0)),
+                ('priority_low', models.IntegerField(default=0)),
+                ('priority_medium', models.IntegerField(default=0)),
+                ('priority_high', models.IntegerField(default=0)),
+                ('priority_critical', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(fill_summaries, migrations.RunPython.noop),
+    ]
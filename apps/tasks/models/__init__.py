@@ -1,2 +1,3 @@
 from .tag import *
 from .tasks import *
+from .project_summary import *
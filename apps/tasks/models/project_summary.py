@@ -0,0 +1,50 @@
+from django.db import models
+from apps.projects.models.project import Project
+from apps.tasks.choices.priorities import Priority
+from apps.tasks.choices.statuses import Statuses
+
+
+class ProjectTaskSummary(models.Model):
+    """
+    Live task counts per project, kept up to date by the receivers in
+    ``apps.tasks.receivers.task_summary`` instead of a ``GROUP BY`` per request.
+    """
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='task_summary'
+    )
+    total = models.IntegerField(default=0)
+    status_new = models.IntegerField(default=0)
+    status_in_progress = models.IntegerField(default=0)
+    status_pending = models.IntegerField(default=0)
+    status_blocked = models.IntegerField(default=0)
+    status_testing = models.IntegerField(default=0)
+    status_closed = models.IntegerField(default=0)
+    priority_very_low = models.IntegerField(default=0)
+    priority_low = models.IntegerField(default=0)
+    priority_medium = models.IntegerField(default=0)
+    priority_high = models.IntegerField(default=0)
+    priority_critical = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    COUNTER_FIELDS = (
+        'total',
+        *(f'status_{status.name.lower()}' for status in Statuses),
+        *(f'priority_{priority.name.lower()}' for priority in Priority),
+    )
+
+    @staticmethod
+    def status_field(status: str) -> str:
+        return f'status_{Statuses(status).name.lower()}'
+
+    @staticmethod
+    def priority_field(priority: int) -> str:
+        return f'priority_{next(p for p in Priority if p[0] == priority).name.lower()}'
+
+    def counters(self) -> dict[str, int]:
+        return {field: getattr(self, field) for field in self.COUNTER_FIELDS}
+
+    def __str__(self):
+        return f"Task summary of {self.project_id}"
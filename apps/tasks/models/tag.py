@@ -3,7 +3,7 @@ from django.core.validators import MinLengthValidator
 
 
 class Tag(models.Model):
-    name = models.CharField(max_length=20, validators=[MinLengthValidator(4)])
+    name = models.CharField(max_length=20, validators=[MinLengthValidator(4)], db_index=True)
 
     def __str__(self):
         return self.name
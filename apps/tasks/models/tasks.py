@@ -1,11 +1,38 @@
 from apps.users.models import User
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
 from apps.projects.models.project import Project
 from apps.tasks.choices.statuses import Statuses
 from apps.tasks.choices.priorities import Priority
+from apps.tasks.signals import tasks_bulk_updated, tasks_pre_bulk_update
 from apps.tasks.utils.set_end_of_month import calculate_end_of_month
 
 
+LIVE = Q(deleted_at__isnull=True)
+
+
+class TaskQuerySet(models.QuerySet):
+    def soft_delete(self) -> int:
+        now = timezone.now()
+        queryset = self.filter(LIVE)
+        changes = {'deleted_at': now}
+
+        with transaction.atomic():
+            tasks_pre_bulk_update.send(sender=self.model, queryset=queryset, changes=changes)
+            count = queryset.update(**changes, updated_at=now)
+            tasks_bulk_updated.send(sender=self.model, changes=changes, count=count)
+
+        return count
+
+
+class LiveTaskManager(models.Manager.from_queryset(TaskQuerySet)):
+    """Hides soft-deleted tasks, use ``Task.all_objects`` to see them."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(LIVE)
+
+
 class Task(models.Model):
     name = models.CharField(
         max_length=120
@@ -23,7 +50,8 @@ class Task(models.Model):
     project = models.ForeignKey(
         Project,
         on_delete=models.CASCADE,
-        related_name='tasks'
+        related_name='tasks',
+        db_index=False,
     )
     tags = models.ManyToManyField('Tag', related_name='tasks')
     created_at = models.DateTimeField(auto_now_add=True)
@@ -35,12 +63,55 @@ class Task(models.Model):
         on_delete=models.PROTECT,
         related_name='tasks',
         null=True,
-        blank=True
+        blank=True,
+        db_index=False,
     )
 
+    objects = LiveTaskManager()
+    all_objects = TaskQuerySet.as_manager()
+
     class Meta:
         ordering = ['-deadline']
-        unique_together = ('name', 'project')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['name', 'project'],
+                condition=LIVE,
+                name='task_unique_live_name_per_project',
+            ),
+        ]
+        # Partial indexes over live rows only: queries through ``Task.objects``
+        # never touch tombstones. The composite indexes also serve the plain
+        # project/assignee FK lookups, so the FKs don't get a separate index.
+        indexes = [
+            models.Index(fields=['deadline', 'id'], condition=LIVE, name='task_deadline_id_idx'),
+            models.Index(fields=['project', 'status', 'deadline'], condition=LIVE, name='task_project_status_dl_idx'),
+            models.Index(fields=['assignee', 'status', 'deadline'], condition=LIVE, name='task_assignee_status_dl_idx'),
+            models.Index(fields=['status', 'deadline'], condition=LIVE, name='task_status_deadline_idx'),
+            models.Index(fields=['priority', 'deadline'], condition=LIVE, name='task_priority_deadline_idx'),
+            models.Index(fields=['deleted_at'], condition=Q(deleted_at__isnull=False), name='task_tombstone_idx'),
+        ]
+
+    # Values as loaded from the database, used by the receivers that maintain
+    # aggregates to compute what a save changed
+    TRACKED_FIELDS = ('project_id', 'assignee_id', 'status', 'priority', 'deleted_at')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_tracked_values()
+        return instance
+
+    def remember_tracked_values(self) -> None:
+        deferred = self.get_deferred_fields()
+        self._loaded_values = {
+            field: getattr(self, field)
+            for field in self.TRACKED_FIELDS
+            if field not in deferred
+        }
+
+    def soft_delete(self) -> None:
+        self.deleted_at = timezone.now()
+        self.save(update_fields=['deleted_at', 'updated_at'])
 
     def __str__(self):
         return f"{self.name}, status: {self.status}"
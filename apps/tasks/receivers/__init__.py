@@ -0,0 +1,3 @@
+from . import task_summary
+from . import response_cache
+from . import task_tags
@@ -0,0 +1,12 @@
+from django.dispatch import receiver
+from apps.core.response_cache import invalidate, is_tracked
+from apps.tasks.models import Task
+from apps.tasks.signals import tasks_bulk_created, tasks_bulk_updated
+
+
+@receiver(tasks_bulk_created, sender=Task)
+@receiver(tasks_bulk_updated, sender=Task)
+def invalidate_tasks_on_bulk_write(sender, **kwargs):
+    # bulk_create() and update() send no post_save
+    if is_tracked(Task):
+        invalidate(Task._meta.label)
@@ -0,0 +1,83 @@
+from collections import Counter, defaultdict
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from apps.projects.models import Project
+from apps.tasks.models import ProjectTaskSummary, Task
+from apps.tasks.signals import tasks_bulk_created, tasks_pre_bulk_update
+from apps.tasks.utils.task_summary import (
+    apply_deltas, bucket_fields, group_rows, merge_deltas, task_contribution,
+)
+
+
+def current_values(task: Task) -> dict:
+    return {field: getattr(task, field) for field in Task.TRACKED_FIELDS}
+
+
+@receiver(post_save, sender=Project)
+def create_summary_for_project(sender, instance: Project, created: bool, raw: bool = False, **kwargs):
+    # Every project starts with an empty row, so task writes only ever need an UPDATE
+    if created and not raw:
+        ProjectTaskSummary.objects.get_or_create(project=instance)
+
+
+@receiver(post_save, sender=Task)
+def update_summary_on_save(sender, instance: Task, created: bool, **kwargs):
+    new = current_values(instance)
+    old = getattr(instance, '_loaded_values', None)
+
+    if created or old is None:
+        deltas = task_contribution(new, +1)
+    else:
+        deltas = merge_deltas(
+            task_contribution({**new, **old}, -1),
+            task_contribution(new, +1),
+        )
+
+    apply_deltas(deltas)
+    instance.remember_tracked_values()
+
+
+@receiver(post_delete, sender=Task)
+def update_summary_on_delete(sender, instance: Task, **kwargs):
+    old = getattr(instance, '_loaded_values', None) or {}
+    apply_deltas(
+        task_contribution({**current_values(instance), **old}, -1),
+        create_missing=False,
+    )
+
+
+@receiver(tasks_bulk_created, sender=Task)
+def update_summary_on_bulk_create(sender, tasks: list[Task], **kwargs):
+    apply_deltas(merge_deltas(*(
+        task_contribution(current_values(task), +1) for task in tasks
+    )))
+
+
+@receiver(tasks_pre_bulk_update, sender=Task)
+def update_summary_on_bulk_update(sender, queryset, changes: dict, **kwargs):
+    """
+    Runs right before the set-based ``UPDATE``: the affected rows are grouped
+    by (project, status, priority) with one query and moved to their new
+    buckets, or just removed when they are being soft-deleted.
+    """
+    removed = changes.get('deleted_at') is not None
+
+    if not removed and 'status' not in changes and 'priority' not in changes:
+        return
+
+    deltas = defaultdict(Counter)
+
+    for project_id, task_status, priority, amount in group_rows(queryset):
+        for field in bucket_fields(task_status, priority):
+            deltas[project_id][field] -= amount
+
+        if not removed:
+            new_buckets = bucket_fields(
+                changes.get('status', task_status),
+                changes.get('priority', priority),
+            )
+            for field in new_buckets:
+                deltas[project_id][field] += amount
+
+    # A missing row would be rebuilt from the rows not updated yet
+    apply_deltas(deltas, create_missing=False)
@@ -0,0 +1,31 @@
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from apps.tasks.models import Tag, Task
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def touch_tasks_on_tags_change(sender, instance, action, reverse, pk_set, **kwargs):
+    # The tags are part of the task detail, so they move its ETag too
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+
+    if not reverse:
+        tasks = Task.all_objects.filter(pk=instance.pk)
+    elif action == 'pre_clear':
+        tasks = Task.all_objects.filter(tags=instance)
+    else:
+        tasks = Task.all_objects.filter(pk__in=pk_set)
+
+    tasks.update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=Tag)
+@receiver(pre_delete, sender=Tag)
+def touch_tasks_on_tag_write(sender, instance, created=False, **kwargs):
+    # A renamed tag changes the detail of its tasks; a deleted one drops its
+    # links without m2m_changed, so the tasks are touched before that
+    if created:
+        return
+
+    Task.all_objects.filter(tags=instance).update(updated_at=timezone.now())
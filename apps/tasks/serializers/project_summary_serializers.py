@@ -0,0 +1,29 @@
+from rest_framework import serializers
+from apps.tasks.choices.priorities import Priority
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.models import ProjectTaskSummary
+
+
+class ProjectTaskSummarySerializer(serializers.ModelSerializer):
+    statuses = serializers.SerializerMethodField()
+    priorities = serializers.SerializerMethodField()
+    overdue = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ProjectTaskSummary
+        fields = ('project', 'total', 'statuses', 'priorities', 'overdue', 'updated_at')
+
+    def get_statuses(self, obj: ProjectTaskSummary) -> dict[str, int]:
+        return {
+            status.name: getattr(obj, ProjectTaskSummary.status_field(status.value))
+            for status in Statuses
+        }
+
+    def get_priorities(self, obj: ProjectTaskSummary) -> dict[str, int]:
+        return {
+            priority.name: getattr(obj, ProjectTaskSummary.priority_field(priority[0]))
+            for priority in Priority
+        }
+
+    def get_overdue(self, obj: ProjectTaskSummary) -> int:
+        return self.context['overdue']
@@ -0,0 +1,136 @@
+from django.db.models import QuerySet
+from rest_framework import serializers
+from apps.tasks.choices.priorities import Priority
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.utils.task_export import EXPORT_FORMATS
+from apps.tasks.utils.task_search import search_tasks
+
+
+class CommaSeparatedField(serializers.CharField):
+    def to_internal_value(self, data) -> list[str]:
+        value = super().to_internal_value(data)
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+
+class TaskFilterSerializer(serializers.Serializer):
+    """
+    Validates the task list query params and turns them into a queryset.
+
+    Every filter is optional and they can be combined freely. The filters
+    map onto the composite ``Task`` indexes, so each supported combination
+    is resolved with an index search instead of a table scan.
+
+    ``q`` is a full-text search over the task name and description; its
+    results are ranked by relevance unless another ``ordering`` is given.
+    """
+    ORDERINGS = {
+        'deadline': ('deadline', 'id'),
+        '-deadline': ('-deadline', '-id'),
+        'priority': ('priority', 'deadline', 'id'),
+        '-priority': ('-priority', '-deadline', '-id'),
+        'created_at': ('created_at', 'id'),
+        '-created_at': ('-created_at', '-id'),
+        'rank': ('search_rank', 'id'),
+    }
+    DEFAULT_ORDERING = '-deadline'
+    SEARCH_ORDERING = 'rank'
+
+    q = serializers.CharField(required=False, max_length=200)
+
+    project = serializers.CharField(required=False)
+    project_name = serializers.CharField(required=False)
+    assignee = serializers.EmailField(required=False)
+    assignee_email = serializers.EmailField(required=False)
+    status = CommaSeparatedField(required=False)
+    priority = CommaSeparatedField(required=False)
+    tag = CommaSeparatedField(required=False)
+    deadline_from = serializers.DateTimeField(required=False)
+    deadline_to = serializers.DateTimeField(required=False)
+    ordering = serializers.ChoiceField(
+        choices=list(ORDERINGS),
+        default=DEFAULT_ORDERING,
+    )
+
+    def validate_status(self, value: list[str]) -> list[str]:
+        available = [status.name for status in Statuses]
+        invalid = [item for item in value if item not in available]
+
+        if invalid:
+            raise serializers.ValidationError(
+                f"Unknown statuses: {invalid}. Available: {available}"
+            )
+        return value
+
+    def validate_priority(self, value: list[str]) -> list[int]:
+        available = [val[0] for val in Priority.choices()]
+
+        try:
+            priorities = [int(item) for item in value]
+        except ValueError:
+            raise serializers.ValidationError("The priority must be a list of integers")
+
+        if not set(priorities) <= set(available):
+            raise serializers.ValidationError(
+                f"The priority must be one of the available options: {available}"
+            )
+        return priorities
+
+    def validate(self, data: dict) -> dict:
+        data['project'] = data.pop('project_name', None) or data.get('project')
+        data['assignee'] = data.pop('assignee_email', None) or data.get('assignee')
+
+        if data.get('q') and 'ordering' not in self.initial_data:
+            data['ordering'] = self.SEARCH_ORDERING
+
+        if data['ordering'] == self.SEARCH_ORDERING and not data.get('q'):
+            raise serializers.ValidationError(
+                {"ordering": "Ordering by rank needs a search query"}
+            )
+
+        deadline_from = data.get('deadline_from')
+        deadline_to = data.get('deadline_to')
+
+        if deadline_from and deadline_to and deadline_from > deadline_to:
+            raise serializers.ValidationError(
+                {"deadline_to": "The end of the deadline range couldn't be before its start"}
+            )
+        return data
+
+    def get_ordering(self) -> tuple[str, ...]:
+        return self.ORDERINGS[self.validated_data['ordering']]
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        data = self.validated_data
+
+        if data.get('q'):
+            queryset = search_tasks(queryset, data['q'])
+
+        if data.get('project'):
+            queryset = queryset.filter(project__name=data['project'])
+
+        if data.get('assignee'):
+            queryset = queryset.filter(assignee__email=data['assignee'])
+
+        if data.get('status'):
+            queryset = queryset.filter(status__in=data['status'])
+
+        if data.get('priority'):
+            queryset = queryset.filter(priority__in=data['priority'])
+
+        if data.get('deadline_from'):
+            queryset = queryset.filter(deadline__gte=data['deadline_from'])
+
+        if data.get('deadline_to'):
+            queryset = queryset.filter(deadline__lte=data['deadline_to'])
+
+        if data.get('tag'):
+            queryset = queryset.filter(tags__name__in=data['tag'])
+            if len(data['tag']) > 1:
+                queryset = queryset.distinct()
+
+        return queryset.order_by(*self.get_ordering())
+
+
+class TaskExportSerializer(TaskFilterSerializer):
+    """The task list filters plus the export format (``format`` is taken by DRF)."""
+    output = serializers.ChoiceField(choices=list(EXPORT_FORMATS), default='ndjson')
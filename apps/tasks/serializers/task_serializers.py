@@ -6,9 +6,13 @@ from apps.projects.models import Project
 from apps.projects.serializers.project_serializers import ProjectShortInfoSerializer
 from apps.tasks.models import Task, Tag
 from apps.tasks.choices.priorities import Priority
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.serializers.task_filter_serializers import TaskFilterSerializer
 from apps.tasks.serializers.tag_serializers import TagSerializer
 from apps.users.models import User
 
+BULK_TRANSITION_MAX_IDS = 5000
+
 
 class AllTasksSerializer(serializers.ModelSerializer):
     project = serializers.SlugRelatedField(
@@ -77,13 +81,6 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
             )
         return value
 
-    def validate_project(self, value: str) -> str:
-        if not Project.objects.filter(name=value).exists():
-            raise serializers.ValidationError(
-                "The project with this name couldn't be found in the database"
-            )
-        return value
-
     def validate_tags(self, value: list[str, ...]) -> list[str, ...]:
         if not Tag.objects.filter(name__in=value).exists():
             raise serializers.ValidationError(
@@ -102,9 +99,8 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
     def create(self, validated_data: dict[str, Any]) -> Task:
         tags = validated_data.pop('tags', [])
         task = Task.objects.create(**validated_data)
-        for tag in tags:
-            task.tags.add(tag)
-        task.save()
+        if tags:
+            task.tags.add(*tags)
         return task
 
     def update(self, instance: Task, validated_data: dict[str, Any]) -> Task:
@@ -114,8 +110,7 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
 
         if tags:
-            for tag in tags:
-                instance.tags.add(tag)
+            instance.tags.add(*tags)
 
         instance.save()
 
@@ -130,3 +125,133 @@ class TaskDetailSerializer(serializers.ModelSerializer):
         model = Task
         exclude = ('updated_at', 'deleted_at')
 
+
+class PreloadedRelatedField(serializers.RelatedField):
+    """
+    Resolves a reference from a ``{value: obj}`` map in the serializer context
+    instead of querying the database for every item of a bulk request.
+    """
+    default_error_messages = {
+        'does_not_exist': 'Object with {lookup}={value} does not exist.',
+    }
+
+    def __init__(self, lookup: str, context_key: str, **kwargs):
+        self.lookup = lookup
+        self.context_key = context_key
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        try:
+            return self.context[self.context_key][data]
+        except (KeyError, TypeError):
+            self.fail('does_not_exist', lookup=self.lookup, value=str(data))
+
+    def to_representation(self, value):
+        return getattr(value, self.lookup)
+
+
+class BulkCreateTaskItemSerializer(CreateUpdateTaskSerializer):
+    """
+    Validates one item of a bulk request against lookups preloaded by
+    ``apps.tasks.utils.bulk_tasks`` so that the whole batch costs a fixed
+    number of queries.
+    """
+    project = PreloadedRelatedField(
+        lookup='name',
+        context_key='projects',
+        queryset=Project.objects.all(),
+    )
+    assignee = PreloadedRelatedField(
+        lookup='email',
+        context_key='assignees',
+        queryset=User.objects.all(),
+        required=False,
+    )
+    tags = PreloadedRelatedField(
+        lookup='pk',
+        context_key='tags',
+        queryset=Tag.objects.all(),
+        many=True,
+        required=False,
+    )
+
+    class Meta(CreateUpdateTaskSerializer.Meta):
+        # (name, project) uniqueness is checked against the preloaded pairs
+        validators = []
+
+    def validate_tags(self, value: list[Tag]) -> list[Tag]:
+        return value
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        key = (data['name'], data['project'].pk)
+
+        if key in self.context['taken_names']:
+            raise serializers.ValidationError(
+                {"name": "The task with this name already exists in the project"}
+            )
+
+        self.context['taken_names'].add(key)
+
+        return data
+
+
+class BulkTransitionSerializer(serializers.Serializer):
+    """
+    Selects tasks either by ``ids`` or by a ``filter`` (same params as the
+    task list) and describes the ``status``/``priority``/``deadline``
+    changes to apply to all of them.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=BULK_TRANSITION_MAX_IDS,
+    )
+    filter = serializers.DictField(required=False, allow_empty=False)
+    status = serializers.ChoiceField(choices=Statuses.choices(), required=False)
+    priority = serializers.ChoiceField(choices=Priority.choices(), required=False)
+    deadline = serializers.DateTimeField(required=False)
+
+    def validate_filter(self, value: dict) -> TaskFilterSerializer:
+        task_filter = TaskFilterSerializer(data=value)
+
+        if not task_filter.is_valid():
+            raise serializers.ValidationError(task_filter.errors)
+
+        return task_filter
+
+    def validate_status(self, value: str) -> Statuses:
+        return Statuses[value]
+
+    def validate_deadline(self, value: datetime) -> datetime:
+        if value < timezone.now():
+            raise serializers.ValidationError(
+                "The deadline of the task couldn't be in the past"
+            )
+        return value
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        if ('ids' in data) == ('filter' in data):
+            raise serializers.ValidationError(
+                "Provide either a list of task ids or a filter."
+            )
+
+        if not {'status', 'priority', 'deadline'} & set(data):
+            raise serializers.ValidationError(
+                "Provide at least one of status, priority or deadline."
+            )
+
+        return data
+
+    def get_queryset(self):
+        if 'ids' in self.validated_data:
+            return Task.objects.filter(pk__in=self.validated_data['ids'])
+
+        return self.validated_data['filter'].filter_queryset(Task.objects.all())
+
+    def get_changes(self) -> dict[str, Any]:
+        return {
+            field: self.validated_data[field]
+            for field in ('status', 'priority', 'deadline')
+            if field in self.validated_data
+        }
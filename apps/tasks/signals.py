@@ -0,0 +1,13 @@
+from django.dispatch import Signal
+
+# ``bulk_create``/``QuerySet.update()`` skip the model signals, so the bulk
+# task paths send these instead. Receivers run inside the write transaction.
+
+# kwargs: tasks - list of the inserted Task objects (with pk and tag ids set)
+tasks_bulk_created = Signal()
+
+# kwargs: queryset - the rows about to be updated, changes - {field: new value}
+tasks_pre_bulk_update = Signal()
+
+# kwargs: changes - {field: new value}, count - number of updated rows
+tasks_bulk_updated = Signal()
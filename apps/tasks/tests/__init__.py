@@ -1,2 +1,13 @@
 from .tags import *
 from .tasks import *
+from .task_list import *
+from .task_filters import *
+from .queries import *
+from .bulk_create import *
+from .bulk_transition import *
+from .soft_delete import *
+from .task_summary import *
+from .task_search import *
+from .conditional import *
+from .task_export import *
+from .task_import import *
@@ -0,0 +1,105 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task
+from apps.users.models import User
+
+
+class BulkCreateTaskTestCase(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Bulk Project',
+            description='Project used to check the bulk creation of tasks.'
+        )
+        self.user = User.objects.create(
+            username='bulk_user',
+            first_name='bulk',
+            last_name='user',
+            email='bulk@example.com',
+            password='1q9i2w8u3e7y4r6t5'
+        )
+        self.tags = Tag.objects.bulk_create([Tag(name='Backend'), Tag(name='DevOPS')])
+        self.url = reverse('task-bulk-create')
+
+    def item(self, i: int, **overrides) -> dict:
+        item = {
+            'name': f'Imported task number {i}',
+            'description': 'This is a valid task description with more than 50 characters.',
+            'priority': 4,
+            'project': self.project.name,
+            'assignee': self.user.email,
+            'tags': [tag.pk for tag in self.tags],
+            'deadline': (timezone.now() + timedelta(days=10)).isoformat(),
+        }
+        item.update(overrides)
+        return item
+
+    def test_query_count_does_not_depend_on_batch_size(self):
+        # projects + assignees + tags + existing names, savepoint, tasks, task tags,
+        # project summaries, release
+        for start, amount in ((0, 1), (100, 50)):
+            items = [self.item(i) for i in range(start, start + amount)]
+            with self.assertNumQueries(9):
+                response = self.client.post(self.url, items, content_type='application/json')
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(len(response.data['created']), amount)
+
+        self.assertEqual(Task.objects.count(), 51)
+        self.assertEqual(Task.tags.through.objects.count(), 51 * 2)
+
+    def test_errors_are_reported_per_item(self):
+        Task.objects.create(
+            name='Imported task number 3',
+            description='Already existing task.',
+            project=self.project,
+        )
+        items = [
+            self.item(0),
+            self.item(1, project='Unknown project'),
+            self.item(2, name='Short'),
+            self.item(3),
+            self.item(4, tags=[999]),
+            self.item(5),
+            self.item(5),
+        ]
+
+        response = self.client.post(self.url, items, content_type='application/json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([item['index'] for item in response.data['created']], [0, 5])
+        errors = {error['index']: error['errors'] for error in response.data['errors']}
+        self.assertEqual(list(errors), [1, 2, 3, 4, 6])
+        self.assertIn('project', errors[1])
+        self.assertIn('name', errors[2])
+        self.assertIn('name', errors[3])
+        self.assertIn('tags', errors[4])
+        self.assertIn('name', errors[6])
+
+        created = Task.objects.get(pk=response.data['created'][0]['id'])
+        self.assertEqual(created.assignee, self.user)
+        self.assertEqual(set(created.tags.values_list('pk', flat=True)), {tag.pk for tag in self.tags})
+
+    def test_invalid_payload(self):
+        response = self.client.post(self.url, {'name': 'Not a list'}, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(self.url, [self.item(0, project='Unknown project')], content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['created'], [])
+
+    def test_items_that_are_not_objects(self):
+        response = self.client.post(self.url, [1, 2], content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data['errors'],
+            [{'index': 0, 'errors': {'non_field_errors': ['Expected an object.']}},
+             {'index': 1, 'errors': {'non_field_errors': ['Expected an object.']}}],
+        )
+
+        response = self.client.post(self.url, ['task', self.item(0)], content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([item['index'] for item in response.data['created']], [1])
+        self.assertEqual(response.data['errors'][0]['index'], 0)
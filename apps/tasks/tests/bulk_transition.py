@@ -0,0 +1,98 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task
+
+
+class BulkTransitionTestCase(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Sprint Project',
+            description='Project used to check the bulk status transitions.'
+        )
+        self.other_project = Project.objects.create(
+            name='Other Project',
+            description='Its tasks must not be touched by the transitions.'
+        )
+        self.tag = Tag.objects.create(name='Sprint')
+        self.url = reverse('task-bulk-transition')
+
+        statuses = ['IN_PROGRESS', 'IN_PROGRESS', 'IN_PROGRESS', 'NEW', 'TESTING']
+        self.tasks = Task.objects.bulk_create([
+            Task(
+                name=f'Sprint task {i}',
+                description='Task moved by the bulk transition tests.',
+                project=self.project,
+                status=task_status,
+            )
+            for i, task_status in enumerate(statuses)
+        ])
+        self.tasks[0].tags.add(self.tag)
+        self.tasks[1].tags.add(self.tag)
+
+        Task.objects.create(
+            name='Foreign task',
+            description='Task of the other project.',
+            project=self.other_project,
+            status='IN_PROGRESS',
+        )
+
+    def test_transition_by_filter(self):
+        before = timezone.now()
+        payload = {
+            'filter': {'project': self.project.name, 'status': 'IN_PROGRESS'},
+            'status': 'TESTING',
+            'priority': 5,
+        }
+
+        # savepoint, summary groups, summary update, update, release
+        with self.assertNumQueries(5):
+            response = self.client.post(self.url, payload, content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'updated': 3})
+        moved = Task.objects.filter(project=self.project, status='TESTING', priority=5)
+        self.assertEqual(moved.count(), 3)
+        self.assertTrue(all(task.updated_at >= before for task in moved))
+        self.assertEqual(Task.objects.get(name='Foreign task').status, 'IN_PROGRESS')
+
+    def test_transition_by_ids(self):
+        payload = {
+            'ids': [task.pk for task in self.tasks],
+            'status': 'TESTING',
+        }
+
+        response = self.client.post(self.url, payload, content_type='application/json')
+
+        # Any status can be set, like with a single task update
+        self.assertEqual(response.data, {'updated': 5})
+        self.assertEqual(Task.objects.get(pk=self.tasks[3].pk).status, 'TESTING')
+
+    def test_transition_by_tag(self):
+        deadline = timezone.now() + timedelta(days=7)
+        payload = {
+            'filter': {'tag': self.tag.name},
+            'deadline': deadline.isoformat(),
+        }
+
+        response = self.client.post(self.url, payload, content_type='application/json')
+
+        self.assertEqual(response.data, {'updated': 2})
+        self.assertEqual(Task.objects.filter(deadline=deadline).count(), 2)
+
+    def test_invalid_requests(self):
+        invalid_payloads = [
+            {'status': 'TESTING'},
+            {'ids': [1], 'filter': {'project': 'Sprint Project'}, 'status': 'TESTING'},
+            {'ids': [1]},
+            {'ids': [1], 'status': 'DONE'},
+            {'filter': {'status': 'DONE'}, 'status': 'CLOSED'},
+            {'ids': [1], 'deadline': (timezone.now() - timedelta(days=1)).isoformat()},
+        ]
+
+        for payload in invalid_payloads:
+            with self.subTest(payload=payload):
+                response = self.client.post(self.url, payload, content_type='application/json')
+                self.assertEqual(response.status_code, 400)
@@ -0,0 +1,125 @@
+from datetime import timedelta
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from django.utils.http import http_date
+from apps.core.conditional import ConditionalRequestMixin, make_etag
+from apps.projects.models import Project, ProjectFile
+from apps.tasks.models import Tag, Task
+
+
+class ConditionalRequestTestCase(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Conditional Project',
+            description='Project used to check the conditional requests.'
+        )
+        self.task = Task.objects.create(
+            name='Polled task',
+            description='Task polled by the clients with conditional requests.',
+            project=self.project,
+        )
+        self.task_url = reverse('task-detail', kwargs={'pk': self.task.pk})
+        self.project_url = reverse('project-detail', kwargs={'pk': self.project.pk})
+
+    def test_validators_are_sent(self):
+        response = self.client.get(self.task_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['ETag'].startswith('"'))
+        self.assertIn('Last-Modified', response)
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get(self.task_url)['Last-Modified']
+
+        response = self.client.get(self.task_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+        earlier = http_date((self.task.updated_at - timedelta(hours=1)).timestamp())
+        response = self.client.get(self.task_url, HTTP_IF_MODIFIED_SINCE=earlier)
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_changes_with_the_representation(self):
+        etags = [self.client.get(self.task_url)['ETag']]
+
+        self.task.tags.add(Tag.objects.create(name='Conditional'))
+        etags.append(self.client.get(self.task_url)['ETag'])
+
+        self.client.put(self.project_url, {'name': 'Renamed Project'}, content_type='application/json')
+        etags.append(self.client.get(self.task_url)['ETag'])
+
+        self.assertEqual(len(set(etags)), 3)
+
+        response = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etags[0])
+        self.assertEqual(response.status_code, 200)
+
+    def test_tag_writes_change_the_task_etag(self):
+        tag = Tag.objects.create(name='Before')
+        self.task.tags.add(tag)
+        etag = self.client.get(self.task_url)['ETag']
+
+        self.client.put(reverse('tag-detail', kwargs={'pk': tag.pk}), {'name': 'After'}, content_type='application/json')
+
+        response = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual([tag['name'] for tag in response.data['tags']], ['After'])
+
+        etag = response['ETag']
+        self.client.delete(reverse('tag-detail', kwargs={'pk': tag.pk}))
+
+        response = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['tags'], [])
+
+    def test_files_change_the_project_etag(self):
+        etag = self.client.get(self.project_url)['ETag']
+        project_file = ProjectFile.objects.create(file_name='plan.pdf', file_path='documents/plan.pdf')
+
+        self.project.files.add(project_file)
+
+        response = self.client.get(self.project_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count_of_files'], 1)
+
+    def test_if_match_prevents_lost_updates(self):
+        etag = self.client.get(self.task_url)['ETag']
+
+        response = self.client.put(
+            self.task_url, {'name': 'First writer'},
+            content_type='application/json', HTTP_IF_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        response = self.client.put(
+            self.task_url, {'name': 'Second writer'},
+            content_type='application/json', HTTP_IF_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 412)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.name, 'First writer')
+
+    def test_missing_object(self):
+        for name in ('task-detail', 'async-task-detail', 'project-detail', 'async-project-detail'):
+            response = self.client.get(reverse(name, kwargs={'pk': 9999}))
+            self.assertEqual(response.status_code, 404, name)
+
+        response = self.client.put(
+            reverse('task-detail', kwargs={'pk': 9999}), {'name': 'Gone'},
+            content_type='application/json', HTTP_IF_MATCH='"1"',
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_path_without_validators(self):
+        class SyncOnlyView(ConditionalRequestMixin):
+            def get_validators(self):
+                return make_etag(self.updated_at), self.updated_at
+
+        view = SyncOnlyView()
+        view.updated_at = self.task.updated_at
+        request = RequestFactory().get('/', HTTP_IF_NONE_MATCH=make_etag(self.task.updated_at))
+
+        self.assertEqual(view.evaluate_preconditions(request).status_code, 304)
+        # The async path has no validators and serves the request unconditionally
+        self.assertIsNone(async_to_sync(view.aevaluate_preconditions)(request))
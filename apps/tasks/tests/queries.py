@@ -0,0 +1,72 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task
+from apps.users.models import User
+
+
+class TaskQueryCountTestCase(TestCase):
+    """
+    The number of queries of every task endpoint must not depend on the
+    number of returned rows.
+    """
+
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Query Project',
+            description='Project used to pin the number of queries per endpoint.'
+        )
+        self.tags = Tag.objects.bulk_create([Tag(name=f'Tag {i}') for i in range(3)])
+
+    def create_tasks(self, amount: int) -> list[Task]:
+        tasks = []
+        for i in range(amount):
+            user = User.objects.create(
+                username=f'user_{amount}_{i}',
+                first_name='query',
+                last_name='user',
+                email=f'user_{amount}_{i}@example.com',
+                password='1q9i2w8u3e7y4r6t5'
+            )
+            task = Task.objects.create(
+                name=f'Query task {amount} {i}',
+                description='Task for the query count tests.',
+                project=self.project,
+                assignee=user,
+                deadline=timezone.now() + timedelta(days=i + 1),
+            )
+            task.tags.set(self.tags)
+            tasks.append(task)
+        return tasks
+
+    def test_task_list(self):
+        for amount in (1, 10):
+            self.create_tasks(amount)
+            # exists + count + page
+            with self.assertNumQueries(3):
+                self.client.get(reverse('task-list'), {'page_size': 15})
+            # exists + page
+            with self.assertNumQueries(2):
+                self.client.get(reverse('task-list'), {'page_size': 15, 'pagination': 'cursor'})
+
+    def test_task_detail(self):
+        task = self.create_tasks(1)[0]
+        # validators, task with project + tags
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('task-detail', kwargs={'pk': task.pk}))
+        self.assertEqual(len(response.data['tags']), len(self.tags))
+
+        # validators only
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse('task-detail', kwargs={'pk': task.pk}),
+                HTTP_IF_NONE_MATCH=response['ETag'],
+            )
+        self.assertEqual(response.status_code, 304)
+
+    def test_tag_list(self):
+        # exists + tags
+        with self.assertNumQueries(2):
+            self.client.get('/api/v1/tasks/tags/')
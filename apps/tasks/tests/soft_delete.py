@@ -0,0 +1,70 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task
+
+
+class SoftDeleteTaskTestCase(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Soft Project',
+            description='Project used to check the soft deletion of tasks.'
+        )
+        self.tag = Tag.objects.create(name='Tombstone')
+        self.task = Task.objects.create(
+            name='Task to delete',
+            description='Task that will be soft deleted by the tests.',
+            project=self.project,
+        )
+        self.task.tags.add(self.tag)
+
+    def test_delete_keeps_a_tombstone(self):
+        response = self.client.delete(reverse('task-detail', kwargs={'pk': self.task.pk}))
+        self.assertEqual(response.status_code, 204)
+
+        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
+        self.assertFalse(self.project.tasks.exists())
+        self.assertIsNotNone(Task.all_objects.get(pk=self.task.pk).deleted_at)
+        self.assertEqual(Task.tags.through.objects.filter(task_id=self.task.pk).count(), 1)
+
+        response = self.client.get(reverse('task-detail', kwargs={'pk': self.task.pk}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_name_can_be_reused_after_delete(self):
+        self.task.soft_delete()
+
+        Task.objects.create(
+            name=self.task.name,
+            description='Task created with the name of a deleted one.',
+            project=self.project,
+        )
+        self.assertEqual(Task.all_objects.filter(name=self.task.name).count(), 2)
+
+    def test_live_queries_use_partial_indexes(self):
+        plan = Task.objects.filter(project=self.project, status='NEW').explain()
+        self.assertIn('task_project_status_dl_idx', plan)
+
+        plan = Task.all_objects.filter(deleted_at__lt=timezone.now()).explain()
+        self.assertIn('task_tombstone_idx', plan)
+
+    def test_purge_old_tombstones(self):
+        old = Task.objects.bulk_create([
+            Task(name=f'Old task {i}', description='Old tombstone.', project=self.project)
+            for i in range(5)
+        ])
+        for task in old:
+            task.tags.add(self.tag)
+        Task.objects.filter(pk__in=[task.pk for task in old]).soft_delete()
+        Task.all_objects.filter(pk__in=[task.pk for task in old]).update(
+            deleted_at=timezone.now() - timedelta(days=60)
+        )
+        self.task.soft_delete()
+
+        call_command('purge_deleted_tasks', days=30, batch_size=2, pause=0, stdout=StringIO())
+
+        self.assertEqual(list(Task.all_objects.values_list('pk', flat=True)), [self.task.pk])
+        self.assertEqual(Task.tags.through.objects.count(), 1)
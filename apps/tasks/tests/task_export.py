@@ -0,0 +1,105 @@
+import csv
+import json
+import tracemalloc
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task
+from apps.tasks.utils.task_export import EXPORT_COLUMNS, export_tasks
+from apps.users.models import User
+
+
+class TaskExportTestCase(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Export Project',
+            description='Project whose tasks are exported by the tests.'
+        )
+        other_project = Project.objects.create(
+            name='Other Export Project',
+            description='Second project, filtered out of the export.'
+        )
+        self.user = User.objects.create(
+            username='export_user',
+            first_name='export',
+            last_name='user',
+            email='export@example.com',
+            password='1q9i2w8u3e7y4r6t5'
+        )
+        tags = [Tag.objects.create(name='Backend'), Tag.objects.create(name='Api')]
+
+        self.task = Task.objects.create(
+            name='Export, "quoted" task',
+            description='Multi-line\ndescription with a comma, in it.',
+            project=self.project,
+            assignee=self.user,
+        )
+        self.task.tags.add(*tags)
+        Task.objects.bulk_create([
+            Task(name=f'Bulk exported {i}', description='Task for the chunked export.', project=self.project)
+            for i in range(9)
+        ])
+        Task.objects.create(name='Not exported', description='Task of the other project.', project=other_project)
+
+    def stream(self, **params):
+        response = self.client.get(reverse('task-export'), {'project': self.project.name, **params})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_ndjson(self):
+        response, content = self.stream()
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[0]['id'], self.task.id)
+        self.assertEqual(rows[0]['project'], self.project.name)
+        self.assertEqual(rows[0]['assignee'], self.user.email)
+        self.assertEqual(rows[0]['tags'], ['Api', 'Backend'])
+        self.assertEqual(rows[1]['tags'], [])
+
+    def test_csv(self):
+        response, content = self.stream(output='csv', status='NEW')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+
+        rows = list(csv.reader(StringIO(content)))
+        self.assertEqual(tuple(rows[0]), EXPORT_COLUMNS)
+        self.assertEqual(len(rows), 11)
+        self.assertEqual(rows[1][1], self.task.name)
+        self.assertEqual(rows[1][2], self.task.description)
+        self.assertEqual(rows[1][-1], 'Api,Backend')
+
+    def test_invalid_output(self):
+        response = self.client.get(reverse('task-export'), {'output': 'xml'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_tags_are_fetched_once_per_chunk(self):
+        # rows stream + tags of each of the 3 chunks
+        with self.assertNumQueries(4):
+            lines = list(export_tasks(Task.objects.filter(project=self.project), 'ndjson', chunk_size=4))
+        self.assertEqual(len(lines), 10)
+
+    def test_memory_does_not_grow_with_the_export(self):
+        Task.objects.bulk_create([
+            Task(name=f'Memory task {i}', description='x' * 200, project=self.project)
+            for i in range(3000)
+        ])
+
+        tracemalloc.start()
+        try:
+            for _ in export_tasks(Task.objects.all(), 'csv', chunk_size=200):
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # ~3000 rows of 200+ bytes would be well over a megabyte if they were all kept
+        self.assertLess(peak, 1024 * 1024)
+
+    def test_command(self):
+        out = StringIO()
+        call_command('export_tasks', '--project', self.project.name, '--chunk-size', '3', stdout=out)
+        self.assertEqual(len(out.getvalue().splitlines()), 10)
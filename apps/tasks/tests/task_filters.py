@@ -0,0 +1,142 @@
+import re
+from datetime import timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task
+from apps.tasks.serializers.task_filter_serializers import TaskFilterSerializer
+from apps.users.models import User
+
+
+class TaskFilterTestCase(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.project = Project.objects.create(
+            name='Filter Project',
+            description='Project used to check the combined task filters.'
+        )
+        self.other_project = Project.objects.create(
+            name='Other Project',
+            description='Second project, its tasks must never leak into the results.'
+        )
+        self.user = User.objects.create(
+            username='filter_user',
+            first_name='filter',
+            last_name='user',
+            email='filter@example.com',
+            password='1q9i2w8u3e7y4r6t5'
+        )
+        self.tag = Tag.objects.create(name='Backend')
+
+        self.matching = Task.objects.create(
+            name='Matching task',
+            description='Task that matches every filter in the combined query.',
+            project=self.project,
+            assignee=self.user,
+            status='IN_PROGRESS',
+            priority=4,
+            deadline=self.now + timedelta(days=5),
+        )
+        self.matching.tags.add(self.tag)
+
+        Task.objects.create(
+            name='Wrong status',
+            description='Same project and assignee but a different status.',
+            project=self.project,
+            assignee=self.user,
+            status='CLOSED',
+            priority=4,
+            deadline=self.now + timedelta(days=5),
+        )
+        Task.objects.create(
+            name='Wrong project',
+            description='Task in the other project.',
+            project=self.other_project,
+            assignee=self.user,
+            status='IN_PROGRESS',
+            priority=4,
+            deadline=self.now + timedelta(days=5),
+        )
+        Task.objects.create(
+            name='Late deadline',
+            description='Task outside of the deadline range.',
+            project=self.project,
+            assignee=self.user,
+            status='IN_PROGRESS',
+            priority=4,
+            deadline=self.now + timedelta(days=60),
+        )
+
+    def filter_ids(self, **params) -> list[int]:
+        serializer = TaskFilterSerializer(data=params)
+        serializer.is_valid(raise_exception=True)
+        return list(serializer.filter_queryset(Task.objects.all()).values_list('id', flat=True))
+
+    def test_combined_filters(self):
+        ids = self.filter_ids(
+            project=self.project.name,
+            assignee=self.user.email,
+            status='IN_PROGRESS,TESTING',
+            priority='4',
+            tag='Backend',
+            deadline_to=(self.now + timedelta(days=10)).isoformat(),
+        )
+        self.assertEqual(ids, [self.matching.id])
+
+    def test_legacy_params_can_be_combined(self):
+        response = self.client.get(reverse('task-list'), {
+            'project_name': self.project.name,
+            'assignee_email': self.user.email,
+            'status': 'CLOSED',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([task['name'] for task in response.data['results']], ['Wrong status'])
+
+    def test_ordering(self):
+        ids = self.filter_ids(project=self.project.name, ordering='deadline')
+        deadlines = list(Task.objects.filter(id__in=ids).order_by('deadline', 'id').values_list('id', flat=True))
+        self.assertEqual(ids, deadlines)
+
+    def test_invalid_params(self):
+        response = self.client.get(reverse('task-list'), {'status': 'DONE', 'priority': 'high'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('status', response.data)
+        self.assertIn('priority', response.data)
+
+
+class TaskFilterQueryPlanTestCase(TestCase):
+    """
+    The supported filter combinations must be answered with an index
+    search, never with a full scan of ``tasks_task``.
+    """
+    combinations = [
+        {'project': 'Plan Project'},
+        {'project': 'Plan Project', 'status': 'NEW'},
+        {'project': 'Plan Project', 'status': 'NEW,IN_PROGRESS'},
+        {'assignee': 'plan@example.com'},
+        {'assignee': 'plan@example.com', 'status': 'TESTING'},
+        {'project': 'Plan Project', 'assignee': 'plan@example.com'},
+        {'status': 'BLOCKED'},
+        {'priority': '5'},
+        {'tag': 'Backend'},
+        {'project': 'Plan Project', 'tag': 'Backend'},
+        {'deadline_from': '2030-01-01T00:00:00Z', 'deadline_to': '2030-02-01T00:00:00Z'},
+        {'project': 'Plan Project', 'status': 'NEW', 'deadline_to': '2030-02-01T00:00:00Z'},
+        {'project': 'Plan Project', 'ordering': 'deadline'},
+        {'q': 'report'},
+        {'project': 'Plan Project', 'q': 'report', 'ordering': 'deadline'},
+    ]
+
+    def test_supported_combinations_use_an_index(self):
+        for params in self.combinations:
+            with self.subTest(params=params):
+                serializer = TaskFilterSerializer(data=params)
+                serializer.is_valid(raise_exception=True)
+                plan = serializer.filter_queryset(Task.objects.all()).explain()
+
+                self.assertRegex(plan, r'SEARCH (tasks_task|T\d*) USING (INDEX|INTEGER PRIMARY KEY)')
+                self.assertIsNone(
+                    re.search(r'SCAN tasks_task\b(?!_)', plan),
+                    f'Full scan of tasks_task for {params}:\n{plan}'
+                )
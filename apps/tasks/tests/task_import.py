@@ -0,0 +1,184 @@
+import csv
+import os
+import tempfile
+import zipfile
+from datetime import timedelta
+from io import StringIO
+from xml.sax.saxutils import escape
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from apps.projects.models import Project, ProjectFile
+from apps.projects.utils.file_readers import FileReadError, _column_index, iter_xlsx_rows
+from apps.tasks.models import Tag, Task
+from apps.tasks.utils.task_import import import_rows, import_tasks
+from apps.users.models import User
+
+DESCRIPTION = 'This is a valid task description with more than 50 characters.'
+HEADER = ['Name', 'Description', 'Priority', 'Assignee', 'Tags', 'Deadline']
+
+
+def write_xlsx(path: str, rows: list[list]) -> None:
+    """Minimal workbook with inline strings, the way most exporters write it."""
+    sheet_rows = []
+    for number, row in enumerate(rows, start=1):
+        cells = []
+        for column, value in enumerate(row):
+            reference = f'{chr(ord("A") + column)}{number}'
+            if value is None:
+                continue
+            if isinstance(value, (int, float)):
+                cells.append(f'<c r="{reference}"><v>{value}</v></c>')
+            else:
+                cells.append(f'<c r="{reference}" t="inlineStr"><is><t>{escape(value)}</t></is></c>')
+        sheet_rows.append(f'<row r="{number}">{"".join(cells)}</row>')
+
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr(
+            'xl/worksheets/sheet1.xml',
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f'<sheetData>{"".join(sheet_rows)}</sheetData></worksheet>'
+        )
+
+
+class TaskImportTestCase(TestCase):
+    def setUp(self):
+        self.media = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media.cleanup)
+        os.makedirs(os.path.join(self.media.name, 'documents'))
+
+        self.project = Project.objects.create(
+            name='Import Project',
+            description='Project the imported tasks are created in.'
+        )
+        self.user = User.objects.create(
+            username='import_user',
+            first_name='import',
+            last_name='user',
+            email='import@example.com',
+            password='1q9i2w8u3e7y4r6t5'
+        )
+        Tag.objects.create(name='Backend')
+        Tag.objects.create(name='Api')
+        self.deadline = (timezone.now() + timedelta(days=10)).isoformat()
+
+    def rows(self, amount: int) -> list[list]:
+        return [HEADER] + [
+            [f'Imported task number {i}', DESCRIPTION, 3, self.user.email, 'Backend, Api', self.deadline]
+            for i in range(amount)
+        ]
+
+    def write_csv(self, name: str, rows: list[list]) -> str:
+        path = os.path.join(self.media.name, 'documents', name)
+        with open(path, 'w', newline='', encoding='utf-8') as stream:
+            csv.writer(stream).writerows(rows)
+        return path
+
+    def test_chunks_and_error_report(self):
+        rows = self.rows(7)
+        rows[3][0] = 'Short'
+        rows[5][4] = 'Unknown tag'
+
+        report = import_rows(rows, default_project=self.project.name, chunk_size=3)
+
+        self.assertEqual((report['rows'], report['created'], report['failed']), (7, 5, 2))
+        self.assertEqual([error['row'] for error in report['errors']], [4, 6])
+        self.assertIn('name', report['errors'][0]['errors'])
+        self.assertIn('tags', report['errors'][1]['errors'])
+        self.assertEqual(Task.objects.filter(project=self.project).count(), 5)
+        self.assertEqual(Task.objects.get(name='Imported task number 0').tags.count(), 2)
+
+    def test_unknown_tag_names_that_look_like_ids(self):
+        rows = self.rows(1)
+        rows[1][4] = f"{Tag.objects.get(name='Api').pk}, Backend"
+
+        report = import_rows(rows, default_project=self.project.name)
+
+        self.assertEqual((report['created'], report['failed']), (0, 1))
+        self.assertIn('tags', report['errors'][0]['errors'])
+        self.assertFalse(Task.objects.filter(project=self.project).exists())
+
+    def test_duplicates_across_chunks(self):
+        rows = self.rows(2) + self.rows(2)[1:]
+
+        report = import_rows(rows, default_project=self.project.name, chunk_size=2)
+
+        self.assertEqual(report['created'], 2)
+        self.assertEqual([error['row'] for error in report['errors']], [4, 5])
+
+    def test_missing_columns(self):
+        report = import_rows([['Title'], ['Something']], default_project=self.project.name)
+        self.assertEqual(report['created'], 0)
+        self.assertEqual(report['errors'][0]['row'], 1)
+
+    def test_xlsx(self):
+        path = os.path.join(self.media.name, 'documents', 'tasks.xlsx')
+        rows = self.rows(3)
+        # Excel date serial for the deadline, and a gap in the row
+        rows[1][5] = 60000
+        rows[2][3] = None
+        write_xlsx(path, rows)
+
+        self.assertEqual(list(iter_xlsx_rows(path))[2][3], None)
+
+        report = import_tasks(path, default_project=self.project.name)
+        self.assertEqual(report['created'], 3, report['errors'])
+        self.assertEqual(Task.objects.get(name='Imported task number 0').deadline.year, 2064)
+        self.assertEqual(_column_index('AA12'), 26)
+
+    def test_endpoint_uses_the_project_of_the_file(self):
+        with override_settings(MEDIA_ROOT=self.media.name):
+            self.write_csv('tasks.csv', self.rows(4))
+            project_file = ProjectFile.objects.create(file_name='tasks.csv', file_path='documents/tasks.csv')
+            self.project.files.add(project_file)
+
+            response = self.client.post(reverse('project-file-import', kwargs={'pk': project_file.pk}))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 4)
+        self.assertIn('rows_per_second', response.data)
+
+    def test_command(self):
+        path = self.write_csv('command.csv', self.rows(3))
+        out = StringIO()
+
+        call_command('import_tasks', '--path', path, '--project', self.project.name, stdout=out)
+
+        self.assertIn('3 tasks created', out.getvalue())
+        self.assertIn('rows/s', out.getvalue())
+
+    def test_unreadable_files(self):
+        csv_path = os.path.join(self.media.name, 'documents', 'latin1.csv')
+        with open(csv_path, 'wb') as stream:
+            stream.write('Name,Description\nCaf\xe9 task,Not UTF-8\n'.encode('latin-1'))
+
+        xlsx_path = os.path.join(self.media.name, 'documents', 'corrupt.xlsx')
+        with open(xlsx_path, 'wb') as stream:
+            stream.write(b'PK\x03\x04 this is not a workbook')
+
+        with override_settings(MEDIA_ROOT=self.media.name):
+            for name in ('latin1.csv', 'corrupt.xlsx'):
+                with self.subTest(name=name):
+                    project_file = ProjectFile.objects.create(file_name=name, file_path=f'documents/{name}')
+                    self.project.files.add(project_file)
+
+                    response = self.client.post(reverse('project-file-import', kwargs={'pk': project_file.pk}))
+
+                    self.assertEqual(response.status_code, 400)
+                    self.assertIn('Not a valid', response.data['message'])
+
+                    with self.assertRaises(CommandError):
+                        call_command('import_tasks', '--file-id', project_file.pk, stdout=StringIO())
+
+        self.assertEqual(Task.objects.count(), 0)
+
+    def test_read_error_after_imported_chunks(self):
+        def rows():
+            yield from self.rows(3)
+            raise FileReadError("Not a valid .csv file: broken")
+
+        with self.assertRaisesMessage(FileReadError, 'after line 4, 3 tasks were created before it'):
+            import_rows(rows(), default_project=self.project.name, chunk_size=3)
+
+        self.assertEqual(Task.objects.count(), 3)
@@ -0,0 +1,72 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from apps.projects.models import Project
+from apps.tasks.models import Task
+
+
+class TaskListCursorPaginationTestCase(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Cursor Project',
+            description='Project used to check keyset pagination of the task list.'
+        )
+        deadline = timezone.now() + timedelta(days=30)
+
+        # Половина задач с одинаковым дедлайном, чтобы проверить сортировку по id
+        Task.objects.bulk_create([
+            Task(
+                name=f'Cursor task {i:02d}',
+                description='Task for the cursor pagination tests.',
+                project=self.project,
+                deadline=deadline if i % 2 else deadline + timedelta(days=i),
+            )
+            for i in range(12)
+        ])
+        self.url = reverse('task-list')
+        self.expected_ids = list(
+            Task.objects.order_by('-deadline', '-id').values_list('id', flat=True)
+        )
+
+    def test_walk_forward_and_backward(self):
+        response = self.client.get(self.url, {'pagination': 'cursor', 'page_size': 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('count', response.data)
+        self.assertIsNone(response.data['previous'])
+
+        seen = [task['id'] for task in response.data['results']]
+        pages = [response]
+
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            pages.append(response)
+            seen.extend(task['id'] for task in response.data['results'])
+
+        self.assertEqual(seen, self.expected_ids)
+        self.assertEqual(len(pages), 3)
+
+        previous = self.client.get(pages[-1].data['previous'])
+        self.assertEqual(
+            [task['id'] for task in previous.data['results']],
+            [task['id'] for task in pages[1].data['results']],
+        )
+        first = self.client.get(previous.data['previous'])
+        self.assertEqual(
+            [task['id'] for task in first.data['results']],
+            self.expected_ids[:5],
+        )
+        self.assertIsNone(first.data['previous'])
+
+    def test_page_number_is_default(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 12)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'pagination': 'cursor', 'cursor': 'broken'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_invalid_pagination_mode(self):
+        response = self.client.get(self.url, {'pagination': 'offset'})
+        self.assertEqual(response.status_code, 400)
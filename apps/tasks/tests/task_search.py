@@ -0,0 +1,137 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.tasks.utils.bulk_tasks import bulk_transition_tasks
+from apps.tasks.utils.task_search import FTS_TABLE, build_match_query
+
+
+class TaskSearchTestCase(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Search Project',
+            description='Project used to check the full-text search over tasks.'
+        )
+        self.other_project = Project.objects.create(
+            name='Other Search Project',
+            description='Second project, filtered out by the combined search.'
+        )
+        self.in_name = Task.objects.create(
+            name='Invoice export',
+            description='Generate the monthly report for accounting.',
+            project=self.project,
+        )
+        self.in_description = Task.objects.create(
+            name='Accounting cleanup',
+            description='Fix rounding in the invoice totals.',
+            project=self.project,
+        )
+        self.other = Task.objects.create(
+            name='Invoice layout',
+            description='Task of another project mentioning the invoice.',
+            project=self.other_project,
+        )
+        self.url = reverse('task-list')
+
+    def search_ids(self, **params) -> list[int]:
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return [task['id'] for task in response.data['results']]
+
+    def test_ranked_and_combined_with_filters(self):
+        self.assertEqual(
+            self.search_ids(q='invoice', project=self.project.name),
+            [self.in_name.id, self.in_description.id],
+        )
+        self.assertEqual(
+            set(self.search_ids(q='invoice')),
+            {self.in_name.id, self.in_description.id, self.other.id},
+        )
+
+    def test_prefix_and_syntax_characters(self):
+        self.assertEqual(self.search_ids(q='round'), [self.in_description.id])
+        self.assertEqual(self.search_ids(q='"invoice" (export:'), [self.in_name.id])
+        self.assertEqual(build_match_query('a-b "c'), '"a" "b" "c"*')
+
+        response = self.client.get(self.url, {'q': '***'})
+        self.assertEqual(response.status_code, 204)
+
+    def test_rank_ordering_needs_a_query(self):
+        response = self.client.get(self.url, {'ordering': 'rank'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_pagination_by_rank(self):
+        ids = self.search_ids(q='invoice')
+        response = self.client.get(self.url, {'q': 'invoice', 'pagination': 'cursor', 'page_size': 2})
+        seen = [task['id'] for task in response.data['results']]
+
+        response = self.client.get(response.data['next'])
+        seen.extend(task['id'] for task in response.data['results'])
+        self.assertEqual(seen, ids)
+
+    def test_index_follows_writes(self):
+        self.in_name.name = 'Payroll export'
+        self.in_name.save()
+        Task.objects.filter(pk=self.in_description.pk).update(description='Nothing to see here.')
+        bulk_transition_tasks(Task.objects.filter(pk=self.other.pk), {'status': 'IN_PROGRESS'})
+
+        self.assertEqual(self.search_ids(q='invoice'), [self.other.id])
+        self.assertEqual(self.search_ids(q='payroll'), [self.in_name.id])
+
+        self.other.soft_delete()
+        response = self.client.get(self.url, {'q': 'invoice'})
+        self.assertEqual(response.status_code, 204)
+
+        Task.all_objects.filter(pk=self.other.pk).delete()
+        self.assert_index_intact()
+
+    def assert_index_intact(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('integrity-check', 1)")
+
+    def test_rebuild_command(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')")
+
+        call_command('rebuild_task_search', stdout=StringIO())
+
+        self.assertEqual(len(self.search_ids(q='invoice')), 3)
+        self.assert_index_intact()
+
+    def test_edits_during_a_rebuild(self):
+        chunks = 0
+
+        def edit_between_chunks(execute, sql, params, many, context):
+            nonlocal chunks
+            result = execute(sql, params, many, context)
+
+            if sql.startswith(f'UPDATE {FTS_TABLE}_rebuild'):
+                chunks += 1
+                if chunks == 1:
+                    # An indexed task, one that isn't yet and a new one
+                    self.in_name.name = 'Payroll export'
+                    self.in_name.save()
+                    Task.objects.filter(pk=self.in_description.pk).update(description='Invoice rounding.')
+                    Task.all_objects.filter(pk=self.other.pk).delete()
+                    Task.objects.create(name='Payroll invoice', description='Created during the rebuild.', project=self.project)
+
+            return result
+
+        with connection.execute_wrapper(edit_between_chunks):
+            call_command('rebuild_task_search', '--chunk-size', '1', '--pause', '0', stdout=StringIO())
+
+        self.assertEqual(chunks, 3)
+        self.assert_index_intact()
+        created = Task.objects.get(name='Payroll invoice')
+        self.assertEqual(sorted(self.search_ids(q='invoice')), [self.in_description.id, created.id])
+        self.assertEqual(sorted(self.search_ids(q='payroll')), [self.in_name.id, created.id])
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE name LIKE %s OR name LIKE %s",
+                [f'{FTS_TABLE}_new%', f'{FTS_TABLE}_rebuild%'],
+            )
+            self.assertEqual(cursor.fetchall(), [])
@@ -0,0 +1,120 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from apps.projects.models import Project
+from apps.tasks.models import ProjectTaskSummary, Task
+from apps.tasks.utils.bulk_tasks import bulk_transition_tasks
+from apps.tasks.utils.task_summary import find_inconsistencies
+
+
+class ProjectTaskSummaryTestCase(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Summary Project',
+            description='Project used to check the incremental task summary.'
+        )
+        self.other_project = Project.objects.create(
+            name='Other Summary Project',
+            description='Project the tasks are moved to by the tests.'
+        )
+        self.now = timezone.now()
+        self.tasks = [
+            Task.objects.create(
+                name=f'Summary task {i}',
+                description='Task counted by the project summary.',
+                project=self.project,
+                priority=(i % 5) + 1,
+                deadline=self.now + timedelta(days=i - 2),
+            )
+            for i in range(6)
+        ]
+
+    def summary(self, project: Project) -> ProjectTaskSummary:
+        return ProjectTaskSummary.objects.get(project=project)
+
+    def assertConsistent(self):
+        self.assertEqual(find_inconsistencies(), {})
+
+    def test_create_update_delete(self):
+        summary = self.summary(self.project)
+        self.assertEqual(summary.total, 6)
+        self.assertEqual(summary.status_new, 6)
+        self.assertEqual(summary.priority_very_low, 2)
+
+        task = Task.objects.get(pk=self.tasks[0].pk)
+        task.status = 'CLOSED'
+        task.project = self.other_project
+        task.save()
+
+        summary = self.summary(self.project)
+        self.assertEqual((summary.total, summary.status_new), (5, 5))
+        other = self.summary(self.other_project)
+        self.assertEqual((other.total, other.status_closed, other.priority_very_low), (1, 1, 1))
+
+        task.soft_delete()
+        self.assertEqual(self.summary(self.other_project).total, 0)
+
+        Task.all_objects.filter(pk=self.tasks[1].pk).get().delete()
+        self.assertEqual(self.summary(self.project).total, 4)
+        self.assertConsistent()
+
+    def test_bulk_paths(self):
+        bulk_transition_tasks(Task.objects.filter(project=self.project), {'status': 'IN_PROGRESS', 'priority': 5})
+
+        summary = self.summary(self.project)
+        self.assertEqual((summary.status_new, summary.status_in_progress), (0, 6))
+        self.assertEqual(summary.priority_critical, 6)
+
+        Task.objects.filter(pk__in=[task.pk for task in self.tasks[:2]]).soft_delete()
+        self.assertEqual(self.summary(self.project).total, 4)
+        self.assertConsistent()
+
+    def test_endpoint(self):
+        Task.objects.filter(pk=self.tasks[0].pk).update(status='CLOSED')
+        url = reverse('project-summary', kwargs={'pk': self.project.pk})
+
+        # summary + overdue count
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total'], 6)
+        self.assertEqual(response.data['statuses']['NEW'], 6)
+        self.assertEqual(response.data['priorities']['HIGH'], 1)
+        # deadlines of tasks 1 and 2 are in the past, task 0 is closed
+        self.assertEqual(response.data['overdue'], 2)
+
+        response = self.client.get(reverse('project-summary', kwargs={'pk': 9999}))
+        self.assertEqual(response.status_code, 404)
+
+    # The one-off rebuild is allowed to go over the budget of the steady state
+    @override_settings(QUERY_BUDGET={'RAISE': False})
+    def test_missing_row_is_rebuilt(self):
+        ProjectTaskSummary.objects.filter(project=self.project).delete()
+
+        response = self.client.get(reverse('project-summary', kwargs={'pk': self.project.pk}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total'], 6)
+
+    def test_check_and_rebuild_commands(self):
+        ProjectTaskSummary.objects.filter(project=self.project).update(total=100, status_new=0)
+
+        with self.assertRaises(CommandError):
+            call_command('check_task_summaries', stdout=StringIO())
+
+        out = StringIO()
+        call_command('check_task_summaries', '--fix', stdout=out)
+        self.assertIn('total: 100 != 6', out.getvalue())
+        self.assertConsistent()
+
+        ProjectTaskSummary.objects.update(total=0)
+        call_command('rebuild_task_summaries', stdout=StringIO())
+        self.assertConsistent()
+
+    def test_deleting_a_project(self):
+        self.project.delete()
+        self.assertFalse(ProjectTaskSummary.objects.filter(project_id=self.project.pk).exists())
@@ -1,9 +1,16 @@
 from django.urls import path
 from apps.tasks.views.tag_views import TagListAPIView, TagDetailAPIView
-from apps.tasks.views.task_views import TasksListAPIView, TaskViewListCreateGenericView
+from apps.tasks.views.task_views import (
+    TasksListAPIView, TaskDetailAPIView, TaskBulkCreateAPIView, TaskBulkTransitionAPIView,
+    TaskExportAPIView,
+)
 
 urlpatterns = [
-    path('', TaskViewListCreateGenericView.as_view()),
-    path('tags/', TagListAPIView.as_view()),
-    path('tags/<int:pk>/', TagDetailAPIView.as_view()),
+    path('', TasksListAPIView.as_view(), name='task-list'),
+    path('<int:pk>/', TaskDetailAPIView.as_view(), name='task-detail'),
+    path('export/', TaskExportAPIView.as_view(), name='task-export'),
+    path('bulk/', TaskBulkCreateAPIView.as_view(), name='task-bulk-create'),
+    path('bulk/transition/', TaskBulkTransitionAPIView.as_view(), name='task-bulk-transition'),
+    path('tags/', TagListAPIView.as_view(), name='tag-list'),
+    path('tags/<int:pk>/', TagDetailAPIView.as_view(), name='tag-detail'),
 ]
@@ -0,0 +1,123 @@
+from typing import Any
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.serializers import as_serializer_error
+from rest_framework.settings import api_settings
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task
+from apps.tasks.serializers.task_serializers import BulkCreateTaskItemSerializer
+from apps.tasks.signals import tasks_bulk_created, tasks_bulk_updated, tasks_pre_bulk_update
+from apps.users.models import User
+
+BULK_CREATE_MAX_ITEMS = 1000
+
+
+def _tag_ids(item: dict) -> list:
+    tags = item.get('tags') or []
+    return tags if isinstance(tags, list) else []
+
+
+def preload_lookups(items: list[dict]) -> dict[str, Any]:
+    """
+    Fetches every project, assignee, tag and existing (name, project) pair
+    referenced by ``items`` with four queries regardless of the batch size.
+    Items that aren't objects are left to ``bulk_create_tasks`` to report.
+    """
+    items = [item for item in items if isinstance(item, dict)]
+
+    project_names = {item.get('project') for item in items if isinstance(item.get('project'), str)}
+    emails = {item.get('assignee') for item in items if isinstance(item.get('assignee'), str)}
+    tag_ids = {tag for item in items for tag in _tag_ids(item) if isinstance(tag, (int, str))}
+    task_names = {item.get('name') for item in items if isinstance(item.get('name'), str)}
+
+    projects = {project.name: project for project in Project.objects.filter(name__in=project_names)}
+    assignees = {user.email: user for user in User.objects.filter(email__in=emails)}
+    tags = {}
+    for tag in Tag.objects.filter(pk__in=[tag for tag in tag_ids if str(tag).isdigit()]):
+        tags[tag.pk] = tag
+        tags[str(tag.pk)] = tag
+
+    taken_names = set(
+        Task.objects.filter(
+            project__in=projects.values(),
+            name__in=task_names,
+        ).values_list('name', 'project_id')
+    )
+
+    return {
+        'projects': projects,
+        'assignees': assignees,
+        'tags': tags,
+        'taken_names': taken_names,
+    }
+
+
+def bulk_create_tasks(items: list[dict], context: dict[str, Any] = None) -> tuple[list, list]:
+    """
+    Validates and inserts a batch of tasks.
+
+    Invalid items don't stop the batch: they are reported as
+    ``{'index': i, 'errors': {...}}`` while the valid ones are inserted with
+    one ``bulk_create`` for the tasks and one for their ``Task.tags`` rows.
+    Returns ``(created, errors)`` where ``created`` holds ``(index, task)``.
+    """
+    if context is None:
+        context = preload_lookups(items)
+
+    valid, errors = [], []
+    # One serializer for the whole batch: building its fields costs far
+    # more than validating an item, like ``ListSerializer`` does with ``child``
+    serializer = BulkCreateTaskItemSerializer(context=context)
+
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors.append({'index': index, 'errors': {api_settings.NON_FIELD_ERRORS_KEY: ["Expected an object."]}})
+            continue
+
+        try:
+            valid.append((index, serializer.run_validation(item)))
+        except ValidationError as exc:
+            errors.append({'index': index, 'errors': as_serializer_error(exc)})
+
+    if not valid:
+        return [], errors
+
+    tasks, task_tags = [], []
+    for _, data in valid:
+        data = dict(data)
+        task_tags.append(data.pop('tags', []))
+        tasks.append(Task(**data))
+
+    with transaction.atomic():
+        Task.objects.bulk_create(tasks)
+
+        Task.tags.through.objects.bulk_create([
+            Task.tags.through(task_id=task.pk, tag_id=tag.pk)
+            for task, tags in zip(tasks, task_tags)
+            for tag in {tag.pk: tag for tag in tags}.values()
+        ])
+
+        tasks_bulk_created.send(sender=Task, tasks=tasks)
+
+    created = [(index, task) for (index, _), task in zip(valid, tasks)]
+
+    return created, errors
+
+
+def bulk_transition_tasks(queryset: QuerySet, changes: dict[str, Any]) -> dict[str, int]:
+    """
+    Applies ``changes`` to every task of ``queryset`` with a single
+    ``UPDATE ... WHERE``; no row is loaded into Python.
+    """
+    changes = dict(changes)
+
+    with transaction.atomic():
+        tasks_pre_bulk_update.send(sender=Task, queryset=queryset, changes=changes)
+
+        updated = queryset.update(**changes, updated_at=timezone.now())
+
+        tasks_bulk_updated.send(sender=Task, changes=changes, count=updated)
+
+    return {'updated': updated}
@@ -0,0 +1,86 @@
+import csv
+import json
+from itertools import islice
+from typing import Iterable, Iterator
+from django.db.models import QuerySet
+from apps.tasks.models import Task
+
+EXPORT_CHUNK_SIZE = 2000
+
+# (column, lookup) pairs; tags are joined in per chunk
+EXPORT_FIELDS = (
+    ('id', 'id'),
+    ('name', 'name'),
+    ('description', 'description'),
+    ('status', 'status'),
+    ('priority', 'priority'),
+    ('project', 'project__name'),
+    ('assignee', 'assignee__email'),
+    ('deadline', 'deadline'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+)
+EXPORT_COLUMNS = (*(column for column, _ in EXPORT_FIELDS), 'tags')
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+def iter_task_rows(queryset: QuerySet, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[tuple]:
+    """
+    Yields one tuple per task in ``EXPORT_COLUMNS`` order.
+
+    Rows are read with a server-side ``iterator()`` over plain tuples, and
+    the tags of every chunk are fetched with one extra query, so memory
+    only ever holds a single chunk no matter how many tasks are exported.
+    """
+    rows = queryset.order_by('id').values_list(
+        *(lookup for _, lookup in EXPORT_FIELDS)
+    ).iterator(chunk_size=chunk_size)
+
+    while chunk := list(islice(rows, chunk_size)):
+        tags = {}
+        through = Task.tags.through.objects.filter(
+            task_id__in=[row[0] for row in chunk]
+        ).order_by('tag__name').values_list('task_id', 'tag__name')
+
+        for task_id, tag_name in through:
+            tags.setdefault(task_id, []).append(tag_name)
+
+        for row in chunk:
+            yield (*row, tags.get(row[0], []))
+
+
+def _plain(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def to_ndjson(rows: Iterable[tuple]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(
+            dict(zip(EXPORT_COLUMNS, map(_plain, row))),
+            ensure_ascii=False,
+        ) + '\n'
+
+
+class _Echo:
+    """File-like object handing the line ``csv.writer`` produced straight back."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def to_csv(rows: Iterable[tuple]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+
+    for row in rows:
+        *values, tags = row
+        yield writer.writerow([*map(_plain, values), ','.join(tags)])
+
+
+def export_tasks(queryset: QuerySet, output: str, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    rows = iter_task_rows(queryset, chunk_size=chunk_size)
+    return to_csv(rows) if output == 'csv' else to_ndjson(rows)
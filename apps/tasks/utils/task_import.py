@@ -0,0 +1,134 @@
+import time
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Iterable
+from django.utils import timezone
+from apps.projects.utils.file_readers import FileReadError, iter_file_rows
+from apps.tasks.models import Tag
+from apps.tasks.utils.bulk_tasks import bulk_create_tasks, preload_lookups
+
+IMPORT_CHUNK_SIZE = 1000
+# The report keeps the first errors only, the total is always counted
+MAX_REPORTED_ERRORS = 1000
+
+IMPORT_FIELDS = ('name', 'description', 'priority', 'project', 'assignee', 'tags', 'deadline')
+REQUIRED_COLUMNS = {'name', 'description'}
+
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+
+def excel_datetime(serial: float) -> datetime:
+    return timezone.make_aware(EXCEL_EPOCH + timedelta(days=serial))
+
+
+def row_to_item(columns: list, values: list, default_project: str = None) -> dict:
+    """Maps a file row onto the fields of ``BulkCreateTaskItemSerializer``."""
+    item = {}
+
+    for column, value in zip(columns, values):
+        if column not in IMPORT_FIELDS or value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        item[column] = value
+
+    if isinstance(item.get('tags'), str):
+        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
+
+    if isinstance(item.get('deadline'), (int, float)):
+        item['deadline'] = excel_datetime(item['deadline'])
+
+    if 'project' not in item and default_project:
+        item['project'] = default_project
+
+    return item
+
+
+class UnknownTagName:
+    """
+    Stands for a name that matched no tag. The name itself can't be passed
+    on: a tag named "5" would be taken for the id of another tag.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+
+def resolve_tag_names(items: list[dict]) -> None:
+    """Replaces tag names by ids with one query per chunk; unknown names fail validation."""
+    names = {tag for item in items for tag in item.get('tags', [])}
+
+    if not names:
+        return
+
+    ids = dict(Tag.objects.filter(name__in=names).values_list('name', 'id'))
+
+    for item in items:
+        if 'tags' in item:
+            item['tags'] = [ids[tag] if tag in ids else UnknownTagName(tag) for tag in item['tags']]
+
+
+def import_rows(rows: Iterable[list], default_project: str = None, chunk_size: int = IMPORT_CHUNK_SIZE) -> dict:
+    """
+    Creates tasks from a stream of rows whose first row is the header.
+
+    Every chunk of ``chunk_size`` rows is validated against lookups
+    preloaded for the whole chunk and inserted by ``bulk_create_tasks`` in
+    its own transaction, so a bad row only rejects itself and a failure
+    never rolls back the chunks already imported. Row numbers in the error
+    report are 1-based file lines (the header is line 1).
+
+    A ``FileReadError`` in the middle of the file stops the import; it is
+    raised again with the number of tasks already created before it.
+    """
+    started = time.perf_counter()
+    rows = iter(rows)
+    header = next(rows, None) or []
+    columns = [str(column).strip().lower() if column is not None else None for column in header]
+
+    report = {'rows': 0, 'created': 0, 'failed': 0, 'errors': [], 'seconds': 0, 'rows_per_second': 0}
+
+    missing = REQUIRED_COLUMNS - set(columns)
+    if missing:
+        report['errors'].append({'row': 1, 'errors': {'columns': [f"Missing columns: {sorted(missing)}"]}})
+        report['failed'] = 1
+        return report
+
+    numbered = enumerate(rows, start=2)
+
+    while True:
+        try:
+            chunk = list(islice(numbered, chunk_size))
+        except FileReadError as e:
+            raise FileReadError(
+                f"{e} (after line {report['rows'] + 1}, {report['created']} tasks were created before it)"
+            ) from e
+
+        if not chunk:
+            break
+
+        items = [row_to_item(columns, values, default_project) for _, values in chunk]
+        resolve_tag_names(items)
+
+        created, errors = bulk_create_tasks(items, preload_lookups(items))
+
+        report['rows'] += len(chunk)
+        report['created'] += len(created)
+        report['failed'] += len(errors)
+
+        for error in errors[:MAX_REPORTED_ERRORS - len(report['errors'])]:
+            report['errors'].append({'row': chunk[error['index']][0], 'errors': error['errors']})
+
+    report['seconds'] = round(time.perf_counter() - started, 3)
+    report['rows_per_second'] = round(report['rows'] / report['seconds']) if report['seconds'] else report['rows']
+
+    return report
+
+
+def import_tasks(path, default_project: str = None, chunk_size: int = IMPORT_CHUNK_SIZE, extension: str = None) -> dict:
+    return import_rows(iter_file_rows(path, extension), default_project=default_project, chunk_size=chunk_size)
@@ -0,0 +1,98 @@
+import re
+from functools import reduce
+from operator import and_
+from django.db import connections
+from django.db.models import FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'tasks_task_fts'
+FTS_TOKENIZE = 'unicode61 remove_diacritics 2'
+# bm25() weights of the indexed columns: a hit in the name counts more
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def fts_table_sql(fts_table: str) -> str:
+    """An external content index of the task names and descriptions, as migration 0007 creates it."""
+    return (
+        f"CREATE VIRTUAL TABLE {fts_table} USING fts5("
+        f"name, description, content='tasks_task', content_rowid='id', tokenize='{FTS_TOKENIZE}')"
+    )
+
+
+def fts_triggers_sql(fts_table: str, indexed_up_to: str = None) -> list[str]:
+    """
+    Triggers keeping ``fts_table`` in sync with every write to tasks_task.
+    With ``indexed_up_to`` (an SQL expression) they only touch the tasks up
+    to that id: a 'delete' of a row that isn't indexed corrupts the index.
+    """
+    new_when = f'WHEN new.id <= {indexed_up_to} ' if indexed_up_to else ''
+    old_when = f'WHEN old.id <= {indexed_up_to} ' if indexed_up_to else ''
+    delete_old = (
+        f"INSERT INTO {fts_table}({fts_table}, rowid, name, description) "
+        f"VALUES ('delete', old.id, old.name, old.description);"
+    )
+    insert_new = f"INSERT INTO {fts_table}(rowid, name, description) VALUES (new.id, new.name, new.description);"
+
+    return [
+        f"CREATE TRIGGER {fts_table}_ai AFTER INSERT ON tasks_task {new_when}BEGIN {insert_new} END",
+        f"CREATE TRIGGER {fts_table}_ad AFTER DELETE ON tasks_task {old_when}BEGIN {delete_old} END",
+        f"CREATE TRIGGER {fts_table}_au AFTER UPDATE OF name, description ON tasks_task {old_when}"
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def search_tokens(text: str) -> list[str]:
+    return TOKEN_RE.findall(text)
+
+
+def build_match_query(text: str) -> str:
+    """
+    Turns free user input into a safe FTS5 query.
+
+    Every word is quoted, so FTS5 operators and syntax characters in the
+    input are matched literally instead of raising a syntax error. The
+    words are ANDed and the last one is a prefix, so partially typed
+    queries still match.
+    """
+    tokens = [f'"{token}"' for token in search_tokens(text)]
+
+    if tokens:
+        tokens[-1] += '*'
+
+    return ' '.join(tokens)
+
+
+def search_tasks(queryset: QuerySet, text: str) -> QuerySet:
+    """
+    Narrows ``queryset`` to the tasks matching ``text`` and annotates
+    ``search_rank`` (lower is better). The other filters of the queryset
+    are applied on top of the full-text match.
+    """
+    match = build_match_query(text)
+    connection = connections[queryset.db]
+
+    if not match:
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField())).none()
+
+    if connection.vendor != 'sqlite':
+        # No FTS table outside of SQLite: plain substring search, unranked
+        return queryset.filter(reduce(and_, (
+            Q(name__icontains=token) | Q(description__icontains=token)
+            for token in search_tokens(text)
+        ))).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    task_id = f'{connection.ops.quote_name(queryset.model._meta.db_table)}."id"'
+
+    return queryset.filter(
+        id__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [match])
+    ).annotate(
+        search_rank=RawSQL(
+            f'SELECT bm25({FTS_TABLE}, {NAME_WEIGHT}, {DESCRIPTION_WEIGHT}) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND rowid = {task_id}',
+            [match],
+            output_field=FloatField(),
+        )
+    )
@@ -0,0 +1,148 @@
+from collections import Counter, defaultdict
+from typing import Iterable
+from django.db import transaction
+from django.db.models import Count, F, QuerySet
+from django.utils import timezone
+from apps.core.response_cache import invalidate
+from apps.tasks.models import ProjectTaskSummary, Task
+
+# The summaries are served with the projects, their cached responses
+# depend on the project version
+SUMMARY_CACHE_LABEL = 'projects.Project'
+
+
+def bucket_fields(status: str, priority: int) -> tuple[str, ...]:
+    return (
+        'total',
+        ProjectTaskSummary.status_field(status),
+        ProjectTaskSummary.priority_field(priority),
+    )
+
+
+def group_rows(queryset: QuerySet) -> list[tuple[int, str, int, int]]:
+    """``GROUP BY project, status, priority`` as (project_id, status, priority, amount)."""
+    return list(
+        queryset.order_by()
+        .values('project_id', 'status', 'priority')
+        .annotate(amount=Count('id'))
+        .values_list('project_id', 'status', 'priority', 'amount')
+    )
+
+
+def count_groups(queryset: QuerySet) -> dict[int, Counter]:
+    summaries = defaultdict(Counter)
+
+    for project_id, task_status, priority, amount in group_rows(queryset):
+        for field in bucket_fields(task_status, priority):
+            summaries[project_id][field] += amount
+
+    return summaries
+
+
+def apply_deltas(deltas: dict[int, Counter], create_missing: bool = True) -> None:
+    """
+    Adds ``deltas`` ({project_id: {field: +-n}}) to the summary rows with one
+    ``UPDATE ... SET f = f + n`` per project.
+
+    Projects without a summary row yet get one rebuilt from scratch, which
+    already includes the change. Deletes pass ``create_missing=False``: the
+    row may be gone together with a project being deleted.
+    """
+    changed = False
+
+    for project_id, delta in deltas.items():
+        changes = {field: F(field) + amount for field, amount in delta.items() if amount}
+
+        if not changes:
+            continue
+
+        changed = True
+
+        updated = ProjectTaskSummary.objects.filter(project_id=project_id).update(
+            **changes,
+            updated_at=timezone.now()
+        )
+
+        if not updated and create_missing:
+            rebuild_summaries([project_id])
+
+    if changed:
+        invalidate(SUMMARY_CACHE_LABEL)
+
+
+def rebuild_summaries(project_ids: Iterable[int] = None, using: str = None) -> int:
+    """
+    Recomputes the summary rows of ``project_ids`` (all projects by default)
+    on the ``using`` database, the routed one by default.
+    """
+    from apps.projects.models import Project
+
+    projects = Project.objects.using(using)
+    tasks = Task.objects.using(using)
+
+    if project_ids is not None:
+        project_ids = list(project_ids)
+        projects = projects.filter(pk__in=project_ids)
+        tasks = tasks.filter(project_id__in=project_ids)
+
+    counters = count_groups(tasks)
+
+    with transaction.atomic(using=using):
+        ProjectTaskSummary.objects.using(using).filter(project__in=projects).delete()
+        summaries = ProjectTaskSummary.objects.using(using).bulk_create([
+            ProjectTaskSummary(project_id=project_id, **counters.get(project_id, {}))
+            for project_id in projects.values_list('pk', flat=True)
+        ], batch_size=500)
+        invalidate(SUMMARY_CACHE_LABEL)
+
+    return len(summaries)
+
+
+def find_inconsistencies() -> dict[int, dict[str, tuple[int, int]]]:
+    """Returns {project_id: {field: (stored, actual)}} for every drifted counter."""
+    from apps.projects.models import Project
+
+    actual = count_groups(Task.objects.all())
+    stored = {summary.project_id: summary.counters() for summary in ProjectTaskSummary.objects.all()}
+    inconsistencies = {}
+
+    for project_id in Project.objects.values_list('pk', flat=True):
+        expected = actual.get(project_id, Counter())
+
+        if project_id not in stored:
+            if expected:
+                inconsistencies[project_id] = {
+                    field: (0, amount) for field, amount in expected.items()
+                }
+            continue
+
+        drift = {
+            field: (value, expected.get(field, 0))
+            for field, value in stored[project_id].items()
+            if value != expected.get(field, 0)
+        }
+        if drift:
+            inconsistencies[project_id] = drift
+
+    return inconsistencies
+
+
+def task_contribution(values: dict, sign: int) -> dict[int, Counter]:
+    if values.get('deleted_at') is not None:
+        return {}
+
+    return {
+        values['project_id']: Counter({
+            field: sign for field in bucket_fields(values['status'], values['priority'])
+        })
+    }
+
+
+def merge_deltas(*deltas: dict[int, Counter]) -> dict[int, Counter]:
+    merged = defaultdict(Counter)
+
+    for delta in deltas:
+        for project_id, counter in delta.items():
+            merged[project_id].update(counter)
+
+    return merged
@@ -0,0 +1,99 @@
+from django.http import Http404
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from apps.core.async_views import AsyncAPIView, aget_object_or_404
+from apps.core.conditional import ConditionalRequestMixin, make_etag
+from apps.core.pagination import PaginationModeMixin
+from apps.tasks.models import Tag, Task
+from apps.tasks.serializers.tag_serializers import TagSerializer
+from apps.tasks.serializers.task_filter_serializers import TaskFilterSerializer
+from apps.tasks.serializers.task_serializers import AllTasksSerializer, TaskDetailSerializer
+from apps.tasks.views.task_views import TaskDetailAPIView
+
+
+class AsyncTasksListView(PaginationModeMixin, AsyncAPIView):
+    """Async ``TasksListAPIView``: same filters, pagination modes and responses."""
+    cursor_ordering = ('-deadline', '-id')
+    # exists + count + page
+    query_budget = {'GET': 3}
+
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        task_filter = TaskFilterSerializer(data=request.query_params)
+        task_filter.is_valid(raise_exception=True)
+
+        self.cursor_ordering = task_filter.get_ordering()
+        tasks = task_filter.filter_queryset(Task.objects.select_related('project', 'assignee'))
+
+        if not await tasks.aexists():
+            return Response(
+                data=[],
+                status=status.HTTP_204_NO_CONTENT
+            )
+
+        if self.paginator is not None:
+            page = await self.paginator.apaginate_queryset(tasks, request, view=self)
+            serializer = AllTasksSerializer(page, many=True)
+            return self.paginator.get_paginated_response(serializer.data)
+
+        serializer = AllTasksSerializer([task async for task in tasks], many=True)
+
+        return Response(
+            serializer.data,
+            status=status.HTTP_200_OK
+        )
+
+
+class AsyncTaskDetailView(ConditionalRequestMixin, AsyncAPIView):
+    """Async ``TaskDetailAPIView.get`` with the same validators."""
+    # validators, task with project + tags; a 304 costs only the validators
+    query_budget = {'GET': 3}
+
+    async def aget_validators(self):
+        versions = await Task.objects.filter(pk=self.kwargs['pk']).order_by().values_list(
+            'updated_at', 'project__updated_at'
+        ).afirst()
+
+        if versions is None:
+            raise Http404
+
+        self.updated_at = versions[0]
+        return make_etag(*versions), max(versions)
+
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        not_modified = await self.aevaluate_preconditions(request)
+
+        if not_modified is not None:
+            return not_modified
+
+        task = await aget_object_or_404(
+            Task.objects.select_related('project').prefetch_related('tags'),
+            pk=self.kwargs['pk']
+        )
+
+        serializer = TaskDetailSerializer(task)
+
+        return self.set_validators(Response(
+            serializer.data,
+            status=status.HTTP_200_OK
+        ), TaskDetailAPIView.task_validators(task))
+
+
+class AsyncTagListView(AsyncAPIView):
+    query_budget = {'GET': 2}
+
+    async def get(self, request: Request, *args, **kwargs) -> Response:
+        tags = Tag.objects.all()
+
+        if not await tags.aexists():
+            return Response(
+                data=[],
+                status=status.HTTP_204_NO_CONTENT
+            )
+
+        serializer = TagSerializer([tag async for tag in tags], many=True)
+
+        return Response(
+            serializer.data,
+            status=status.HTTP_200_OK,
+        )
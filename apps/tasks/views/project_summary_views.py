@@ -0,0 +1,50 @@
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.views import APIView
+from apps.projects.models import Project
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.models import ProjectTaskSummary, Task
+from apps.tasks.serializers.project_summary_serializers import ProjectTaskSummarySerializer
+from apps.tasks.utils.task_summary import rebuild_summaries
+
+
+class ProjectTaskSummaryAPIView(APIView):
+    # summary + overdue count
+    query_budget = {'GET': 2}
+
+    def get_object(self, pk: int) -> ProjectTaskSummary:
+        summary = ProjectTaskSummary.objects.filter(project_id=pk).first()
+
+        if summary is None:
+            # Projects created before the summary table existed
+            get_object_or_404(Project, pk=pk)
+            rebuild_summaries([pk])
+            summary = ProjectTaskSummary.objects.get(project_id=pk)
+
+        return summary
+
+    def get_overdue(self, pk: int) -> int:
+        # Depends on the current time, so it can't be maintained incrementally;
+        # served by the (project, status, deadline) index instead.
+        return Task.objects.filter(
+            project_id=pk,
+            deadline__lt=timezone.now(),
+        ).exclude(
+            status=Statuses.CLOSED
+        ).count()
+
+    def get(self, request: Request, pk: int) -> Response:
+        summary = self.get_object(pk=pk)
+
+        serializer = ProjectTaskSummarySerializer(
+            summary,
+            context={'overdue': self.get_overdue(pk=pk)}
+        )
+
+        return Response(
+            serializer.data,
+            status=status.HTTP_200_OK,
+        )
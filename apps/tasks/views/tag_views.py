@@ -3,14 +3,18 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
+from apps.core.response_cache import cache_response
 from apps.tasks.models import Tag
 from apps.tasks.serializers.tag_serializers import TagSerializer
 
 
 class TagListAPIView(APIView):
+    query_budget = {'GET': 2}
+
     def get_objects(self) -> Tag:
         return Tag.objects.all()
 
+    @cache_response('tasks.Tag')
     def get(self, request: Request) -> Response:
         tags = self.get_objects()
 
@@ -45,6 +49,8 @@ class TagListAPIView(APIView):
 
 
 class TagDetailAPIView(APIView):
+    query_budget = {'GET': 1}
+
     def get_object(self, pk: int) -> Tag:
         return get_object_or_404(Tag, pk=pk)
 
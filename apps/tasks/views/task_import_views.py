@@ -0,0 +1,47 @@
+from pathlib import Path
+from rest_framework.generics import get_object_or_404
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.views import APIView
+from apps.projects.models import ProjectFile
+from apps.projects.utils.file_readers import FILE_READERS, FileReadError
+from apps.tasks.utils.task_import import import_tasks
+
+
+class ProjectFileImportAPIView(APIView):
+    """
+    Creates tasks from a stored ``.csv``/``.xlsx`` project file.
+
+    Rows without a ``project`` column go to ``project`` from the request
+    body, or to the project of the file when it belongs to exactly one.
+    """
+
+    def post(self, request: Request, pk: int) -> Response:
+        project_file = get_object_or_404(ProjectFile.objects.prefetch_related('project'), pk=pk)
+
+        extension = Path(project_file.file_name).suffix.lower()
+
+        if extension not in FILE_READERS:
+            return Response(
+                data={"message": f"Only {list(FILE_READERS)} files can be imported."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        default_project = request.data.get('project')
+        projects = project_file.project.all()
+        if not default_project and len(projects) == 1:
+            default_project = projects[0].name
+
+        try:
+            report = import_tasks(project_file.file_path.path, default_project=default_project, extension=extension)
+        except FileReadError as e:
+            return Response(
+                data={"message": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            report,
+            status=status.HTTP_201_CREATED if report['created'] else status.HTTP_400_BAD_REQUEST
+        )
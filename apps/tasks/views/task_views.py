@@ -1,13 +1,20 @@
+from django.db import transaction
 from django.db.models import QuerySet
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from rest_framework.generics import ListCreateAPIView
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework import status
 from rest_framework.views import APIView
-from rest_framework.pagination import PageNumberPagination
+from apps.core.conditional import ConditionalRequestMixin, make_etag
+from apps.core.pagination import PaginationModeMixin
 from apps.tasks.models import Task
 from apps.tasks.serializers.task_serializers import *
+from apps.tasks.serializers.task_filter_serializers import TaskExportSerializer, TaskFilterSerializer
+from apps.tasks.utils.bulk_tasks import BULK_CREATE_MAX_ITEMS, bulk_create_tasks, bulk_transition_tasks
+from apps.tasks.utils.task_export import EXPORT_FORMATS, export_tasks
 
 
 class TaskViewListCreateGenericView(ListCreateAPIView):
@@ -15,27 +22,20 @@ class TaskViewListCreateGenericView(ListCreateAPIView):
     serializer_class = CreateUpdateTaskSerializer
 
 
-class StandardResultsSetPagination(PageNumberPagination):
-    page_size = 5
-    page_size_query_param = 'page_size'
-    max_page_size = 15
-
-
-class TasksListAPIView(APIView):
-    paginator = StandardResultsSetPagination
+class TasksListAPIView(PaginationModeMixin, APIView):
+    cursor_ordering = ('-deadline', '-id')
+    # exists + count + page
+    query_budget = {'GET': 3}
 
     def get_objects(self) -> QuerySet:
-        project_name = self.request.query_params.get('project_name')
-        assignee_email = self.request.query_params.get('assignee_email')
+        task_filter = TaskFilterSerializer(data=self.request.query_params)
+        task_filter.is_valid(raise_exception=True)
 
-        if project_name:
-            return Task.objects.filter(project__name=project_name)
+        self.cursor_ordering = task_filter.get_ordering()
 
-        elif assignee_email:
-            return Task.objects.filter(assignee__email=assignee_email)
-
-        else:
-            return Task.objects.all()
+        return task_filter.filter_queryset(
+            Task.objects.select_related('project', 'assignee')
+        )
 
     def get(self, request: Request, *args, **kwargs) -> Response:
         tasks = self.get_objects()
@@ -46,12 +46,11 @@ class TasksListAPIView(APIView):
                 status=status.HTTP_204_NO_CONTENT
             )
 
-        paginator = self.paginator()
-        page = paginator.paginate_queryset(tasks, request, view=self)
+        page = self.paginator.paginate_queryset(tasks, request, view=self)
 
         if page is not None:
             serializer = AllTasksSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
+            return self.paginator.get_paginated_response(serializer.data)
 
         serializer = AllTasksSerializer(tasks, many=True)
 
@@ -77,46 +76,145 @@ class TasksListAPIView(APIView):
         )
 
 
-class TaskDetailAPIView(APIView):
+class TaskExportAPIView(APIView):
+    # No query_budget: the rows are queried while the response is streamed,
+    # after QueryBudgetMiddleware has counted the request
+
+    def get(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+        task_filter = TaskExportSerializer(data=request.query_params)
+        task_filter.is_valid(raise_exception=True)
+
+        tasks = task_filter.filter_queryset(Task.objects.all())
+        output = task_filter.validated_data['output']
+
+        response = StreamingHttpResponse(
+            export_tasks(tasks, output),
+            content_type=EXPORT_FORMATS[output],
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="tasks-{timezone.now():%Y%m%d-%H%M%S}.{output}"'
+        )
+
+        return response
+
+
+class TaskBulkCreateAPIView(APIView):
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        items = request.data
+
+        if not isinstance(items, list) or not items:
+            return Response(
+                data={"message": "Expected a non-empty list of tasks."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(items) > BULK_CREATE_MAX_ITEMS:
+            return Response(
+                data={"message": f"A batch can contain at most {BULK_CREATE_MAX_ITEMS} tasks."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        created, errors = bulk_create_tasks(items)
+
+        return Response(
+            data={
+                "created": [{"index": index, "id": task.pk} for index, task in created],
+                "errors": errors,
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST
+        )
+
+
+class TaskBulkTransitionAPIView(APIView):
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        serializer = BulkTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        result = bulk_transition_tasks(
+            queryset=serializer.get_queryset(),
+            changes=serializer.get_changes(),
+        )
+
+        return Response(
+            data=result,
+            status=status.HTTP_200_OK
+        )
+
+
+class TaskDetailAPIView(ConditionalRequestMixin, APIView):
+    # validators, task with project + tags; a 304 costs only the validators
+    query_budget = {'GET': 3}
+
     def get_object(self):
-        return get_object_or_404(Task, pk=self.kwargs['pk'])
+        return get_object_or_404(
+            Task.objects.select_related('project').prefetch_related('tags'),
+            pk=self.kwargs['pk']
+        )
+
+    def get_validators(self):
+        # The detail shows the project name, so its updated_at is part of the version
+        versions = Task.objects.filter(pk=self.kwargs['pk']).order_by().values_list(
+            'updated_at', 'project__updated_at'
+        ).first()
+
+        if versions is None:
+            raise Http404
+
+        self.updated_at = versions[0]
+        return make_etag(*versions), max(versions)
+
+    @staticmethod
+    def task_validators(task: Task) -> tuple:
+        return make_etag(task.updated_at, task.project.updated_at), max(task.updated_at, task.project.updated_at)
 
     def get(self, request: Request, *args, **kwargs) -> Response:
+        not_modified = self.evaluate_preconditions(request)
+
+        if not_modified is not None:
+            return not_modified
+
         task = self.get_object()
 
         serializer = TaskDetailSerializer(task)
 
-        return Response(
+        return self.set_validators(Response(
             serializer.data,
             status=status.HTTP_200_OK
-        )
+        ), self.task_validators(task))
 
     def put(self, request: Request, *args, **kwargs) -> Response:
-        task = self.get_object()
+        with transaction.atomic():
+            precondition_failed = self.evaluate_preconditions(request)
 
-        serializer = CreateUpdateTaskSerializer(
-            instance=task,
-            data=request.data,
-            partial=True
-        )
+            if precondition_failed is not None:
+                return precondition_failed
 
-        if serializer.is_valid(raise_exception=True):
-            serializer.save()
+            if not self.claim_version(request, Task.objects.filter(pk=self.kwargs['pk'])):
+                return Response(
+                    data={"message": "The task has been modified concurrently."},
+                    status=status.HTTP_412_PRECONDITION_FAILED
+                )
 
-            return Response(
-                serializer.data,
-                status=status.HTTP_200_OK
+            task = self.get_object()
+
+            serializer = CreateUpdateTaskSerializer(
+                instance=task,
+                data=request.data,
+                partial=True
             )
 
-        return Response(
-            serializer.errors,
-            status=status.HTTP_400_BAD_REQUEST
-        )
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+
+        return self.set_validators(Response(
+            serializer.data,
+            status=status.HTTP_200_OK
+        ), self.task_validators(task))
 
     def delete(self, request: Request, *args, **kwargs) -> Response:
         task = self.get_object()
 
-        task.delete()
+        task.soft_delete()
 
         return Response(
             data={
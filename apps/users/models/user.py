@@ -64,5 +64,13 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     objects = UserManager()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets apps.users.receivers move the user between project counters
+        if 'project_id' in instance.__dict__:
+            instance._loaded_project_id = instance.project_id
+        return instance
+
     def __str__(self):
         return f"{self.last_name} {self.first_name}"
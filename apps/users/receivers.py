@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from apps.projects.utils.project_counters import adjust_counter
+from apps.users.models import User
+
+
+@receiver(pre_save, sender=User)
+def load_previous_project(sender, instance: User, raw: bool = False, **kwargs):
+    # Instances not loaded from the database (e.g. built with a pk) need a look first
+    if not raw and not instance._state.adding and not hasattr(instance, '_loaded_project_id'):
+        instance._loaded_project_id = (
+            User.objects.filter(pk=instance.pk).values_list('project_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=User)
+def update_users_count_on_save(sender, instance: User, created: bool, **kwargs):
+    old = None if created else getattr(instance, '_loaded_project_id', None)
+    new = instance.project_id
+
+    if old != new:
+        if old is not None:
+            adjust_counter('users_count', -1, pk=old)
+        if new is not None:
+            adjust_counter('users_count', +1, pk=new)
+
+    instance._loaded_project_id = new
+
+
+@receiver(post_delete, sender=User)
+def update_users_count_on_delete(sender, instance: User, **kwargs):
+    project_id = getattr(instance, '_loaded_project_id', instance.project_id)
+
+    if project_id is not None:
+        adjust_counter('users_count', -1, pk=project_id)
@@ -1,3 +1,31 @@
 from django.test import TestCase
+from apps.projects.models import Project
+from apps.users.models import User
 
-# Create your tests here.
+
+class UserListQueryCountTestCase(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Users Project',
+            description='Project used to pin the number of queries of the user list.'
+        )
+
+    def create_users(self, amount: int) -> None:
+        offset = User.objects.count()
+        for i in range(offset, offset + amount):
+            User.objects.create(
+                username=f'user_{i}',
+                first_name='list',
+                last_name='user',
+                email=f'user_{i}@example.com',
+                password='1q9i2w8u3e7y4r6t5',
+                project=self.project,
+            )
+
+    def test_user_list(self):
+        for amount in (1, 10):
+            self.create_users(amount)
+            # exists + users
+            with self.assertNumQueries(2):
+                response = self.client.get('/api/v1/users/', {'project_name': self.project.name})
+            self.assertEqual(len(response.data), User.objects.count())
@@ -3,6 +3,6 @@ from apps.users.views.user_views import *
 
 
 urlpatterns = [
-    path('', UserListGenericView.as_view()),
-    path('register/', RegisterUserGenericView.as_view()),
+    path('', UserListGenericView.as_view(), name='user-list'),
+    path('register/', RegisterUserGenericView.as_view(), name='user-register'),
 ]
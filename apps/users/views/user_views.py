@@ -2,12 +2,17 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.generics import ListAPIView, CreateAPIView
+from apps.core.pagination import PaginationModeMixin
+from apps.core.response_cache import cache_response
 from apps.users.models import User
 from apps.users.serializers.user_serializers import UserListSerializer, RegisterUserSerializer
 
 
-class UserListGenericView(ListAPIView):
+class UserListGenericView(PaginationModeMixin, ListAPIView):
     serializer_class = UserListSerializer
+    default_pagination_mode = None
+    cursor_ordering = ('id',)
+    query_budget = {'GET': 2}
 
     def get_queryset(self):
         project_name = self.request.query_params.get('project_name')
@@ -17,6 +22,7 @@ class UserListGenericView(ListAPIView):
 
         return User.objects.all()
 
+    @cache_response('users.User', 'projects.Project')
     def list(self, request: Request, *args, **kwargs) -> Response:
         projects = self.get_queryset()
 
@@ -26,6 +32,12 @@ class UserListGenericView(ListAPIView):
                 status=status.HTTP_204_NO_CONTENT
             )
 
+        page = self.paginate_queryset(projects)
+
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(projects, many=True)
 
         return Response(